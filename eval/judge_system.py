@@ -533,33 +533,51 @@ def _write_result_file(result_file: Path, result_data: dict[str, Any]) -> None:
 		f.write(json.dumps(result_data, indent=2, default=str))
 
 
+def judge_result_from_evaluation(task_id: str, comp_eval: dict[str, Any]) -> dict[str, Any]:
+	"""Task judgement in the shape the eval pipeline reports, built from a comprehensive judge evaluation"""
+	return {
+		'task_id': task_id,
+		'judgement': comp_eval.get('reasoning', 'Comprehensive evaluation completed'),
+		'success': comp_eval.get('passed', False),
+		'error': None,
+		'score': comp_eval.get('final_score', 0) / 100.0,  # Convert to 0-1 scale
+		'comprehensive_evaluation': comp_eval,
+	}
+
+
+def _failed_judge_result(task_id: str, error: str) -> dict[str, Any]:
+	return {
+		'task_id': task_id,
+		'judgement': f'Comprehensive evaluation failed: {error}',
+		'success': False,
+		'error': error,
+		'score': 0.0,
+	}
+
+
 # Integration helper function
-async def evaluate_task_with_comprehensive_judge(task_folder: Path, model: BaseChatModel, max_images: int = 10) -> dict[str, Any]:
+async def evaluate_task_with_comprehensive_judge(
+	task_folder: Path, model: BaseChatModel, max_images: int = 10, result_data: dict[str, Any] | None = None
+) -> dict[str, Any]:
 	"""
 	Evaluate a task result using the comprehensive judge system.
 
-	Returns a dictionary with both the old format for compatibility
-	and the new comprehensive analysis.
+	Returns the task judgement (see judge_result_from_evaluation) with the full comprehensive analysis
+	under 'comprehensive_evaluation'. Callers that already loaded result.json can pass it as result_data
+	to skip reading it again.
 	"""
 	result_file = task_folder / 'result.json'
-	if not result_file.exists():
-		return {
-			'task_id': task_folder.name,
-			'comprehensive_judge': None,
-			'error': 'No result.json found',
-		}
+	if result_data is None and not result_file.exists():
+		return _failed_judge_result(task_folder.name, 'No result.json found')
 
 	try:
 		# Load existing result using async wrapper
-		result_data = await asyncio.to_thread(_read_result_file, result_file)
+		if result_data is None:
+			result_data = await asyncio.to_thread(_read_result_file, result_file)
 
 		# Check if comprehensive judge result already exists
 		if result_data.get('comprehensive_judge_evaluation'):
-			return {
-				'task_id': task_folder.name,
-				'comprehensive_judge': result_data['comprehensive_judge_evaluation'],
-				'error': None,
-			}
+			return judge_result_from_evaluation(task_folder.name, result_data['comprehensive_judge_evaluation'])
 
 		# Extract data for evaluation
 		task = result_data.get('task', 'Unknown task')
@@ -586,16 +604,8 @@ async def evaluate_task_with_comprehensive_judge(task_folder: Path, model: BaseC
 		result_data['comprehensive_judge_evaluation'] = judge_dict
 		await asyncio.to_thread(_write_result_file, result_file, result_data)
 
-		return {
-			'task_id': task_folder.name,
-			'comprehensive_judge': judge_dict,
-			'error': None,
-		}
+		return judge_result_from_evaluation(task_folder.name, judge_dict)
 
 	except Exception as e:
 		logger.error(f'Comprehensive judge evaluation failed for {task_folder.name}: {e}')
-		return {
-			'task_id': task_folder.name,
-			'comprehensive_judge': None,
-			'error': str(e),
-		}
+		return _failed_judge_result(task_folder.name, str(e))
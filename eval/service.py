@@ -40,43 +40,80 @@
 # }
 # ==============================================================================================================
 import asyncio
+import atexit
 import base64
+import concurrent.futures
+import copy
+import functools
 import gc
+import importlib.util
 import io
+import itertools
 import json
 import logging
+import math
 import os
+import queue
+import random
 import re
 import signal
 import sys
-import threading
 import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from collections.abc import Awaitable
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import Any, TypeVar
 from uuid import UUID
 
 import anyio
+import httpx
+import orjson
 import psutil
 import requests
 from dotenv import load_dotenv
 from lmnr import AsyncLaminarClient, Laminar, observe
 from PIL import Image
 from pydantic import BaseModel
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from browser_use.llm.anthropic.chat import ChatAnthropic
 from browser_use.llm.base import BaseChatModel
-from browser_use.llm.google.chat import ChatGoogle
-from browser_use.llm.groq.chat import ChatGroq
+from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
 from browser_use.llm.openai.chat import ChatOpenAI
 from eval.utils import create_pydantic_model_from_schema
 
 MAX_IMAGE = 5
 
+# First 1-5 digit after 'Score' in a judge_image response
+_SCORE_RE = re.compile(r'[1-5]')
+
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(name)s: %(message)s')
 logger = logging.getLogger(__name__)
 
-# Load dotenv
-load_dotenv()
+
+def _setup_queue_logging() -> QueueListener | None:
+	"""Move the root handlers behind a QueueHandler so log I/O happens on a listener thread instead of the event loop"""
+	root = logging.getLogger()
+	handlers = [handler for handler in root.handlers if not isinstance(handler, QueueHandler)]
+	if not handlers:
+		return None
+	log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+	for handler in handlers:
+		root.removeHandler(handler)
+	root.addHandler(QueueHandler(log_queue))
+	listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+	listener.start()
+	atexit.register(listener.stop)
+	return listener
+
+
+# Load dotenv (SKIP_DOTENV skips the .env read when the environment is already provided, e.g. in containers)
+if not os.getenv('SKIP_DOTENV'):
+	load_dotenv()
 
 # Check for Anchor Browser API key
 ANCHOR_BROWSER_API_KEY = os.getenv('ANCHOR_BROWSER_API_KEY')
@@ -93,7 +130,31 @@ else:
 	logger.warning('BRIGHTDATA_CDP_URL is not set. Brightdata browser will not be available.')
 
 
-def create_anchor_browser_session(headless: bool = False) -> str:
+# Shared HTTP client for Anchor Browser API calls so concurrent session creations reuse pooled connections
+# HTTP/2 is only enabled when the optional h2 package is installed
+_HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+_ANCHOR_CLIENT = httpx.AsyncClient(
+	http2=_HTTP2_AVAILABLE,
+	limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+	timeout=30.0,
+)
+
+
+# Shared session for the blocking Convex calls, so repeated fetches and saves reuse pooled connections.
+# Retry only covers what urllib3 retries for POST by default (connection failures), so no request is applied twice.
+_SESSION = requests.Session()
+_SESSION_ADAPTER = HTTPAdapter(
+	pool_connections=8,
+	pool_maxsize=64,
+	max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+)
+_SESSION.mount('https://', _SESSION_ADAPTER)
+_SESSION.mount('http://', _SESSION_ADAPTER)
+# (connect, read) timeout so a stuck backend can't hang a task indefinitely
+_SESSION_TIMEOUT = (5, 30)
+
+
+async def create_anchor_browser_session(headless: bool = False) -> str:
 	"""Create an Anchor Browser session and return CDP URL"""
 	browser_configuration = {
 		'session': {'proxy': {'type': 'anchor_mobile', 'active': True, 'country_code': 'us'}},
@@ -106,10 +167,10 @@ def create_anchor_browser_session(headless: bool = False) -> str:
 	}
 
 	try:
-		response = requests.post(
+		response = await _ANCHOR_CLIENT.post(
 			'https://api.anchorbrowser.io/v1/sessions',
 			headers={
-				'anchor-api-key': ANCHOR_BROWSER_API_KEY,
+				'anchor-api-key': ANCHOR_BROWSER_API_KEY or '',
 				'Content-Type': 'application/json',
 			},
 			json=browser_configuration,
@@ -121,7 +182,7 @@ def create_anchor_browser_session(headless: bool = False) -> str:
 		# Return only the CDP URL
 		return f'wss://connect.anchorbrowser.io?apiKey={ANCHOR_BROWSER_API_KEY}&sessionId={session_id}'
 
-	except requests.RequestException as e:
+	except httpx.HTTPError as e:
 		logger.error(f'Failed to create Anchor Browser session: {type(e).__name__}: {e}')
 		raise
 	except KeyError as e:
@@ -129,6 +190,11 @@ def create_anchor_browser_session(headless: bool = False) -> str:
 		raise
 
 
+async def close_http_clients():
+	"""Close the shared HTTP clients (call once at the end of the event loop that used them)"""
+	await asyncio.gather(_ANCHOR_CLIENT.aclose(), _SERPER_CLIENT.aclose(), _CONVEX_CLIENT.aclose())
+
+
 Laminar.initialize()
 laminar_client = AsyncLaminarClient()
 
@@ -136,21 +202,73 @@ laminar_client = AsyncLaminarClient()
 _resource_monitor_task = None
 _resource_monitor_stop_event = None
 _graceful_shutdown_initiated = False
+_force_exit_handle: asyncio.TimerHandle | None = None
+
+# Global tracking for login cookie monitoring; bounded LRU so tasks that never save their tracking can't grow it forever
+_login_cookie_tracker: OrderedDict[str, dict] = OrderedDict()
+_MAX_TRACKER = 256
+
 
-# Global tracking for login cookie monitoring
-_login_cookie_tracker = {}
+def _track(task_id: str, tracking: dict) -> None:
+	"""Record login cookie tracking for a task, evicting the least recently tracked task past _MAX_TRACKER"""
+	_login_cookie_tracker[task_id] = tracking
+	_login_cookie_tracker.move_to_end(task_id)
+	if len(_login_cookie_tracker) > _MAX_TRACKER:
+		_login_cookie_tracker.popitem(last=False)
+
+
+# PID -> (process, name, kind) cache kept across monitor ticks so each tick only touches new/exited PIDs.
+# kind is 'chrome', 'python' or None for processes we don't report on.
+_PROC_CACHE: dict[int, tuple[psutil.Process, str, str | None]] = {}
+
+
+def _refresh_process_cache(current_pids: set[int]) -> None:
+	"""Add newly started processes to _PROC_CACHE and drop the ones that exited"""
+	for pid in _PROC_CACHE.keys() - current_pids:
+		del _PROC_CACHE[pid]
+	for pid in current_pids - _PROC_CACHE.keys():
+		try:
+			proc = psutil.Process(pid)
+			name = proc.name()
+			lowered = name.lower()
+			if 'chrome' in lowered or 'chromium' in lowered:
+				kind = 'chrome'
+			elif 'python' in lowered:
+				kind = 'python'
+			else:
+				kind = None
+			if kind is not None:
+				# Prime the per-process CPU counter so the next tick reads a real delta instead of 0.0
+				proc.cpu_percent(interval=None)
+		except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+			continue
+		_PROC_CACHE[pid] = (proc, name, kind)
+
+
+# Prime the system-wide CPU counter; cpu_percent(interval=None) reports the delta since the previous call
+psutil.cpu_percent(interval=None)
+
+
+# Snapshots younger than this are shared, so the heartbeat, the monitor and many tasks starting at once don't
+# each walk the process table
+_RESOURCES_TTL = 5.0
+_resources_snapshot: tuple[float, dict] | None = None  # (time.monotonic() taken, resources)
 
 
 def get_system_resources():
-	"""Get current system resource usage"""
+	"""Get current system resource usage (a snapshot up to _RESOURCES_TTL seconds old; don't mutate it)"""
+	global _resources_snapshot
+	now = time.monotonic()
+	if _resources_snapshot is not None and now - _resources_snapshot[0] < _RESOURCES_TTL:
+		return _resources_snapshot[1]
 	try:
 		# Memory usage
 		memory = psutil.virtual_memory()
 		memory_percent = memory.percent
 		memory_available_gb = memory.available / (1024**3)
 
-		# CPU usage
-		cpu_percent = psutil.cpu_percent(interval=1)
+		# CPU usage since the previous call (non-blocking)
+		cpu_percent = psutil.cpu_percent(interval=None)
 
 		# Load average (Unix only)
 		try:
@@ -160,22 +278,33 @@ def get_system_resources():
 			load_1min = 0.0
 
 		# Process count
-		process_count = len(psutil.pids())
+		current_pids = set(psutil.pids())
+		process_count = len(current_pids)
+		_refresh_process_cache(current_pids)
 
 		# Chrome/Browser processes
 		chrome_processes = []
 		python_processes = []
-		for proc in psutil.process_iter(['pid', 'name', 'memory_percent', 'cpu_percent']):
+		for pid, (proc, name, kind) in list(_PROC_CACHE.items()):
+			if kind is None:
+				continue
 			try:
-				name = proc.info['name'].lower()
-				if 'chrome' in name or 'chromium' in name:
-					chrome_processes.append(proc.info)
-				elif 'python' in name:
-					python_processes.append(proc.info)
-			except (psutil.NoSuchProcess, psutil.AccessDenied):
+				with proc.oneshot():
+					info = {
+						'pid': pid,
+						'name': name,
+						'memory_percent': proc.memory_percent(),
+						'cpu_percent': proc.cpu_percent(interval=None),
+					}
+			except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+				_PROC_CACHE.pop(pid, None)
 				continue
+			if kind == 'chrome':
+				chrome_processes.append(info)
+			else:
+				python_processes.append(info)
 
-		return {
+		resources = {
 			'memory_percent': memory_percent,
 			'memory_available_gb': memory_available_gb,
 			'cpu_percent': cpu_percent,
@@ -186,6 +315,8 @@ def get_system_resources():
 			'chrome_processes': chrome_processes[:5],  # Top 5 chrome processes
 			'python_processes': python_processes[:5],  # Top 5 python processes
 		}
+		_resources_snapshot = (now, resources)
+		return resources
 	except Exception as e:
 		logger.warning(f'Failed to get system resources: {type(e).__name__}: {e}')
 		return {
@@ -203,6 +334,9 @@ def get_system_resources():
 
 def log_system_resources(context: str = ''):
 	"""Log current system resource usage"""
+	# Skip the process scan and message formatting entirely when INFO is muted
+	if not logger.isEnabledFor(logging.INFO):
+		return
 	resources = get_system_resources()
 	logger.info(f'=== SYSTEM RESOURCES {context} ===')
 	logger.info(f'Memory: {resources["memory_percent"]:.1f}% used, {resources["memory_available_gb"]:.2f}GB available')
@@ -221,6 +355,30 @@ def log_system_resources(context: str = ''):
 	logger.info('=' * (20 + len(context)))
 
 
+# Collect gen0 less often than the default (700) so short-lived PIL/JSON allocations don't trigger constant collections;
+# applied by run_multiple_tasks for the duration of a batch, so importing the module leaves the GC policy alone
+_GC_THRESHOLD = (50_000, 10, 10)
+
+# Seconds without a gen2 collection after which the monitor may force one under critical memory pressure
+_FULL_GC_INTERVAL = 300.0
+_last_full_gc = (time.monotonic(), gc.get_stats()[-1]['collections'])
+
+
+def _full_gc_overdue() -> bool:
+	"""True when the number of full (gen2) collections hasn't advanced in the last _FULL_GC_INTERVAL seconds"""
+	global _last_full_gc
+	now = time.monotonic()
+	collections = gc.get_stats()[-1]['collections']
+	last_time, last_collections = _last_full_gc
+	if collections != last_collections:
+		_last_full_gc = (now, collections)
+		return False
+	if now - last_time < _FULL_GC_INTERVAL:
+		return False
+	_last_full_gc = (now, collections + 1)
+	return True
+
+
 async def start_resource_monitoring(interval: int = 30):
 	"""Start background resource monitoring"""
 	global _resource_monitor_task, _resource_monitor_stop_event
@@ -248,10 +406,14 @@ async def start_resource_monitoring(interval: int = 30):
 					if resources['chrome_process_count'] > 20:
 						logger.warning(f'⚠️ HIGH CHROME PROCESS COUNT: {resources["chrome_process_count"]}')
 
-					# Force garbage collection periodically
+					# Young-generation collection under memory pressure; only escalate to a full
+					# collection when memory is critical and no full collection ran recently
 					if resources['memory_percent'] > 70:
 						logger.info('Running garbage collection due to high memory usage')
-						gc.collect()
+						gc.collect(0)
+						if resources['memory_percent'] > 90 and _full_gc_overdue():
+							logger.info('Running full garbage collection due to critical memory usage')
+							gc.collect(2)
 
 				except Exception as e:
 					logger.error(f'Error in resource monitoring: {type(e).__name__}: {e}')
@@ -294,9 +456,32 @@ async def stop_resource_monitoring():
 		_resource_monitor_stop_event = None
 
 
+def _force_exit():
+	logger.critical('🔥 FORCE EXIT: Graceful shutdown timeout, terminating')
+	os._exit(1)
+
+
+def _disarm_force_exit():
+	"""Cancel the force-exit watchdog armed by a shutdown signal, once the pipeline has finished its own cleanup"""
+	global _force_exit_handle
+	if _force_exit_handle is not None:
+		_force_exit_handle.cancel()
+		_force_exit_handle = None
+
+
+def _begin_graceful_shutdown(loop: asyncio.AbstractEventLoop, timeout: float = 10.0):
+	global _force_exit_handle
+	_force_exit_handle = loop.call_later(timeout, _force_exit)
+	try:
+		loop.create_task(stop_resource_monitoring())
+	except Exception as e:
+		logger.error(f'Failed to stop resource monitoring during shutdown: {e}')
+
+
 def setup_signal_handlers():
-	"""Setup signal handlers for graceful shutdown"""
+	"""Setup signal handlers for graceful shutdown (must be called from the eval event loop)"""
 	global _graceful_shutdown_initiated
+	loop = asyncio.get_running_loop()
 
 	def signal_handler(signum, frame):
 		global _graceful_shutdown_initiated
@@ -308,39 +493,375 @@ def setup_signal_handlers():
 		logger.warning(f'⚠️ GRACEFUL SHUTDOWN: Received signal {signum}, initiating graceful shutdown...')
 		log_system_resources('SHUTDOWN')
 
-		# Try to stop resource monitoring
-		try:
-			loop = asyncio.get_event_loop()
-			if loop.is_running():
-				loop.create_task(stop_resource_monitoring())
-		except Exception as e:
-			logger.error(f'Failed to stop resource monitoring during shutdown: {e}')
-
-		# Give some time for cleanup, then force exit
-		def force_exit():
-			time.sleep(10)
-			if _graceful_shutdown_initiated:
-				logger.critical('🔥 FORCE EXIT: Graceful shutdown timeout, terminating')
-				sys.exit(1)
-
-		threading.Thread(target=force_exit, daemon=True).start()
+		# Stop resource monitoring on the eval loop and arm a force-exit watchdog there;
+		# run_evaluation_pipeline disarms it once its cleanup has completed
+		if not loop.is_closed():
+			loop.call_soon_threadsafe(_begin_graceful_shutdown, loop)
 
 	# Register signal handlers
 	signal.signal(signal.SIGINT, signal_handler)
 	signal.signal(signal.SIGTERM, signal_handler)
 
 
+def _json_dumps(obj) -> str:
+	"""orjson-backed json.dumps for payloads that end up as str"""
+	return orjson.dumps(obj).decode('utf-8')
+
+
+def _json_loads(data: str | bytes):
+	"""orjson-backed json.loads; orjson.JSONDecodeError is a ValueError subclass like json's"""
+	return orjson.loads(data)
+
+
+# Screenshots are downscaled to this long edge before encoding; fewer upload bytes and image tokens per judge call
+EVAL_IMG_MAX_DIM = int(os.getenv('EVAL_IMG_MAX_DIM', '1280'))
+EVAL_IMG_JPEG_QUALITY = 70
+
+
 def encode_image(image):
-	"""Convert a PIL image to base64 string."""
-	if image.mode == 'RGBA':
+	"""Convert a PIL image (or an image file path) to a base64 JPEG string."""
+	if isinstance(image, (str, Path)):
+		return _encode_image_path(image)
+	if image.mode not in ('RGB', 'L'):
 		image = image.convert('RGB')
+	if max(image.size) > EVAL_IMG_MAX_DIM:
+		image = image.copy()
+		image.thumbnail((EVAL_IMG_MAX_DIM, EVAL_IMG_MAX_DIM), Image.Resampling.LANCZOS)
 	buffered = io.BytesIO()
-	image.save(buffered, format='JPEG')
+	image.save(buffered, format='JPEG', quality=EVAL_IMG_JPEG_QUALITY, optimize=True, progressive=True)
 	return base64.b64encode(buffered.getvalue()).decode('utf-8')
 
 
-async def identify_key_points(task, model):
-	system_msg = """You are an expert tasked with analyzing a given task to identify the key points explicitly stated in the task description.
+@functools.lru_cache(maxsize=128)
+def _encode_image_file(image_path: str, mtime_ns: int) -> str:
+	"""Encode a screenshot file to base64 JPEG; cached on (path, mtime) so re-encodes of the same file are free"""
+	with Image.open(image_path) as image:
+		# JPEG files that are already small enough are sent as-is instead of paying a decode + re-encode
+		# (Image.open only parses the header, so the format and size checks are cheap; the suffix may lie)
+		if image.format == 'JPEG' and max(image.size) <= EVAL_IMG_MAX_DIM:
+			with open(image_path, 'rb') as f:
+				return base64.b64encode(f.read()).decode('utf-8')
+		# Let libjpeg decode large JPEGs straight at 1/2, 1/4 or 1/8 scale (no-op for other formats)
+		scale = EVAL_IMG_MAX_DIM / max(image.size)
+		if scale < 1:
+			image.draft('RGB', (int(image.width * scale) + 1, int(image.height * scale) + 1))
+		return encode_image(image)
+
+
+def _encode_image_path(image_path) -> str:
+	image_path = str(image_path)
+	return _encode_image_file(image_path, os.stat(image_path).st_mtime_ns)
+
+
+# Bounds how many screenshots are decoded at once, so peak RSS scales with CPU count instead of image count
+_IMG_LIMITER = anyio.CapacityLimiter(os.cpu_count() or 4)
+
+
+async def encode_image_async(image_path) -> str:
+	"""Encode a screenshot in a worker thread so encodes of different images run in parallel off the event loop"""
+	return await anyio.to_thread.run_sync(_encode_image_path, image_path, limiter=_IMG_LIMITER)
+
+
+class RateLimiter:
+	"""
+	Proactive limiter for judge model calls.
+
+	Combines an RPM/TPM sliding window with an AIMD (additive-increase / multiplicative-decrease)
+	concurrency window: the window halves on provider rate limits and grows additively while the
+	mean latency of recent calls stays under the target. A limit of 0 disables that dimension.
+	"""
+
+	def __init__(
+		self,
+		rpm: int = 0,
+		tpm: int = 0,
+		max_concurrency: int = 16,
+		target_latency: float = 30.0,
+		alpha: float = 0.5,
+		beta: float = 0.5,
+		window: float = 60.0,
+	):
+		assert max_concurrency >= 1, 'max_concurrency must be at least 1'
+		self.rpm = rpm
+		self.tpm = tpm
+		self.max_concurrency = max_concurrency
+		self.target_latency = target_latency
+		self.alpha = alpha
+		self.beta = beta
+		self.window = window
+
+		self._limit = float(max_concurrency)
+		self._in_flight = 0
+		self._waiters: deque[asyncio.Future] = deque()
+		self._request_times: deque[float] = deque()
+		self._token_usage: deque[tuple[float, int]] = deque()
+		self._tokens_in_window = 0
+		self._latencies: deque[float] = deque(maxlen=20)
+
+	@property
+	def concurrency_limit(self) -> int:
+		return max(1, int(self._limit))
+
+	def _prune(self, now: float) -> None:
+		cutoff = now - self.window
+		while self._request_times and self._request_times[0] <= cutoff:
+			self._request_times.popleft()
+		while self._token_usage and self._token_usage[0][0] <= cutoff:
+			self._tokens_in_window -= self._token_usage.popleft()[1]
+
+	def _window_delay(self, now: float, tokens_estimate: int) -> float:
+		delay = 0.0
+		if self.rpm and len(self._request_times) >= self.rpm:
+			delay = max(delay, self._request_times[0] + self.window - now)
+		if self.tpm and self._token_usage and self._tokens_in_window + tokens_estimate > self.tpm:
+			delay = max(delay, self._token_usage[0][0] + self.window - now)
+		return delay
+
+	def _wake_waiters(self) -> None:
+		free_slots = self.concurrency_limit - self._in_flight
+		for waiter in self._waiters:
+			if free_slots <= 0:
+				break
+			if not waiter.done():
+				waiter.set_result(None)
+				free_slots -= 1
+
+	async def acquire(self, tokens_estimate: int = 0) -> None:
+		"""Wait for a concurrency slot and for room in the RPM/TPM window"""
+		while self._in_flight >= self.concurrency_limit:
+			waiter = asyncio.get_running_loop().create_future()
+			self._waiters.append(waiter)
+			try:
+				await waiter
+			except asyncio.CancelledError:
+				# Woken but cancelled before resuming: pass the wakeup on, or the free slot stays unclaimed
+				if waiter.done() and not waiter.cancelled():
+					self._wake_waiters()
+				raise
+			finally:
+				self._waiters.remove(waiter)
+		self._in_flight += 1
+
+		try:
+			while True:
+				now = time.monotonic()
+				self._prune(now)
+				delay = self._window_delay(now, tokens_estimate)
+				if delay <= 0:
+					break
+				await asyncio.sleep(delay)
+		except BaseException:
+			self._in_flight -= 1
+			self._wake_waiters()
+			raise
+
+		self._request_times.append(now)
+		self._token_usage.append((now, tokens_estimate))
+		self._tokens_in_window += tokens_estimate
+
+	def release(self, latency: float | None = None, rate_limited: bool = False) -> None:
+		"""Free the slot taken by acquire() and adapt the concurrency window"""
+		self._in_flight -= 1
+		if rate_limited:
+			self._limit = max(1.0, self._limit * self.beta)
+		elif latency is not None:
+			self._latencies.append(latency)
+			if sum(self._latencies) / len(self._latencies) <= self.target_latency:
+				self._limit = min(float(self.max_concurrency), self._limit + self.alpha)
+		self._wake_waiters()
+
+
+_JUDGE_RATE_LIMITER = RateLimiter(
+	rpm=int(os.getenv('EVAL_JUDGE_RPM', '0')),
+	tpm=int(os.getenv('EVAL_JUDGE_TPM', '0')),
+	max_concurrency=int(os.getenv('EVAL_JUDGE_MAX_CONCURRENCY', '16')),
+	target_latency=float(os.getenv('EVAL_JUDGE_TARGET_LATENCY', '30')),
+)
+
+# Rough per-image token cost of a high detail image, used only for TPM budgeting
+_IMAGE_TOKEN_ESTIMATE = 1000
+
+
+def _estimate_tokens(messages) -> int:
+	"""Cheap token estimate (~4 chars per token) of an OpenAI-style message list"""
+	chars = 0
+	images = 0
+	for message in messages:
+		content = message.get('content') if isinstance(message, dict) else getattr(message, 'content', None)
+		if isinstance(content, str):
+			chars += len(content)
+		elif isinstance(content, list):
+			for part in content:
+				if isinstance(part, dict) and part.get('type') == 'image_url':
+					images += 1
+				elif isinstance(part, dict):
+					chars += len(part.get('text', ''))
+	return chars // 4 + images * _IMAGE_TOKEN_ESTIMATE
+
+
+def _error_status_code(error: Exception) -> int | None:
+	"""HTTP status carried by a provider/HTTP error, if any"""
+	if isinstance(error, ModelProviderError) and len(error.args) > 1 and isinstance(error.args[1], int):
+		return error.args[1]
+	status_code = getattr(error, 'status_code', None) or getattr(getattr(error, 'response', None), 'status_code', None)
+	return status_code if isinstance(status_code, int) else None
+
+
+def _is_rate_limit_error(error: Exception) -> bool:
+	return isinstance(error, ModelRateLimitError) or _error_status_code(error) == 429
+
+
+_RETRYABLE_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504})
+
+
+def _is_retryable_error(error: Exception) -> bool:
+	"""Transport errors, timeouts and retryable HTTP statuses are retried; other 4xx (auth, validation) are permanent"""
+	if isinstance(error, (httpx.TransportError, TimeoutError)):
+		return True
+	status_code = _error_status_code(error)
+	# Errors without a status (e.g. an unparseable model answer) may succeed on another attempt
+	return status_code is None or status_code in _RETRYABLE_STATUS_CODES
+
+
+def _retry_after_seconds(error: Exception) -> float | None:
+	headers = getattr(getattr(error, 'response', None), 'headers', None)
+	if headers is None:
+		return None
+	try:
+		return float(headers.get('retry-after'))
+	except (TypeError, ValueError):
+		return None
+
+
+def _retry_delay(error: Exception, attempt: int, base: float = 1.0, cap: float = 30.0) -> float:
+	"""Full-jitter exponential backoff, never shorter than the provider's retry-after"""
+	delay = random.uniform(0, min(cap, base * 2**attempt))
+	retry_after = _retry_after_seconds(error)
+	if retry_after is not None:
+		delay = max(delay, min(retry_after, cap))
+	return delay
+
+
+async def _guarded_invoke(model, messages, **kwargs):
+	"""Invoke the judge model through the shared rate limiter"""
+	await _JUDGE_RATE_LIMITER.acquire(_estimate_tokens(messages))
+	start_time = time.monotonic()
+	latency = None
+	rate_limited = False
+	try:
+		response = await model.ainvoke(messages, **kwargs)
+		latency = time.monotonic() - start_time
+		return response
+	except Exception as e:
+		rate_limited = _is_rate_limit_error(e)
+		raise
+	finally:
+		_JUDGE_RATE_LIMITER.release(latency, rate_limited)
+
+
+def _cancel_if_abandoned(dispatch: asyncio.Task, future: asyncio.Future) -> None:
+	if future.cancelled():
+		dispatch.cancel()
+
+
+class MicroBatcher(ABC):
+	"""
+	Coalesces calls submitted by concurrently running tasks into batches.
+
+	Submissions are collected for up to max_wait seconds (or until max_batch are queued) and each batch is then
+	dispatched together; subclasses implement _dispatch for a single item and may send a whole batch at once by
+	overriding _dispatch_batch. A caller that gives up (timeout / cancellation) cancels its in-flight dispatch.
+	"""
+
+	def __init__(self, max_batch: int = 64, max_wait: float = 0.05):
+		assert max_batch >= 1, 'max_batch must be at least 1'
+		self.max_batch = max_batch
+		self.max_wait = max_wait
+		self._queue: asyncio.Queue[tuple[tuple, asyncio.Future]] | None = None
+		self._worker: asyncio.Task | None = None
+		self._in_flight: set[asyncio.Task] = set()
+
+	def _ensure_worker(self) -> asyncio.Queue:
+		# The queue and worker belong to the running loop, so create them lazily on first use
+		if self._worker is None or self._worker.done():
+			self._queue = asyncio.Queue()
+			self._worker = asyncio.create_task(self._drain(self._queue), name=type(self).__name__)
+		assert self._queue is not None
+		return self._queue
+
+	async def _submit(self, *args):
+		future = asyncio.get_running_loop().create_future()
+		self._ensure_worker().put_nowait((args, future))
+		return await future
+
+	@abstractmethod
+	async def _dispatch(self, *args):
+		"""Send a single submitted item and return the caller's result"""
+
+	async def _drain(self, queue: asyncio.Queue) -> None:
+		loop = asyncio.get_running_loop()
+		while True:
+			batch = [await queue.get()]
+			deadline = loop.time() + self.max_wait
+			while len(batch) < self.max_batch:
+				remaining = deadline - loop.time()
+				if remaining <= 0:
+					break
+				try:
+					batch.append(await asyncio.wait_for(queue.get(), remaining))
+				except TimeoutError:
+					break
+			self._dispatch_batch(batch)
+
+	def _dispatch_batch(self, batch: list[tuple[tuple, asyncio.Future]]) -> None:
+		"""Start dispatching a batch; by default every item is dispatched on its own"""
+		for args, future in batch:
+			if future.done():  # caller gave up (timeout / cancellation) while queued
+				continue
+			dispatch = self._spawn(self._run(args, future))
+			future.add_done_callback(functools.partial(_cancel_if_abandoned, dispatch))
+
+	def _spawn(self, coro) -> asyncio.Task:
+		dispatch = asyncio.create_task(coro)
+		self._in_flight.add(dispatch)
+		dispatch.add_done_callback(self._in_flight.discard)
+		return dispatch
+
+	async def _run(self, args: tuple, future: asyncio.Future) -> None:
+		try:
+			result = await self._dispatch(*args)
+		except Exception as e:
+			if not future.done():
+				future.set_exception(e)
+		else:
+			if not future.done():
+				future.set_result(result)
+
+	async def close(self) -> None:
+		"""Stop the batching worker; calls still in flight are cancelled"""
+		tasks = [task for task in (self._worker, *self._in_flight) if task is not None]
+		for task in tasks:
+			task.cancel()
+		await asyncio.gather(*tasks, return_exceptions=True)
+		self._worker = None
+
+
+class _GuardedJudgeModel:
+	"""Judge model wrapper whose ainvoke goes through the shared rate limiter (used for the comprehensive judge)"""
+
+	__slots__ = ('_model',)
+
+	def __init__(self, model):
+		self._model = model
+
+	async def ainvoke(self, messages, **kwargs):
+		return await _guarded_invoke(self._model, messages, **kwargs)
+
+	def __getattr__(self, name: str):
+		return getattr(self._model, name)
+
+
+_IDENTIFY_SYS = """You are an expert tasked with analyzing a given task to identify the key points explicitly stated in the task description.
 
 **Objective**: Carefully analyze the task description and extract the critical elements explicitly mentioned in the task for achieving its goal.
 
@@ -353,21 +874,23 @@ async def identify_key_points(task, model):
 
 **Respond with**:
 - **Key Points**: A numbered list of the explicit key points for completing this task, one per line, without explanations or additional details."""
-	prompt = """Task: {task}"""
-	text = prompt.format(task=task)
+_IDENTIFY_PROMPT = 'Task: {task}'
+
+
+async def identify_key_points(task, model):
+	text = _IDENTIFY_PROMPT.format(task=task)
 	messages = [
-		{'role': 'system', 'content': system_msg},
+		{'role': 'system', 'content': _IDENTIFY_SYS},
 		{
 			'role': 'user',
 			'content': [{'type': 'text', 'text': text}],
 		},
 	]
-	response = await model.ainvoke(messages)
+	response = await _guarded_invoke(model, messages)
 	return response.completion
 
 
-async def judge_image(task, image_path, key_points, model):
-	system_msg = """You are an expert evaluator tasked with determining whether an image contains information about the necessary steps to complete a task.
+_JUDGE_SYS = """You are an expert evaluator tasked with determining whether an image contains information about the necessary steps to complete a task.
 
 **Objective**: Analyze the provided image and decide if it shows essential steps or evidence required for completing the task. Use your reasoning to explain your decision before assigning a score.
 
@@ -392,18 +915,52 @@ async def judge_image(task, image_path, key_points, model):
 Respond with:  
 1. **Reasoning**: [Your explanation]  
 2. **Score**: [1-5]"""
+_JUDGE_PROMPT = """**Task**: {task}
 
-	jpg_base64_str = encode_image(Image.open(image_path))
+**Key Points for Task Completion**: {key_points}
 
-	prompt = """**Task**: {task}
+The snapshot of the web page is shown in the image."""
+_JUDGE_BATCH_PROMPT = """**Task**: {task}
 
 **Key Points for Task Completion**: {key_points}
 
-The snapshot of the web page is shown in the image."""
-	text = prompt.format(task=task, key_points=key_points)
+{count} snapshots of the web page are shown in the images below. Evaluate each image independently."""
+# System prompt for multi-image calls: same criteria and scale as _JUDGE_SYS, but one JSON answer for all the images
+_JUDGE_BATCH_SYS = """You are an expert evaluator tasked with determining whether each of several images contains information about the necessary steps to complete a task.
+
+**Objective**: Analyze each provided image on its own and decide if it shows essential steps or evidence required for completing the task. Use your reasoning to explain each decision before assigning its score.
+
+**Instructions**:
+1. For every image, look at its contents, visible elements, text (if any), and any notable features.
+
+2. Evaluate whether each image contains necessary steps or evidence crucial to task completion:
+- Identify key points that could be relevant to task completion, such as actions, progress indicators, tool usage, applied filters, or step-by-step instructions.
+- Does the image show actions, progress indicators, or critical information directly related to completing the task?
+- Is this information indispensable for understanding or ensuring task success?
+- If the image contains partial but relevant information, consider its usefulness rather than dismissing it outright.
+- Judge every image independently of the other images.
+
+3. Assign each image a score using the following scale:
+    - **1**: The image does not contain any necessary steps or relevant information.
+    - **2**: The image contains minimal or ambiguous information, unlikely to be essential.
+    - **3**: The image includes some relevant steps or hints but lacks clarity or completeness.
+    - **4**: The image contains important steps or evidence that are highly relevant but not fully comprehensive.
+    - **5**: The image clearly displays necessary steps or evidence crucial for completing the task.
+
+Respond only with a JSON array containing one object per image, in the order the images are given:
+[{"score": <1-5>, "reasoning": "<your explanation, mentioning the specific elements in the image>"}, ...]"""
+
+# Max screenshots per judge call. The default of 1 keeps the one-call-per-image judging of the Online-Mind2Web
+# protocol; larger values cut judge calls but scores are then not directly comparable with published results
+JUDGE_IMAGES_PER_CALL = int(os.getenv('EVAL_JUDGE_IMAGES_PER_CALL', '1'))
+
+
+async def judge_image(task, jpg_base64_str, key_points, model):
+	"""Judge one base64 JPEG screenshot; returns (response, base64 JPEG) like the batched judge"""
+	text = _JUDGE_PROMPT.format(task=task, key_points=key_points)
 
 	messages = [
-		{'role': 'system', 'content': system_msg},
+		{'role': 'system', 'content': _JUDGE_SYS},
 		{
 			'role': 'user',
 			'content': [
@@ -415,12 +972,92 @@ The snapshot of the web page is shown in the image."""
 			],
 		},
 	]
-	response = await model.ainvoke(messages)
-	return response.completion
+	response = await _guarded_invoke(model, messages)
+	return response.completion, jpg_base64_str
 
 
-async def Online_Mind2Web_eval(task, last_actions, images_path, model, score_threshold):
-	system_msg = """You are an expert in evaluating the performance of a web navigation agent. The agent is designed to help a human user navigate a website to complete a task. Given the user's task, the agent's action history, key points for task completion, some potentially important web pages in the agent's trajectory and their reasons, your goal is to determine whether the agent has completed the task and achieved all requirements.
+def _normalize_key_points(key_points: str) -> str:
+	key_points = key_points.replace('\n\n', '\n')
+	try:
+		key_points = key_points.split('**Key Points**:')[1]
+	except IndexError:
+		key_points = key_points.split('Key Points:')[-1]
+	return '\n'.join([line.lstrip() for line in key_points.splitlines()])
+
+
+def _parse_batched_judgement(completion: str, expected: int) -> list[tuple[int, str]]:
+	"""Parse the JSON array answer of a batched judge call into (score, reasoning) pairs"""
+	start, end = completion.find('['), completion.rfind(']')
+	if start == -1 or end < start:
+		raise ValueError('No JSON array in batched judge response')
+	entries = _json_loads(completion[start : end + 1])
+	if not isinstance(entries, list) or len(entries) != expected:
+		raise ValueError(
+			f'Expected {expected} judgements, got {len(entries) if isinstance(entries, list) else type(entries).__name__}'
+		)
+	parsed = []
+	for entry in entries:
+		score = int(entry['score'])
+		if not 1 <= score <= 5:
+			raise ValueError(f'Score out of range: {score}')
+		parsed.append((score, str(entry.get('reasoning', ''))))
+	return parsed
+
+
+async def _judge_image_chunk(task, encoded_images, key_points, model):
+	if len(encoded_images) == 1:
+		return [await judge_image(task, encoded_images[0], key_points, model)]
+
+	content: list[dict[str, Any]] = [
+		{'type': 'text', 'text': _JUDGE_BATCH_PROMPT.format(task=task, key_points=key_points, count=len(encoded_images))}
+	]
+	for index, jpg_base64_str in enumerate(encoded_images, 1):
+		content.append({'type': 'text', 'text': f'Image {index}:'})
+		content.append({'type': 'image_url', 'image_url': {'url': f'data:image/jpeg;base64,{jpg_base64_str}', 'detail': 'high'}})
+	content.append(
+		{
+			'type': 'text',
+			'text': f'Respond only with a JSON array of {len(encoded_images)} objects in the order of the images: '
+			'[{"score": <1-5>, "reasoning": "<your explanation>"}, ...]',
+		}
+	)
+
+	messages = [{'role': 'system', 'content': _JUDGE_BATCH_SYS}, {'role': 'user', 'content': content}]
+	response = await _guarded_invoke(model, messages)
+	try:
+		judgements = _parse_batched_judgement(response.completion, len(encoded_images))
+	except (ValueError, TypeError, KeyError) as e:
+		logger.warning(
+			f'Batched image judgement unusable ({type(e).__name__}: {e}), judging {len(encoded_images)} images one by one'
+		)
+		return list(
+			await asyncio.gather(*[judge_image(task, jpg_base64_str, key_points, model) for jpg_base64_str in encoded_images])
+		)
+
+	# Same shape as judge_image results so the score/reasoning parsing downstream is shared
+	return [
+		(f'**Reasoning**: {reasoning}\n\n**Score**: {score}', jpg_base64_str)
+		for (score, reasoning), jpg_base64_str in zip(judgements, encoded_images)
+	]
+
+
+async def judge_images_batched(task, encoded_images, key_points, model, images_per_call: int = JUDGE_IMAGES_PER_CALL):
+	"""
+	Judge base64 JPEG screenshots with one multi-image call per chunk of images_per_call instead of one call per image.
+
+	Returns judge_image style (response, base64 JPEG) pairs in the order of encoded_images.
+	"""
+	images_per_call = max(1, images_per_call)
+	chunks = [encoded_images[i : i + images_per_call] for i in range(0, len(encoded_images), images_per_call)]
+	if images_per_call == 1:
+		return list(
+			await asyncio.gather(*[judge_image(task, jpg_base64_str, key_points, model) for jpg_base64_str in encoded_images])
+		)
+	chunk_responses = await asyncio.gather(*[_judge_image_chunk(task, chunk, key_points, model) for chunk in chunks])
+	return [response for responses in chunk_responses for response in responses]
+
+
+_EVAL_SYS = """You are an expert in evaluating the performance of a web navigation agent. The agent is designed to help a human user navigate a website to complete a task. Given the user's task, the agent's action history, key points for task completion, some potentially important web pages in the agent's trajectory and their reasons, your goal is to determine whether the agent has completed the task and achieved all requirements.
 
 Your response must strictly follow the following evaluation criteria!
 *Important Evaluation Criteria*:
@@ -445,7 +1082,7 @@ Format your response into two lines as shown below:
 Thoughts: <your thoughts and reasoning process based on double-checking each key points and the evaluation criteria>
 Status: "success" or "failure"
 """
-	prompt = """User Task: {task}
+_EVAL_PROMPT = """User Task: {task}
 
 Key Points: {key_points}
 
@@ -454,64 +1091,66 @@ Action History:
 
 The potentially important snapshots of the webpage in the agent's trajectory and their reasons:
 {thoughts}"""
+_EVAL_PROMPT_NO_IMAGES = """User Task: {task}
 
-	key_points = await identify_key_points(task, model)
-	key_points = key_points.replace('\n\n', '\n')
+Key Points: {key_points}
 
-	try:
-		key_points = key_points.split('**Key Points**:')[1]
-		key_points = '\n'.join(line.lstrip() for line in key_points.splitlines())
-	except IndexError:
-		key_points = key_points.split('Key Points:')[-1]
-		key_points = '\n'.join(line.lstrip() for line in key_points.splitlines())
+Action History:
+{last_actions}"""
+
+
+async def Online_Mind2Web_eval(task, last_actions, images_path, model, score_threshold):
+
+	# Encode the screenshots while the key points call is in flight; the judge calls reuse these encodes
+	key_points, encoded_images = await asyncio.gather(
+		identify_key_points(task, model),
+		asyncio.gather(*[encode_image_async(image_path) for image_path in images_path]),
+	)
+	key_points = _normalize_key_points(key_points)
 
-	tasks = [judge_image(task, image_path, key_points, model) for image_path in images_path]
-	image_responses = await asyncio.gather(*tasks)
+	image_responses = await judge_images_batched(task, encoded_images, key_points, model)
 
 	whole_content_img = []
 	whole_thoughts = []
 	record = []
-	pattern = r'[1-5]'
-	for response, image_path in zip(image_responses, images_path):
+	for response, jpg_base64_str in image_responses:
 		try:
-			score_text = response.split('Score')[1]
-			thought = response.split('**Reasoning**:')[-1].strip().lstrip('\n').split('\n\n')[0].replace('\n', ' ')
-			score = re.findall(pattern, score_text)[0]
-			record.append({'Response': response, 'Score': int(score)})
+			score_text = response.split('Score', 2)[1]
+			thought = response.rpartition('**Reasoning**:')[2].strip().split('\n\n', 1)[0].replace('\n', ' ')
+			score_match = _SCORE_RE.search(score_text)
+			if score_match is None:
+				logger.error('Error processing response: no score between 1 and 5 found')
+				score = 0
+			else:
+				score = int(score_match.group())
+			record.append({'Response': response, 'Score': score})
 		except Exception as e:
 			logger.error(f'Error processing response: {type(e).__name__}: {e}')
 			score = 0
 			record.append({'Response': response, 'Score': 0})
 
 		if int(score) >= score_threshold:
-			jpg_base64_str = encode_image(Image.open(image_path))
 			whole_content_img.append(
-				{'type': 'image_url', 'image_url': {'url': f'data:image/png;base64,{jpg_base64_str}', 'detail': 'high'}}
+				{'type': 'image_url', 'image_url': {'url': f'data:image/jpeg;base64,{jpg_base64_str}', 'detail': 'high'}}
 			)
 			if thought != '':
 				whole_thoughts.append(thought)
 
 	whole_content_img = whole_content_img[:MAX_IMAGE]
 	whole_thoughts = whole_thoughts[:MAX_IMAGE]
-	if len(whole_content_img) == 0:
-		prompt = """User Task: {task}
-
-Key Points: {key_points}
-
-Action History:
-{last_actions}"""
+	prompt = _EVAL_PROMPT if whole_content_img else _EVAL_PROMPT_NO_IMAGES
 	text = prompt.format(
 		task=task,
-		last_actions='\n'.join(f'{i + 1}. {action}' for i, action in enumerate(last_actions)),
+		last_actions='\n'.join([f'{i}. {action}' for i, action in enumerate(last_actions, 1)]),
 		key_points=key_points,
-		thoughts='\n'.join(f'{i + 1}. {thought}' for i, thought in enumerate(whole_thoughts)),
+		thoughts='\n'.join([f'{i}. {thought}' for i, thought in enumerate(whole_thoughts, 1)]),
 	)
 
 	messages = [
-		{'role': 'system', 'content': system_msg},
+		{'role': 'system', 'content': _EVAL_SYS},
 		{'role': 'user', 'content': [{'type': 'text', 'text': text}] + whole_content_img},
 	]
-	return messages, text, system_msg, record, key_points
+	return messages, text, _EVAL_SYS, record, key_points
 
 
 async def Online_Mind2Web_eval_with_retry(task, last_actions, images_path, model, score_threshold, max_retries=3):
@@ -533,11 +1172,15 @@ async def Online_Mind2Web_eval_with_retry(task, last_actions, images_path, model
 		try:
 			return await Online_Mind2Web_eval(task, last_actions, images_path, model, score_threshold)
 		except Exception as e:
+			if not _is_retryable_error(e):
+				logger.error(f'Evaluation failed with a non-retryable error: {type(e).__name__}: {str(e)}')
+				raise
 			if attempt == max_retries - 1:  # Last attempt
 				logger.error(f'Failed to evaluate after {max_retries} attempts. Error: {type(e).__name__}: {str(e)}')
 				raise
-			logger.warning(f'Attempt {attempt + 1} failed. Retrying... Error: {type(e).__name__}: {str(e)}')
-			await asyncio.sleep(2**attempt)  # Exponential backoff
+			delay = _retry_delay(e, attempt)
+			logger.warning(f'Attempt {attempt + 1} failed. Retrying in {delay:.1f}s... Error: {type(e).__name__}: {str(e)}')
+			await asyncio.sleep(delay)  # Exponential backoff with jitter
 
 
 # ==============================================================================================================
@@ -547,20 +1190,18 @@ async def Online_Mind2Web_eval_with_retry(task, last_actions, images_path, model
 # A service for evaluating the performance of the agent
 # ==============================================================================================================
 import argparse
-import http.client
 import os
 import subprocess
 from dataclasses import dataclass, field
 
 # Define Stage enum and related classes for the pipeline
 from enum import Enum
-from typing import Any
 
 from dotenv import load_dotenv
 
 # Import the new comprehensive judge system (conditional import for backwards compatibility)
 try:
-	from judge_system import evaluate_task_with_comprehensive_judge
+	from judge_system import evaluate_task_with_comprehensive_judge, judge_result_from_evaluation
 
 	COMPREHENSIVE_JUDGE_AVAILABLE = True
 except ImportError:
@@ -580,14 +1221,25 @@ class Stage(Enum):
 	SAVE_SERVER = 'save_server'
 
 
-@dataclass
+# Pipeline order of the stages (Stage members are declared in that order)
+_STAGE_ORDER: tuple[Stage, ...] = tuple(Stage)
+
+# Completed stages are tracked as a bitmask on TaskResult: one bit per stage, in pipeline order
+_STAGE_BITS: dict[Stage, int] = {stage: 1 << index for index, stage in enumerate(_STAGE_ORDER)}
+_STAGE_NAME_BITS: tuple[tuple[int, str], ...] = tuple((_STAGE_BITS[stage], stage.value) for stage in _STAGE_ORDER)
+_EXECUTION_DATA_MASK = _STAGE_BITS[Stage.RUN_AGENT] | _STAGE_BITS[Stage.FORMAT_HISTORY]
+# Stages that contribute data to the server payload beyond the minimal status keys
+_PAYLOAD_DATA_MASK = _STAGE_BITS[Stage.FORMAT_HISTORY] | _STAGE_BITS[Stage.EVALUATE]
+
+
+@dataclass(slots=True)
 class StageError:
 	stage: Stage
 	error_type: str
 	message: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskResult:
 	task_id: str
 	run_id: str
@@ -596,15 +1248,16 @@ class TaskResult:
 	max_steps: int
 	laminar_link: str | None = None
 	github_workflow_url: str | None = None
-	completed_stages: set[Stage] = field(default_factory=set)
+	stages_mask: int = 0  # bit per completed Stage, see _STAGE_BITS
 	stage_data: dict[Stage, Any] = field(default_factory=dict)
 	errors: list = field(default_factory=list)
 	cancelled: bool = False
 	critical_error: str | None = None
 	server_save_failed: bool = False
+	login_tracking: dict | None = None  # login cookie tracking saved after the agent run, reused by the evaluation
 
 	def stage_completed(self, stage: Stage, data: Any = None):
-		self.completed_stages.add(stage)
+		self.stages_mask |= _STAGE_BITS[stage]
 		if data is not None:
 			self.stage_data[stage] = data
 
@@ -621,8 +1274,18 @@ class TaskResult:
 		self.server_save_failed = True
 		self.errors.append(StageError(Stage.SAVE_SERVER, 'server_save', error))
 
+	def has_stage(self, stage: Stage) -> bool:
+		return bool(self.stages_mask & _STAGE_BITS[stage])
+
+	@property
+	def completed_stages(self) -> set[Stage]:
+		return {stage for stage, bit in _STAGE_BITS.items() if self.stages_mask & bit}
+
+	def completed_stage_names(self) -> list[str]:
+		return [name for bit, name in _STAGE_NAME_BITS if self.stages_mask & bit]
+
 	def has_execution_data(self) -> bool:
-		return Stage.RUN_AGENT in self.completed_stages or Stage.FORMAT_HISTORY in self.completed_stages
+		return bool(self.stages_mask & _EXECUTION_DATA_MASK)
 
 	@property
 	def server_payload(self) -> dict[str, Any]:
@@ -631,7 +1294,7 @@ class TaskResult:
 			'taskId': self.task_id,
 			'runId': self.run_id,
 			'task': self.confirmed_task,
-			'completed_stages': [stage.value for stage in self.completed_stages],
+			'completed_stages': self.completed_stage_names(),
 			'has_errors': len(self.errors) > 0,
 			'cancelled': self.cancelled,
 			'critical_error': self.critical_error,
@@ -640,18 +1303,21 @@ class TaskResult:
 			'githubWorkflowUrl': self.github_workflow_url,
 		}
 
+		# Tasks that failed before producing history (e.g. browser setup failures) only report their status
+		if not self.stages_mask & _PAYLOAD_DATA_MASK:
+			return payload
+
 		# Add task execution data if available
-		if Stage.FORMAT_HISTORY in self.completed_stages:
+		if self.has_stage(Stage.FORMAT_HISTORY):
 			format_data = self.stage_data.get(Stage.FORMAT_HISTORY, {})
-			logger.info(f'format_data: {format_data}')
 			# log token usage
-			logger.info(f'tokensUsed: {format_data.get("tokensUsed")}')
-			logger.info(f'usage: {format_data.get("usage")}')
+			logger.info('tokensUsed: %s', format_data.get('tokensUsed'))
+			logger.info('usage: %s', format_data.get('usage'))
 
 			# Handle usage data - convert to JSON string if it's a dict
 			usage_data = format_data.get('usage')
 			if usage_data and isinstance(usage_data, dict):
-				usage_data = json.dumps(usage_data)
+				usage_data = _json_dumps(usage_data)
 
 			payload.update(
 				{
@@ -669,7 +1335,7 @@ class TaskResult:
 			)
 
 		# Add evaluation data if available
-		if Stage.EVALUATE in self.completed_stages:
+		if self.has_stage(Stage.EVALUATE):
 			eval_data = self.stage_data.get(Stage.EVALUATE, {})
 
 			# Handle comprehensive judge evaluation
@@ -709,16 +1375,13 @@ class TaskResult:
 				}
 			)
 
-		# Ensure all data in payload is JSON serializable
-		serialized_payload = make_json_serializable(payload)
-		# Type assertion since we know payload is a dict and make_json_serializable preserves dict structure
-		assert isinstance(serialized_payload, dict), 'Payload serialization should preserve dict structure'
-		return serialized_payload
+		# Non-JSON types (enums, models, paths) are converted by orjson when the payload is sent, see _json_default
+		return payload
 
 	def get_local_status(self) -> dict[str, Any]:
 		"""Get local status summary"""
 		success = (
-			Stage.EVALUATE in self.completed_stages
+			self.has_stage(Stage.EVALUATE)
 			and not self.cancelled
 			and self.critical_error is None
 			and len([e for e in self.errors if e.error_type == 'exception']) == 0
@@ -727,12 +1390,12 @@ class TaskResult:
 			'task_id': self.task_id,
 			'success': success,
 			'error': self.critical_error or (self.errors[0].message if self.errors else None),
-			'completed_stages': [stage.value for stage in self.completed_stages],
+			'completed_stages': self.completed_stage_names(),
 		}
 
 
 from browser_use import ActionResult, Agent, BrowserProfile, BrowserSession, Controller
-from browser_use.agent.views import AgentHistoryList
+from browser_use.agent.views import AgentHistoryList, AgentOutput
 
 SUPPORTED_MODELS = {
 	# Anthropic
@@ -896,35 +1559,45 @@ SERPER_API_KEY = os.getenv('SERPER_API_KEY')
 if not SERPER_API_KEY:
 	logger.warning('SERPER_API_KEY is not set. Search functionality will not be available.')
 
+# Pooled keep-alive client for Serper so searches reuse one TLS connection instead of a handshake per query
+_SERPER_CLIENT = httpx.AsyncClient(
+	base_url='https://google.serper.dev',
+	headers={'X-API-KEY': SERPER_API_KEY or '', 'Content-Type': 'application/json'},
+	http2=_HTTP2_AVAILABLE,
+	timeout=30.0,
+)
+
 
 def create_controller_with_serp_search(output_model: type[BaseModel] | None = None):
 	"""Create a controller with SERP search instead of Google search"""
 	controller = Controller(exclude_actions=['search_google'], output_model=output_model)
 
+	if not SERPER_API_KEY:
+
+		@controller.registry.action('Search the web for a specific query')
+		async def search_web(query: str):
+			"""Search the web using Serper API (unavailable: no API key configured)"""
+			return ActionResult(extracted_content='Search unavailable: SERPER_API_KEY not configured', include_in_memory=True)
+
+		return controller
+
 	@controller.registry.action('Search the web for a specific query')
 	async def search_web(query: str):
 		"""Search the web using Serper API"""
-		if not SERPER_API_KEY:
-			return ActionResult(extracted_content='Search unavailable: SERPER_API_KEY not configured', include_in_memory=True)
-
 		try:
 			# Make request to Serper API
-			conn = http.client.HTTPSConnection('google.serper.dev')
-			payload = json.dumps({'q': query})
-			headers = {'X-API-KEY': SERPER_API_KEY, 'Content-Type': 'application/json'}
-			conn.request('POST', '/search', payload, headers)
-			res = conn.getresponse()
-			data = res.read()
-			serp_data = json.loads(data.decode('utf-8'))
+			response = await _SERPER_CLIENT.post('/search', content=orjson.dumps({'q': query}))
+			serp_data = orjson.loads(response.content)
 
 			# Exclude searchParameters and credits to reduce noise
 			serp_data = {k: v for k, v in serp_data.items() if k not in ['searchParameters', 'credits']}
 
 			# Log the search data for debugging
-			logger.debug(f"SERP search for '{query}': {json.dumps(serp_data, indent=2)}")
+			if logger.isEnabledFor(logging.DEBUG):
+				logger.debug(f"SERP search for '{query}': {orjson.dumps(serp_data, option=orjson.OPT_INDENT_2).decode()}")
 
 			# Convert to string for the agent
-			serp_data_str = json.dumps(serp_data)
+			serp_data_str = _json_dumps(serp_data)
 
 			return ActionResult(
 				extracted_content=serp_data_str, include_in_memory=False, include_extracted_content_only_once=True
@@ -937,6 +1610,9 @@ def create_controller_with_serp_search(output_model: type[BaseModel] | None = No
 	return controller
 
 
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
+
 def create_controller(
 	use_serp: bool = False,
 	output_model: type[BaseModel] | None = None,
@@ -961,12 +1637,9 @@ def create_controller(
 			# Check if email is in task description or other fields
 			elif hasattr(task, 'confirmed_task') and '@' in task.confirmed_task:
 				# Extract email from task description using regex
-				import re
-
-				email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-				matches = re.findall(email_pattern, task.confirmed_task)
-				if matches:
-					username = matches[0]
+				match = _EMAIL_RE.search(task.confirmed_task)
+				if match:
+					username = match.group(0)
 
 			if username:
 				# Extract user ID (part before @)
@@ -989,95 +1662,151 @@ def create_controller(
 		except Exception as e:
 			logger.error(f'Failed to setup Gmail integration: {e}')
 	else:
-		logger.info(f'No Gmail 2FA tokens provided, running without Gmail integration: {gmail_tokens_dict}, {task}')
+		logger.info('No Gmail 2FA tokens provided, running without Gmail integration: %s, %s', gmail_tokens_dict, task)
 
 	return controller
 
 
-def get_llm(model_name: str):
-	"""Instantiates the correct ChatModel based on the model name."""
-	if model_name not in SUPPORTED_MODELS:
-		raise ValueError(f'Unsupported model: {model_name}. Supported models are: {list(SUPPORTED_MODELS.keys())}')
+# Provider -> chat model class; only ChatOpenAI is imported eagerly, the other SDK wrappers on first use
+_PROVIDER_FACTORIES: dict[str, type[BaseChatModel] | tuple[str, str]] = {
+	'openai': ChatOpenAI,
+	'anthropic': ('browser_use.llm.anthropic.chat', 'ChatAnthropic'),
+	'google': ('browser_use.llm.google.chat', 'ChatGoogle'),
+	'groq': ('browser_use.llm.groq.chat', 'ChatGroq'),
+	'openai_compatible': ChatOpenAI,
+}
 
-	config = SUPPORTED_MODELS[model_name]
-	provider = config['provider']
-	api_key_env = config.get('api_key_env')
-	api_key = os.getenv(api_key_env) if api_key_env else None
 
-	if not api_key and api_key_env:
-		logger.warning(
-			f'API key environment variable {api_key_env} not found or empty for model {model_name}. Trying without API key if possible.'
-		)
-		api_key = None
+def _provider_factory(provider: str) -> type[BaseChatModel]:
+	factory = _PROVIDER_FACTORIES[provider]
+	if isinstance(factory, tuple):
+		module_name, class_name = factory
+		factory = _PROVIDER_FACTORIES[provider] = getattr(importlib.import_module(module_name), class_name)
+	return factory
+
 
-	match provider:
+def _model_kwargs(model_name: str, config: dict[str, Any]) -> dict[str, Any]:
+	"""Constructor kwargs for a SUPPORTED_MODELS entry, without the API key"""
+	kwargs: dict[str, Any] = {'model': config['model_name'], 'temperature': 0.0}
+	match config['provider']:
 		case 'openai':
-			kwargs = {'model': config['model_name'], 'temperature': 0.0}
 			# Must set temperatue=1 if model is gpt-o4-mini
 			if model_name in ['gpt-o4-mini', 'gpt-o3']:
 				kwargs['temperature'] = 1
-			if api_key:
-				kwargs['api_key'] = api_key
-			return ChatOpenAI(**kwargs)
 		case 'anthropic':
-			kwargs = {
-				'model': config['model_name'],
-				'temperature': 0.0,
-				'timeout': 100,
-			}
-			if api_key:
-				kwargs['api_key'] = api_key
-			return ChatAnthropic(**kwargs)
+			kwargs['timeout'] = 100
 		case 'google':
-			kwargs = {'model': config['model_name'], 'temperature': 0.0, 'thinking_budget': config.get('thinking_budget', None)}
-			if api_key:
-				kwargs['api_key'] = api_key
-			return ChatGoogle(**kwargs)
+			kwargs['thinking_budget'] = config.get('thinking_budget', None)
 		case 'groq':
-			kwargs = {
-				'model': config['model_name'],
-				'temperature': 0.0,
-				'service_tier': config.get('service_tier', 'auto'),
-			}
-			if api_key:
-				kwargs['api_key'] = api_key
-			return ChatGroq(**kwargs)
+			kwargs['service_tier'] = config.get('service_tier', 'auto')
 		case 'openai_compatible':
-			kwargs = {'model': config['model_name'], 'base_url': config['base_url'], 'temperature': 0.0}
-			if api_key:
-				kwargs['api_key'] = api_key
-			elif config.get('base_url'):
-				logger.warning(
-					f'API key for {model_name} at {config["base_url"]} is missing, but base_url is specified. Authentication may fail.'
-				)
-			return ChatOpenAI(**kwargs)
-		case _:
-			raise ValueError(f'Unknown provider: {provider}')
+			kwargs['base_url'] = config['base_url']
+	return kwargs
 
 
-def clean_action_dict(action_dict: dict) -> dict:
-	return {k: clean_action_dict(v) if isinstance(v, dict) else v for k, v in action_dict.items() if v is not None}
+def _build_model_cache() -> dict[str, tuple[str, dict[str, Any]]]:
+	"""Resolve provider, kwargs and API key for every supported model once at import"""
+	cache = {}
+	for model_name, config in SUPPORTED_MODELS.items():
+		provider = config['provider']
+		if provider not in _PROVIDER_FACTORIES:
+			continue  # get_llm reports the unknown provider if this model is requested
+		kwargs = _model_kwargs(model_name, config)
+		api_key_env = config.get('api_key_env')
+		api_key = os.getenv(api_key_env) if api_key_env else None
+		if api_key:
+			kwargs['api_key'] = api_key
+		cache[model_name] = (provider, kwargs)
+	return cache
 
 
-def make_json_serializable(obj: Any) -> Any:
-	"""
-	Convert objects to JSON-serializable types.
-	Handles common non-serializable types like enums, custom objects, etc.
-	"""
-	if obj is None:
-		return None
-	elif isinstance(obj, (str, int, float, bool)):
-		return obj
-	elif isinstance(obj, dict):
-		return {k: make_json_serializable(v) for k, v in obj.items()}
-	elif isinstance(obj, (list, tuple)):
-		return [make_json_serializable(item) for item in obj]
-	elif hasattr(obj, 'value'):  # Handle enums
-		return obj.value
-	elif hasattr(obj, '__dict__'):  # Handle custom objects
-		return str(obj)
-	else:
-		return str(obj)
+_MODEL_CACHE = _build_model_cache()
+
+# argparse choices for the --model/--eval-model/--planner-model flags
+_MODEL_CHOICES = tuple(SUPPORTED_MODELS)
+
+
+def get_llm(model_name: str):
+	"""Instantiates the correct ChatModel based on the model name."""
+	if model_name not in SUPPORTED_MODELS:
+		raise ValueError(f'Unsupported model: {model_name}. Supported models are: {list(_MODEL_CHOICES)}')
+	if model_name not in _MODEL_CACHE:
+		raise ValueError(f'Unknown provider: {SUPPORTED_MODELS[model_name]["provider"]}')
+
+	provider, kwargs = _MODEL_CACHE[model_name]
+	api_key_env = SUPPORTED_MODELS[model_name].get('api_key_env')
+	if 'api_key' not in kwargs:
+		if api_key_env:
+			logger.warning(
+				f'API key environment variable {api_key_env} not found or empty for model {model_name}. Trying without API key if possible.'
+			)
+		if 'base_url' in kwargs:
+			logger.warning(
+				f'API key for {model_name} at {kwargs["base_url"]} is missing, but base_url is specified. Authentication may fail.'
+			)
+	return _provider_factory(provider)(**kwargs)
+
+
+# type -> converter for the types orjson hands to _json_default; filled on first sight of each type
+_JSON_DEFAULT_HANDLERS: dict[type, Any] = {}
+
+
+def _json_default(obj: Any) -> Any:
+	"""orjson fallback for types it doesn't serialize natively (enums and dataclasses are handled by orjson itself)"""
+	handler = _JSON_DEFAULT_HANDLERS.get(type(obj))
+	if handler is None:
+		handler = _JSON_DEFAULT_HANDLERS[type(obj)] = BaseModel.model_dump if isinstance(obj, BaseModel) else str
+	return handler(obj)
+
+
+def _dumps(obj: Any) -> bytes:
+	"""Serialize result files with orjson: 2-space indent, non-str keys allowed, str() for unknown types"""
+	return orjson.dumps(obj, default=_json_default, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+
+# Directories already created by this process, so repeated saves skip the mkdir syscalls
+_MKDIR_CACHE: set[str] = set()
+
+
+def _model_output_dict(model_output: AgentOutput) -> dict[str, Any]:
+	"""Agent output dict with its actions dumped with exclude_none, so pydantic drops unset params while dumping
+	instead of None values being stripped from the dumped dicts in Python afterwards"""
+	dumped = model_output.model_dump(exclude={'action'})
+	dumped['action'] = [action.model_dump(exclude_none=True) for action in model_output.action]
+	return dumped
+
+
+def _ensure_dir(path: Path) -> None:
+	key = str(path)
+	if key not in _MKDIR_CACHE:
+		os.makedirs(key, exist_ok=True)
+		_MKDIR_CACHE.add(key)
+
+
+def _is_int_like(value: Any) -> bool:
+	"""True for values int() accepts as a token count: ints, finite floats and strings of digits"""
+	if isinstance(value, int):
+		return True
+	if isinstance(value, float):
+		return math.isfinite(value)
+	return isinstance(value, str) and value.strip().removeprefix('-').isdigit()
+
+
+def _decode_screenshots(screenshots: list[tuple[Path, str]]) -> list[tuple[Path, bytes]]:
+	return [(path, base64.b64decode(screenshot)) for path, screenshot in screenshots]
+
+
+async def _write_screenshots(screenshots: list[tuple[Path, str]]) -> None:
+	"""Decode all screenshots in one worker thread, then write the files concurrently"""
+	decoded_screenshots = await anyio.to_thread.run_sync(_decode_screenshots, screenshots)
+	await asyncio.gather(*[anyio.to_thread.run_sync(path.write_bytes, data) for path, data in decoded_screenshots])
+
+
+async def _write_results_file(results_path: Path, results: dict) -> None:
+	# _dumps falls back to str() for potential non-serializable types like Path
+	encoded = await anyio.to_thread.run_sync(_dumps, results)
+	async with await anyio.open_file(results_path, 'wb') as f:
+		await f.write(encoded)
 
 
 async def reformat_agent_history(
@@ -1094,80 +1823,91 @@ async def reformat_agent_history(
 	task_dir = Path(base_path) / task_id
 	trajectory_with_highlights_dir = task_dir / 'trajectory_with_highlights'
 
-	# Create directories
-	task_dir.mkdir(parents=True, exist_ok=True)
-	trajectory_with_highlights_dir.mkdir(parents=True, exist_ok=True)
+	# Create directories (task_dir is created as the parent of the trajectory dir)
+	_ensure_dir(trajectory_with_highlights_dir)
 
 	# Collect screenshot paths and action history
 	screenshot_paths = []
+	pending_screenshots: list[tuple[Path, str]] = []
 	action_history = []
 	final_result = None
 	self_report_completed = False
 	self_report_success = None
 	complete_history = []
-	total_tokens_used = 0  # Initialize token counter
+	step_input_tokens: list[tuple[int, Any]] = []  # (step, input_tokens) pairs, summed after the loop
 
 	# Process history items
 	for step_num, history_item in enumerate(agent_history.history):
+		state = history_item.state
+		step_results = history_item.result
+
 		# Save screenshot
-		if history_item.state and history_item.state.screenshot:
+		if state and state.screenshot:
 			screenshot_path = trajectory_with_highlights_dir / f'step_{step_num}.png'
 			screenshot_paths.append(str(screenshot_path))
-			# Save the actual screenshot
-			screenshot_data = base64.b64decode(history_item.state.screenshot)
-			async with await anyio.open_file(screenshot_path, 'wb') as f:
-				await f.write(screenshot_data)
+			# Written in one batch after the loop
+			pending_screenshots.append((screenshot_path, state.screenshot))
 
 		# Get action result content
-		if history_item.result:
-			for result in history_item.result:
-				# We don't want to include the final result in the action history as per the evaluation criteria
-				if result.extracted_content and result.extracted_content != 'None' and not result.is_done:
-					action_history.append(result.extracted_content)
-				# Check if this is the final result
-				if result.is_done:
-					final_result = result.extracted_content
-					self_report_completed = True
-					self_report_success = result.success
+		if step_results:
+			# We don't want to include the final result in the action history as per the evaluation criteria
+			action_history.extend(
+				[
+					result.extracted_content
+					for result in step_results
+					if result.extracted_content and result.extracted_content != 'None' and not result.is_done
+				]
+			)
+			# Check if this step holds the final result (at most one done result per step)
+			done_result = next((result for result in step_results if result.is_done), None)
+			if done_result is not None:
+				final_result = done_result.extracted_content
+				self_report_completed = True
+				self_report_success = done_result.success
+			results_dumped = [result.model_dump() for result in step_results]
+		else:
+			results_dumped = None
 
 		# Build complete history entry with cleaned model output
 		model_output = None
 		if history_item.model_output:
-			model_output = history_item.model_output.model_dump()
-			if 'action' in model_output:
-				# Clean each action in the action list
-				model_output['action'] = [clean_action_dict(action) for action in model_output['action']]
-
-		step_metadata = history_item.metadata.model_dump() if history_item.metadata else {}
-		step_info = {
-			'step_number': step_num,
-			'model_output': model_output,
-			'result': [r.model_dump() for r in history_item.result] if history_item.result else None,
-			'state': {
-				'url': history_item.state.url if history_item.state else None,
-				'title': history_item.state.title if history_item.state else None,
-			},
-			'metadata': step_metadata,  # Use dumped metadata
-		}
-		complete_history.append(step_info)
+			model_output = _model_output_dict(history_item.model_output)
+
+		metadata = history_item.metadata
+		complete_history.append(
+			{
+				'step_number': step_num,
+				'model_output': model_output,
+				'result': results_dumped,
+				'state': {
+					'url': state.url if state else None,
+					'title': state.title if state else None,
+				},
+				'metadata': metadata.model_dump() if metadata else {},
+			}
+		)
 
-		# Sum up tokens from metadata
-		if step_metadata and 'input_tokens' in step_metadata:
-			try:
-				total_tokens_used += int(step_metadata['input_tokens'])
-			except (ValueError, TypeError):
-				logger.warning(
-					f"Task {task_id}, Step {step_num}: Could not parse input_tokens '{step_metadata['input_tokens']}' as integer."
-				)
+		# Collect tokens from metadata
+		input_tokens = getattr(metadata, 'input_tokens', None)
+		if input_tokens is not None:
+			step_input_tokens.append((step_num, input_tokens))
+
+	# Sum up tokens in one pass; values that aren't integers are reported and skipped
+	token_counts = [int(tokens) for _, tokens in step_input_tokens if _is_int_like(tokens)]
+	total_tokens_used = sum(token_counts)
+	if len(token_counts) != len(step_input_tokens):
+		for step, tokens in step_input_tokens:
+			if not _is_int_like(tokens):
+				logger.warning("Task %s, Step %s: Could not parse input_tokens '%s' as integer.", task_id, step, tokens)
 
 	# Calculate task duration from metadata (step-based timing)
 	step_based_duration = None
-	if complete_history and len(complete_history) > 0:
-		first_step = complete_history[0].get('metadata', {})
-		last_step = complete_history[-1].get('metadata', {})
+	if agent_history.history:
+		first_step = agent_history.history[0].metadata
+		last_step = agent_history.history[-1].metadata
 		if first_step and last_step:
-			start_time = first_step.get('step_start_time')
-			end_time = last_step.get('step_end_time')
+			start_time = first_step.step_start_time
+			end_time = last_step.step_end_time
 			if start_time and end_time:
 				# Ensure timestamps are floats before subtracting
 				try:
@@ -1186,11 +1926,11 @@ async def reformat_agent_history(
 
 	# Extract usage data from agent history
 	usage_data = None
-	logger.info(f'Agent history usage object: {agent_history.usage}')
-	logger.info(f'Agent history usage type: {type(agent_history.usage)}')
+	logger.info('Agent history usage object: %s', agent_history.usage)
+	logger.info('Agent history usage type: %s', type(agent_history.usage))
 	if hasattr(agent_history, 'usage') and agent_history.usage:
-		logger.info(f'Agent history usage model_dump: {agent_history.usage.model_dump()}')
 		usage_data = agent_history.usage.model_dump()
+		logger.info('Agent history usage model_dump: %s', usage_data)
 	else:
 		logger.warning('Agent history has no usage data or usage is empty/None')
 
@@ -1212,17 +1952,74 @@ async def reformat_agent_history(
 		'usage': usage_data,  # Add usage data
 	}
 
-	# Save results file
-	results_path = task_dir / 'result.json'
-	async with await anyio.open_file(results_path, 'w') as f:
-		# Use a custom JSON encoder to handle potential non-serializable types like Path
-		await f.write(json.dumps(results, indent=2, default=str))
+	# Save the screenshots and the results file concurrently; encoding result.json overlaps the screenshot writes
+	async with asyncio.TaskGroup() as tg:
+		tg.create_task(_write_screenshots(pending_screenshots))
+		tg.create_task(_write_results_file(task_dir / 'result.json', results))
 
 	return results
 
 
+@functools.lru_cache(maxsize=256)
+def _compiled_output_model(schema_json: str) -> type[BaseModel]:
+	# Shape-stable model name so structurally identical schemas share one generated model regardless of task_id
+	return create_pydantic_model_from_schema(schema_json, 'TaskOutput')
+
+
+def _output_model_for_schema(output_schema: dict | str) -> type[BaseModel]:
+	"""Pydantic model for a task's output schema, generated once per distinct schema"""
+	if isinstance(output_schema, str):
+		return _compiled_output_model(output_schema)
+	return _compiled_output_model(orjson.dumps(output_schema, option=orjson.OPT_SORT_KEYS).decode())
+
+
+# Task fields with dedicated slots; anything else in the task data lands in additional_fields
+_TASK_FIELDS = frozenset(
+	{
+		'task_id',
+		'confirmed_task',
+		'website',
+		'reference_length',
+		'level',
+		'cluster_id',
+		'login_cookie',
+		'login_type',
+		'category',
+		'output_schema',
+		'auth_keys',
+	}
+)
+
+
 class Task:
+	__slots__ = (
+		'task_id',
+		'confirmed_task',
+		'website',
+		'reference_length',
+		'level',
+		'cluster_id',
+		'login_cookie',
+		'login_type',
+		'category',
+		'output_schema',
+		'auth_keys',
+		'needs_auth',
+		'output_model',
+		'additional_fields',
+	)
+
 	def __init__(self, task_id, confirmed_task, **kwargs):
+		self._init(task_id, confirmed_task, kwargs)
+
+	@classmethod
+	def from_raw(cls, data: dict) -> 'Task':
+		"""Build a Task straight from a fetched task dict, without unpacking it into keyword arguments"""
+		task = cls.__new__(cls)
+		task._init(data.get('task_id'), data.get('confirmed_task'), data)
+		return task
+
+	def _init(self, task_id, confirmed_task, fields: dict) -> None:
 		# Validate required fields
 		if not task_id:
 			raise ValueError('task_id is required and cannot be empty')
@@ -1235,38 +2032,35 @@ class Task:
 
 		# Set optional fields dynamically
 		# Known optional fields with defaults
-		self.website = kwargs.get('website', None)
-		self.reference_length = kwargs.get('reference_length', None)
-		self.level = kwargs.get('level', None)
-		self.cluster_id = kwargs.get('cluster_id', None)
-		self.login_cookie = kwargs.get('login_cookie', None)
-		self.login_type = kwargs.get('login_type', None)
-		self.category = kwargs.get('category', None)
-		self.output_schema = kwargs.get('output_schema', None)  # Add structured output schema support
-		self.auth_keys = kwargs.get('auth_keys', None)  # List of auth keys to fetch from auth distribution
+		self.website = fields.get('website', None)
+		self.reference_length = fields.get('reference_length', None)
+		self.level = fields.get('level', None)
+		self.cluster_id = fields.get('cluster_id', None)
+		self.login_cookie = fields.get('login_cookie', None)
+		self.login_type = fields.get('login_type', None)
+		self.category = fields.get('category', None)
+		self.output_schema = fields.get('output_schema', None)  # Add structured output schema support
+		self.auth_keys = fields.get('auth_keys', None)  # List of auth keys to fetch from auth distribution
+		self.needs_auth = isinstance(self.auth_keys, list) and len(self.auth_keys) > 0
 		if self.output_schema:
 			# Convert JSON schema to Pydantic model class
-			self.output_model = create_pydantic_model_from_schema(self.output_schema, f'Task_{self.task_id}_Output')
+			self.output_model = _output_model_for_schema(self.output_schema)
 		else:
 			self.output_model = None
 
 		# Store any additional optional fields
-		known_fields = {
-			'website',
-			'reference_length',
-			'level',
-			'cluster_id',
-			'login_cookie',
-			'login_type',
-			'category',
-			'output_schema',
-			'auth_keys',
-		}
-		self.additional_fields = {k: v for k, v in kwargs.items() if k not in known_fields}
+		self.additional_fields = {k: v for k, v in fields.items() if k not in _TASK_FIELDS}
+
+	@property
+	def is_login_task(self) -> bool:
+		return bool(self.login_cookie)
 
-		# Make all additional fields accessible as attributes
-		for key, value in self.additional_fields.items():
-			setattr(self, key, value)
+	def __getattr__(self, name):
+		# Only reached when the slot lookup fails: make all additional fields accessible as attributes
+		try:
+			return object.__getattribute__(self, 'additional_fields')[name]
+		except (AttributeError, KeyError):
+			raise AttributeError(f'{type(self).__name__!r} object has no attribute {name!r}') from None
 
 	def __str__(self):
 		# Include main fields and indicate if there are additional fields
@@ -1281,6 +2075,19 @@ class Task:
 		return self.__str__()
 
 
+# Kept small: result.json files embed the whole agent history, and each write-back changes the mtime anyway
+@functools.lru_cache(maxsize=8)
+def _load_result(path_str: str, mtime_ns: int) -> dict:
+	"""Parsed result.json keyed by path and mtime, so back-to-back passes over one task skip re-parsing it.
+	Callers must copy the returned dict before mutating it."""
+	with open(path_str, 'rb') as f:
+		return orjson.loads(f.read())
+
+
+# Caps concurrent comprehensive judge evaluations at what the judge backend serves well, independent of --parallel-runs
+_EVAL_SEMAPHORE = asyncio.Semaphore(int(os.getenv('EVAL_CONCURRENCY', '32')))
+
+
 async def judge_task_result(model, task_folder: Path, score_threshold: float = 3, use_mind2web: bool = False) -> dict:
 	"""
 	Judge a single task result using the comprehensive judge system by default,
@@ -1296,7 +2103,9 @@ async def judge_task_result(model, task_folder: Path, score_threshold: float = 3
 	    Dictionary containing judgment results
 	"""
 	result_file = task_folder / 'result.json'
-	if not result_file.exists():
+	try:
+		result_stat = await anyio.to_thread.run_sync(os.stat, result_file)
+	except FileNotFoundError:
 		return {
 			'task_id': task_folder.name,
 			'judgement': 'No result.json found',
@@ -1306,16 +2115,16 @@ async def judge_task_result(model, task_folder: Path, score_threshold: float = 3
 		}
 
 	try:
-		async with await anyio.open_file(result_file) as f:
-			result = json.loads(await f.read())
+		# Shallow copy: only top-level keys are added before writing back, the cached dict stays untouched
+		result = dict(await anyio.to_thread.run_sync(_load_result, str(result_file), result_stat.st_mtime_ns))
 
 		# Check if we should use the original Mind2Web evaluation
 		if use_mind2web:
 			logger.info(f'Task {task_folder.name}: Using original Online_Mind2Web evaluation')
 
 			# If a Online_Mind2Web_evaluation is already saved, we can skip the eval
-			if result.get('Online_Mind2Web_evaluation'):
-				return result.get('Online_Mind2Web_evaluation')
+			if saved_evaluation := result.get('Online_Mind2Web_evaluation'):
+				return saved_evaluation
 
 			# Get the screenshot paths, task description, and action history
 			screenshot_paths = result.get('screenshot_paths', [])
@@ -1335,7 +2144,7 @@ async def judge_task_result(model, task_folder: Path, score_threshold: float = 3
 				messages, text, system_msg, record, key_points = eval_result
 
 				# Final steps to get judgement - use async invoke directly
-				judgement_response = await model.ainvoke(messages)
+				judgement_response = await _guarded_invoke(model, messages)
 				judgement = judgement_response.completion
 
 				if 'success' in judgement.lower().split('status:')[1]:  # This is the official criteria for success
@@ -1357,17 +2166,18 @@ async def judge_task_result(model, task_folder: Path, score_threshold: float = 3
 
 				# Save the Online_Mind2Web_evaluation into the result.json file
 				result['Online_Mind2Web_evaluation'] = evaluation
-				async with await anyio.open_file(result_file, 'w') as f:
-					await f.write(json.dumps(result, indent=2))
+				async with await anyio.open_file(result_file, 'wb') as f:
+					await f.write(_dumps(result))
 
 				return evaluation
 
 			except Exception as err:
+				err_msg = f'{type(err).__name__}: {err}'
 				return {
 					'task_id': task_folder.name,
-					'judgement': f'Mind2Web evaluation failed: {type(err).__name__}: {err}',
+					'judgement': f'Mind2Web evaluation failed: {err_msg}',
 					'success': False,
-					'error': f'{type(err).__name__}: {err}',
+					'error': err_msg,
 					'score': 0.0,
 				}
 
@@ -1382,82 +2192,171 @@ async def judge_task_result(model, task_folder: Path, score_threshold: float = 3
 
 			# Check if comprehensive judge result already exists
 			if result.get('comprehensive_judge_evaluation'):
-				existing_eval = result['comprehensive_judge_evaluation']
-				return {
-					'task_id': task_folder.name,
-					'judgement': existing_eval.get('reasoning', 'Comprehensive evaluation completed'),
-					'success': existing_eval.get('passed', False),
-					'error': None,
-					'score': existing_eval.get('final_score', 0) / 100.0,  # Convert to 0-1 scale
-					'comprehensive_evaluation': existing_eval,
-				}
+				return judge_result_from_evaluation(task_folder.name, result['comprehensive_judge_evaluation'])
 
 			try:
-				# Run comprehensive judge evaluation
-				comprehensive_result = await asyncio.wait_for(
-					evaluate_task_with_comprehensive_judge(task_folder=task_folder, model=model, max_images=10),
-					timeout=180,  # 3 minutes max for evaluation
-				)
-
-				if comprehensive_result.get('error'):
-					return {
-						'task_id': task_folder.name,
-						'judgement': f'Comprehensive evaluation failed: {comprehensive_result["error"]}',
-						'success': False,
-						'error': comprehensive_result['error'],
-						'score': 0.0,
-					}
-
-				comp_eval = comprehensive_result.get('comprehensive_judge')
-				if comp_eval:
-					return {
-						'task_id': task_folder.name,
-						'judgement': comp_eval.get('reasoning', 'Comprehensive evaluation completed'),
-						'success': comp_eval.get('passed', False),
-						'error': None,
-						'score': comp_eval.get('final_score', 0) / 100.0,  # Convert to 0-1 scale
-						'comprehensive_evaluation': comp_eval,
-					}
-				else:
-					return {
-						'task_id': task_folder.name,
-						'judgement': 'Comprehensive judge failed to return results',
-						'success': False,
-						'error': 'Comprehensive judge failed to return results',
-						'score': 0.0,
-					}
+				# Run comprehensive judge evaluation; the semaphore wait doesn't count towards the evaluation timeout.
+				# It already returns the final judgement shape, and reuses the result.json loaded above.
+				async with _EVAL_SEMAPHORE:
+					return await asyncio.wait_for(
+						evaluate_task_with_comprehensive_judge(
+							task_folder=task_folder, model=_GuardedJudgeModel(model), max_images=10, result_data=result
+						),
+						timeout=180,  # 3 minutes max for evaluation
+					)
 
 			except Exception as err:
-				logger.error(f'Comprehensive judge evaluation failed for {task_folder.name}: {err}')
+				logger.error('Comprehensive judge evaluation failed for %s: %s', task_folder.name, err)
+				err_msg = f'Comprehensive judge error: {type(err).__name__}: {err}'
 				return {
 					'task_id': task_folder.name,
-					'judgement': f'Comprehensive judge error: {type(err).__name__}: {err}',
+					'judgement': err_msg,
 					'success': False,
-					'error': f'Comprehensive judge error: {type(err).__name__}: {err}',
+					'error': err_msg,
 					'score': 0.0,
 				}
 
 	except Exception as err:
+		err_msg = f'{type(err).__name__}: {err}'
 		return {
 			'task_id': task_folder.name,
-			'judgement': f'Evaluation failed: {type(err).__name__}: {err}',
+			'judgement': f'Evaluation failed: {err_msg}',
 			'success': False,
-			'error': f'{type(err).__name__}: {err}',
+			'error': err_msg,
 			'score': 0.0,
 		}
 
 
-async def run_stage(stage: Stage, stage_func, timeout: int | None = None):
+T = TypeVar('T')
+
+
+async def run_stage(stage: Stage, stage_awaitable: Awaitable[T], timeout: int | None = None) -> T:
 	"""Generic stage runner with timeout"""
 	if timeout:
-		return await asyncio.wait_for(stage_func(), timeout)
-	return await stage_func()
+		return await asyncio.wait_for(stage_awaitable, timeout)
+	return await stage_awaitable
+
+
+_EMPTY_STORAGE_STATE = b'{"cookies": [], "origins": []}'
+
+
+def _create_file_if_missing(path: Path, content: bytes) -> None:
+	"""Create path with content unless it already exists; O_EXCL makes the check and the create one syscall"""
+	try:
+		fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+	except FileExistsError:
+		return
+	try:
+		os.write(fd, content)
+	finally:
+		os.close(fd)
+
+
+class BrowserPool:
+	"""
+	Warm local browsers reused across tasks.
+
+	Each acquired session gets a fresh incognito BrowserContext in an idle (or newly launched) browser, so tasks
+	keep the "no persistent state" guarantee while skipping Chromium startup. Released browsers are kept for the
+	next task, up to max_idle per launch configuration; max_idle=0 disables pooling.
+	"""
+
+	def __init__(self, max_idle: int = 4):
+		self.max_idle = max_idle
+		self._playwright = None
+		self._playwright_lock = asyncio.Lock()  # tasks launching concurrently must share one playwright driver
+		self._idle: dict[bool, list] = {}  # headless -> idle playwright Browsers
+		self._leases: dict[int, tuple[bool, Any, Any]] = {}  # id(session) -> (headless, browser, context)
+
+	@property
+	def enabled(self) -> bool:
+		return self.max_idle > 0
+
+	def owns(self, browser_session: BrowserSession) -> bool:
+		return id(browser_session) in self._leases
+
+	async def _launch(self, profile: BrowserProfile):
+		async with self._playwright_lock:
+			if self._playwright is None:
+				from playwright.async_api import async_playwright
+
+				self._playwright = await async_playwright().start()
+		# devtools is not accepted by BrowserType.launch() in current playwright releases
+		launch_kwargs = profile.kwargs_for_launch().model_dump(mode='json', exclude={'devtools'})
+		return await self._playwright.chromium.launch(**launch_kwargs)
+
+	async def acquire(self, profile: BrowserProfile) -> BrowserSession:
+		"""Start a session on a pooled browser with its own fresh context"""
+		headless = bool(profile.headless)
+		idle = self._idle.setdefault(headless, [])
+		browser = None
+		while idle and browser is None:
+			candidate = idle.pop()
+			if candidate.is_connected():
+				browser = candidate
+			else:
+				await self._close_browser(candidate)
+		if browser is None:
+			browser = await self._launch(profile)
+
+		try:
+			context = await browser.new_context(**profile.kwargs_for_new_context().model_dump(mode='json'))
+		except BaseException:
+			# The browser is no longer tracked by the pool, so it must not be leaked
+			await self._close_browser(browser)
+			raise
+		browser_session = BrowserSession(browser_profile=profile, browser=browser, browser_context=context)
+		self._leases[id(browser_session)] = (headless, browser, context)
+		try:
+			await browser_session.start()
+		except BaseException:
+			await self.release(browser_session)
+			raise
+		return browser_session
+
+	async def release(self, browser_session: BrowserSession) -> None:
+		"""Dispose of the session's context and return its browser to the pool"""
+		headless, browser, context = self._leases.pop(id(browser_session))
+		try:
+			# keep_alive sessions only detach here, the pool closes the context and keeps the browser
+			await asyncio.wait_for(browser_session.stop(), timeout=30)
+		except Exception as e:
+			logger.warning(f'Browser pool: Failed to stop task session: {type(e).__name__}: {e}')
+		try:
+			await asyncio.wait_for(context.close(), timeout=30)
+		except Exception as e:
+			logger.warning(f'Browser pool: Failed to close task context: {type(e).__name__}: {e}')
+		idle = self._idle.setdefault(headless, [])
+		if browser.is_connected() and len(idle) < self.max_idle:
+			idle.append(browser)
+		else:
+			await self._close_browser(browser)
+
+	@staticmethod
+	async def _close_browser(browser) -> None:
+		try:
+			await asyncio.wait_for(browser.close(), timeout=30)
+		except Exception as e:
+			logger.warning(f'Browser pool: Failed to close browser: {type(e).__name__}: {e}')
+
+	async def close(self) -> None:
+		"""Close all idle browsers and the pool's playwright driver"""
+		idle_browsers = [browser for browsers in self._idle.values() for browser in browsers]
+		self._idle.clear()
+		await asyncio.gather(*[self._close_browser(browser) for browser in idle_browsers])
+		if self._playwright is not None:
+			await self._playwright.stop()
+			self._playwright = None
+
+
+# Opt-in (EVAL_BROWSER_POOL_SIZE>0): every task launches its own browser by default
+_BROWSER_POOL = BrowserPool(max_idle=int(os.getenv('EVAL_BROWSER_POOL_SIZE', '0')))
 
 
 async def setup_browser_session(
-	task: Task, headless: bool, highlight_elements: bool = True, browser: str = 'local'
+	task: Task, headless: bool, highlight_elements: bool = True, browser: str = 'local', task_folder: Path | None = None
 ) -> BrowserSession:
-	"""Setup browser session for the task"""
+	"""Setup browser session for the task, keeping login task state under task_folder (saved_trajectories/<task_id> by default)"""
 
 	# Validate browser option
 	valid_browsers = ['local', 'anchor-browser', 'brightdata', 'browser-use']
@@ -1471,7 +2370,7 @@ async def setup_browser_session(
 		if ANCHOR_BROWSER_API_KEY:
 			try:
 				logger.debug(f'Browser setup: Creating Anchor Browser session for task {task.task_id}')
-				cdp_url = await asyncio.to_thread(create_anchor_browser_session, headless)
+				cdp_url = await create_anchor_browser_session(headless)
 			except Exception as e:
 				logger.error(
 					f'Browser setup: Failed to create Anchor Browser session for task {task.task_id}: {type(e).__name__}: {e}'
@@ -1509,23 +2408,22 @@ async def setup_browser_session(
 		# ignore_https_errors=True,  # some eval tasks have http:// or broken https sites in them
 	}
 
-	if hasattr(task, 'login_cookie') and task.login_cookie:
+	if task.is_login_task:
 		# For login tasks, configure storage_state to save cookies to JSON file
 		# Don't set user_data_dir=None for login tasks to avoid conflict
-		task_folder = Path(f'saved_trajectories/{task.task_id}')
-		task_folder.mkdir(parents=True, exist_ok=True)
+		task_folder = task_folder or Path('saved_trajectories') / task.task_id
+		# Creating the downloads dir creates the task folder along with it
+		downloads_dir_path = task_folder / 'downloads'
+		downloads_dir_path.mkdir(parents=True, exist_ok=True)
 
 		storage_state_path = task_folder / 'storage_state.json'
 		# Create empty storage state file if it doesn't exist to avoid FileNotFoundError
-		if not storage_state_path.exists():
-			storage_state_path.write_text(json.dumps({'cookies': [], 'origins': []}))
+		_create_file_if_missing(storage_state_path, _EMPTY_STORAGE_STATE)
 
 		profile_kwargs['storage_state'] = str(storage_state_path)
 		# Remove user_data_dir=None for login tasks to avoid conflict with storage_state
 		profile_kwargs.pop('user_data_dir', None)
 
-		downloads_dir_path = task_folder / 'downloads'
-		downloads_dir_path.mkdir(parents=True, exist_ok=True)
 		profile_kwargs['downloads_path'] = str(downloads_dir_path)
 
 		logger.debug(f'Login task {task.task_id}: Configured to save cookies to {storage_state_path}')
@@ -1535,6 +2433,12 @@ async def setup_browser_session(
 	if cdp_url:
 		logger.debug(f'Browser setup: Using CDP Browser for task {task.task_id}')
 		browser_session = BrowserSession(browser_profile=profile, cdp_url=cdp_url)
+	elif _BROWSER_POOL.enabled and 'storage_state' not in profile_kwargs:
+		# Local non-login tasks run in a fresh context on a warm pooled browser; login tasks keep their own browser
+		logger.debug(f'Browser setup: Acquiring pooled browser for task {task.task_id}')
+		browser_session = await _BROWSER_POOL.acquire(profile)
+		logger.debug(f'Browser setup: Setup completed for task {task.task_id}')
+		return browser_session
 	else:
 		# Use local browser
 		logger.debug(f'Browser setup: Initializing BrowserSession for task {task.task_id}')
@@ -1585,7 +2489,7 @@ async def run_agent_with_browser(
 		)
 
 	# Set up login cookie monitoring if this is a login task
-	is_login_task = hasattr(task, 'login_cookie') and task.login_cookie
+	is_login_task = task.is_login_task
 	new_step_callback = None
 
 	if is_login_task:
@@ -1637,18 +2541,23 @@ async def run_agent_with_browser(
 
 @observe(name='evaluate_task_result', span_type='EVALUATOR')  # type: ignore[arg-type]
 async def evaluate_task_result(
-	eval_model: BaseChatModel, task_folder: Path, task: Task | None = None, use_mind2web: bool = False
+	eval_model: BaseChatModel,
+	task_folder: Path,
+	task: Task | None = None,
+	use_mind2web: bool = False,
+	login_tracking: dict | None = None,
 ) -> dict:
 	"""Evaluate the task result"""
 	# Check if this is a login task that should use both cookie-based and judge evaluation
-	if task and hasattr(task, 'login_cookie') and task.login_cookie:
+	# (task.is_login_task, spelled out so the cookie is known to be set)
+	if task and task.login_cookie:
 		logger.info(f'Using combined cookie-based and judge evaluation for login task {task.task_id}')
 
 		# First run the judge evaluation to get comprehensive feedback
 		judge_result = await judge_task_result(eval_model, task_folder, score_threshold=3, use_mind2web=use_mind2web)
 
 		# Then run the cookie-based evaluation to get the actual score
-		cookie_result = await evaluate_task_with_login_cookie(task.login_cookie, task_folder)
+		cookie_result = await evaluate_task_with_login_cookie(task.login_cookie, task_folder, tracking_override=login_tracking)
 
 		# Use the score from cookie_result to overwrite judge_result
 		judge_result['score'] = cookie_result['score']
@@ -1666,7 +2575,60 @@ async def evaluate_task_result(
 		return await judge_task_result(eval_model, task_folder, score_threshold=3, use_mind2web=use_mind2web)
 
 
-async def evaluate_task_with_login_cookie(login_cookie: str, task_folder: Path) -> dict:
+def _read_json_if_exists(path: Path) -> Any:
+	"""Parse a JSON file with orjson, None if it doesn't exist"""
+	try:
+		data = path.read_bytes()
+	except FileNotFoundError:
+		return None
+	return orjson.loads(data)
+
+
+def _find_cookie_containing(cookies: list[dict], target: str) -> dict | None:
+	"""First cookie whose name or value contains target, found with one C-level scan over all names and values"""
+	if not cookies:
+		return None
+	# NUL-separated name/value fields, so a match can't span two fields
+	blob = '\x00'.join(field for cookie in cookies for field in (cookie.get('name', ''), cookie.get('value', '')))
+	index = blob.find(target)
+	if index == -1:
+		return None
+	return cookies[blob.count('\x00', 0, index) // 2]
+
+
+def _tracking_evaluation(task_id: str, login_cookie: str, tracking_data: dict) -> dict | None:
+	"""Evaluation result from step-by-step tracking data, None if the cookie wasn't found during execution"""
+	if not tracking_data.get('found', False):
+		return None
+
+	# Cookie was found during execution!
+	step_found = tracking_data.get('step', 'unknown')
+	match_type = tracking_data.get('match_type', 'unknown')
+	cookie_name = tracking_data.get('cookie_name', 'unknown')
+
+	success = True
+	score = 1.0
+	judgement = f"Automatic judgement: Login cookie '{login_cookie}' was found during step {step_found} ({match_type} match on '{cookie_name}')"
+	error = None
+
+	logger.info(f"✅ Cookie evaluation result from step tracking: success={success} for login_cookie='{login_cookie}'")
+
+	return {
+		'task_id': task_id,
+		'judgement': judgement,
+		'success': success,
+		'error': error,
+		'score': score,
+		'tracking_data': tracking_data,
+	}
+
+
+async def _read_json_files(*paths: Path) -> list[Any]:
+	"""Read JSON files concurrently; missing files come back as None and failures as the raised exception"""
+	return await asyncio.gather(*[anyio.to_thread.run_sync(_read_json_if_exists, path) for path in paths], return_exceptions=True)
+
+
+async def evaluate_task_with_login_cookie(login_cookie: str, task_folder: Path, tracking_override: dict | None = None) -> dict:
 	"""
 	Evaluate a login task by checking if the login_cookie is present in browser cookies.
 
@@ -1676,73 +2638,60 @@ async def evaluate_task_with_login_cookie(login_cookie: str, task_folder: Path)
 	Args:
 	    login_cookie: String identifier that should appear in cookies if login was successful
 	    task_folder: Path to the task result folder containing saved cookies
+	    tracking_override: Tracking data saved earlier in this process; when given, login_cookie_tracking.json isn't read
 
 	Returns:
 	    Dictionary containing evaluation results similar to Online_Mind2Web_eval format
 	"""
 	task_id = task_folder.name
 
-	# First, check if we have step-by-step tracking data
 	tracking_file = task_folder / 'login_cookie_tracking.json'
-	if tracking_file.exists():
-		try:
-			async with await anyio.open_file(tracking_file) as f:
-				tracking_data = json.loads(await f.read())
-
-			if tracking_data.get('found', False):
-				# Cookie was found during execution!
-				step_found = tracking_data.get('step', 'unknown')
-				match_type = tracking_data.get('match_type', 'unknown')
-				cookie_name = tracking_data.get('cookie_name', 'unknown')
-
-				success = True
-				score = 1.0
-				judgement = f"Automatic judgement: Login cookie '{login_cookie}' was found during step {step_found} ({match_type} match on '{cookie_name}')"
-				error = None
-
-				logger.info(
-					f"✅ Cookie evaluation result from step tracking: success={success} for login_cookie='{login_cookie}'"
-				)
+	cookies_file = task_folder / 'cookies.json'
+	storage_state_file = task_folder / 'storage_state.json'
 
-				return {
-					'task_id': task_id,
-					'judgement': judgement,
-					'success': success,
-					'error': error,
-					'score': score,
-					'tracking_data': tracking_data,
-				}
-		except Exception as e:
-			logger.warning(f'Failed to load login cookie tracking: {e}')
+	# First, check if we have step-by-step tracking data
+	if tracking_override is not None:
+		evaluation = _tracking_evaluation(task_id, login_cookie, tracking_override)
+		if evaluation is not None:
+			return evaluation
+		storage_state, saved_cookies = await _read_json_files(storage_state_file, cookies_file)
+	else:
+		# Resumed / separate-process evaluation: read the tracking file and both cookie files concurrently
+		tracking_data, storage_state, saved_cookies = await _read_json_files(tracking_file, storage_state_file, cookies_file)
+		if isinstance(tracking_data, BaseException):
+			logger.warning(f'Failed to load login cookie tracking: {tracking_data}')
+		elif tracking_data is not None:
+			try:
+				evaluation = _tracking_evaluation(task_id, login_cookie, tracking_data)
+				if evaluation is not None:
+					return evaluation
+			except Exception as e:
+				logger.warning(f'Failed to load login cookie tracking: {e}')
 
 	# Fallback to end-state cookie checking (original behavior)
 	logger.info(f'🔄 No step-by-step tracking found for task {task_id}, falling back to end-state cookie checking')
 
-	# Look for cookies in saved_trajectories (saved by browser-use during shutdown)
-	cookies_file = task_folder / 'cookies.json'
-	storage_state_file = task_folder / 'storage_state.json'
-
+	# Cookies in saved_trajectories are saved by browser-use during shutdown
 	cookies_data = None
 	cookies_source = None
 
 	# Try to load cookies from storage_state.json first (newer format)
-	if storage_state_file.exists():
+	if isinstance(storage_state, BaseException):
+		logger.warning(f'Failed to load storage_state.json: {storage_state}')
+	elif storage_state is not None:
 		try:
-			async with await anyio.open_file(storage_state_file) as f:
-				storage_state = json.loads(await f.read())
-				cookies_data = storage_state.get('cookies', [])
-				cookies_source = 'storage_state.json'
+			cookies_data = storage_state.get('cookies', [])
+			cookies_source = 'storage_state.json'
 		except Exception as e:
 			logger.warning(f'Failed to load storage_state.json: {e}')
 
 	# Fallback to cookies.json (older format)
-	if not cookies_data and cookies_file.exists():
-		try:
-			async with await anyio.open_file(cookies_file) as f:
-				cookies_data = json.loads(await f.read())
-				cookies_source = 'cookies.json'
-		except Exception as e:
-			logger.warning(f'Failed to load cookies.json: {e}')
+	if not cookies_data and saved_cookies is not None:
+		if isinstance(saved_cookies, BaseException):
+			logger.warning(f'Failed to load cookies.json: {saved_cookies}')
+		else:
+			cookies_data = saved_cookies
+			cookies_source = 'cookies.json'
 
 	if not cookies_data:
 		return {
@@ -1769,27 +2718,21 @@ async def evaluate_task_with_login_cookie(login_cookie: str, task_folder: Path)
 		logger.debug(f"Using substring matching for: '{login_cookie}'")
 
 	# Check if login_cookie is present in cookies
-	login_cookie_found = False
 	matching_cookie_info = None
 
-	for cookie in cookies_data:
-		cookie_name = cookie.get('name', '')
-		cookie_value = cookie.get('value', '')
-
-		if is_exact_match:
-			# Exact match: check if cookie name exactly matches the target
-			if cookie_name == search_target:
-				login_cookie_found = True
-				matching_cookie_info = f"exact name match='{cookie_name}'"
-				logger.debug(f'Login cookie found with exact match: {matching_cookie_info}')
-				break
-		else:
-			# Substring match: check if target appears in cookie name or value
-			if search_target in cookie_name or search_target in cookie_value:
-				login_cookie_found = True
-				matching_cookie_info = f"substring match in name='{cookie_name}'"
-				logger.debug(f'Login cookie found with substring match: {matching_cookie_info}')
-				break
+	if is_exact_match:
+		# Exact match: check if cookie name exactly matches the target
+		matching_cookie = next((cookie for cookie in cookies_data if cookie.get('name', '') == search_target), None)
+		if matching_cookie is not None:
+			matching_cookie_info = f"exact name match='{matching_cookie.get('name', '')}'"
+			logger.debug(f'Login cookie found with exact match: {matching_cookie_info}')
+	else:
+		# Substring match: check if target appears in cookie name or value
+		matching_cookie = _find_cookie_containing(cookies_data, search_target)
+		if matching_cookie is not None:
+			matching_cookie_info = f"substring match in name='{matching_cookie.get('name', '')}'"
+			logger.debug(f'Login cookie found with substring match: {matching_cookie_info}')
+	login_cookie_found = matching_cookie is not None
 
 	# Prepare evaluation result
 	if login_cookie_found:
@@ -1824,13 +2767,12 @@ async def evaluate_task_with_login_cookie(login_cookie: str, task_folder: Path)
 	}
 
 
-def save_result_to_server(convex_url: str, secret_key: str, payload: dict) -> bool:
-	"""Save result to server (sync function for use with asyncio.to_thread)"""
-	return save_task_result_to_server(convex_url, secret_key, payload)
-
-
 async def cleanup_browser_safe(browser_session: BrowserSession):
 	"""Safe browser cleanup with timeout"""
+	if _BROWSER_POOL.owns(browser_session):
+		logger.debug('Browser cleanup: Returning pooled browser')
+		await _BROWSER_POOL.release(browser_session)
+		return
 	try:
 		logger.debug('Browser cleanup: Starting close operation for session')
 		await asyncio.wait_for(browser_session.kill(), timeout=30)
@@ -1842,19 +2784,40 @@ async def cleanup_browser_safe(browser_session: BrowserSession):
 
 
 def determine_current_stage(completed_stages: set) -> Stage:
-	"""Determine current stage based on completed stages"""
-	if Stage.SAVE_SERVER in completed_stages:
-		return Stage.SAVE_SERVER
-	elif Stage.EVALUATE in completed_stages:
-		return Stage.EVALUATE
-	elif Stage.FORMAT_HISTORY in completed_stages:
-		return Stage.FORMAT_HISTORY
-	elif Stage.RUN_AGENT in completed_stages:
-		return Stage.RUN_AGENT
-	elif Stage.SETUP_BROWSER in completed_stages:
-		return Stage.SETUP_BROWSER
-	else:
-		return Stage.SETUP_BROWSER  # Default starting stage
+	"""Determine current stage based on completed stages: the furthest completed stage in pipeline order"""
+	return max(
+		(stage for stage in _STAGE_ORDER if stage in completed_stages),
+		key=_STAGE_ORDER.index,
+		default=Stage.SETUP_BROWSER,  # Default starting stage
+	)
+
+
+class TrackedSemaphore:
+	"""asyncio.Semaphore that counts its holders, so slot usage can be logged without reading private state"""
+
+	__slots__ = ('_sem', '_in_flight', 'limit')
+
+	def __init__(self, limit: int):
+		self._sem = asyncio.Semaphore(limit)
+		self._in_flight = 0
+		self.limit = limit
+
+	@property
+	def in_flight(self) -> int:
+		return self._in_flight
+
+	@property
+	def available(self) -> int:
+		return self.limit - self._in_flight
+
+	async def __aenter__(self) -> 'TrackedSemaphore':
+		await self._sem.acquire()
+		self._in_flight += 1
+		return self
+
+	async def __aexit__(self, *exc_info) -> None:
+		self._in_flight -= 1
+		self._sem.release()
 
 
 @observe(name='evaluation', span_type='EVALUATION')  # type: ignore[arg-type]
@@ -1870,8 +2833,9 @@ async def run_task_with_semaphore(
 	max_steps_per_task: int,
 	headless: bool,
 	use_vision: bool,
-	semaphore_runs: asyncio.Semaphore,  # Pass semaphore as argument
+	semaphore_runs: TrackedSemaphore,  # Pass semaphore as argument
 	auth_distribution: dict | None = None,  # Pre-fetched auth distribution
+	auth_info_cache: dict[tuple[str, ...], str] | None = None,  # auth_keys -> formatted auth info, shared by the run
 	github_workflow_url: str | None = None,
 	use_serp: bool = False,
 	browser: str = 'local',
@@ -1889,8 +2853,8 @@ async def run_task_with_semaphore(
 ) -> dict:
 	"""Clean pipeline approach for running tasks"""
 	task_start_time = time.time()
-	logger.info(f'🚀 Task {task.task_id}: Starting execution pipeline')
-	logger.info(f'📊 Task {task.task_id}: Waiting to acquire semaphore (current available: ~{semaphore_runs._value})')
+	logger.info('🚀 Task %s: Starting execution pipeline', task.task_id)
+	logger.info('📊 Task %s: Waiting to acquire semaphore (current available: %s)', task.task_id, semaphore_runs.available)
 	log_system_resources(f'TASK_START_{task.task_id}')
 
 	semaphore_acquired_time = None
@@ -1898,21 +2862,40 @@ async def run_task_with_semaphore(
 		semaphore_acquired_time = time.time()
 		wait_time = semaphore_acquired_time - task_start_time
 		logger.info(
-			f'✅ Task {task.task_id}: Semaphore acquired after {wait_time:.2f}s (remaining slots: ~{semaphore_runs._value})'
+			'✅ Task %s: Semaphore acquired after %.2fs (remaining slots: %s)', task.task_id, wait_time, semaphore_runs.available
 		)
 		log_system_resources(f'SEMAPHORE_ACQUIRED_{task.task_id}')
 
 		task_result = None
 		browser_session = None
+		cleanup_task = None  # Browser cleanup started once the agent is done with the browser
 		laminar_task_link = None
 		datapoint_id = None
 		agent_execution_time = None  # Track agent execution time separately
 
+		async def _emergency_save(task_result: TaskResult, reason: str) -> None:
+			"""Attempt to save the result to the server after the pipeline was interrupted"""
+			try:
+				logger.info('Task %s: Attempting server save after %s.', task.task_id, reason)
+				await run_stage(
+					Stage.SAVE_SERVER,
+					_RESULT_UPLOADER.submit(convex_url, secret_key, task_result.server_payload),
+					timeout=30,  # Shorter timeout for emergency save
+				)
+				task_result.stage_completed(Stage.SAVE_SERVER)
+			except Exception as save_e:
+				task_result.mark_server_save_failed(str(save_e))
+				logger.error(f'Task {task.task_id}: Emergency server save after {reason} failed: {str(save_e)}')
+
 		try:
+			# Parsed once and reused for both the datapoint creation and the score update
+			lmnr_run_uuid = None
 			if lmnr_run_id:
 				try:
+					lmnr_run_uuid = UUID(lmnr_run_id)
+					trace_id = Laminar.get_trace_id()
 					datapoint_id = await laminar_client.evals.create_datapoint(
-						eval_id=UUID(lmnr_run_id),
+						eval_id=lmnr_run_uuid,
 						data={
 							'task_id': task.task_id,
 							'confirmed_task': task.confirmed_task,
@@ -1933,27 +2916,27 @@ async def run_task_with_semaphore(
 							'planner_interval': str(planner_interval),
 							'include_result': str(include_result),
 						},
-						trace_id=Laminar.get_trace_id(),
+						trace_id=trace_id,
 					)
 					# Only create task-specific link if we have the evaluation link
 					if laminar_eval_link:
-						laminar_task_link = f'{laminar_eval_link}?traceId={Laminar.get_trace_id()}&datapointId={datapoint_id}'
-						logger.info(f'Task {task.task_id}: Laminar link: {laminar_task_link}')
+						laminar_task_link = f'{laminar_eval_link}?traceId={trace_id}&datapointId={datapoint_id}'
+						logger.info('Task %s: Laminar link: %s', task.task_id, laminar_task_link)
 					else:
-						logger.debug(f'Task {task.task_id}: No Laminar evaluation link available, task link not created')
+						logger.debug('Task %s: No Laminar evaluation link available, task link not created', task.task_id)
 				except Exception as e:
 					logger.warning(f'Task {task.task_id}: Failed to create Laminar datapoint: {type(e).__name__}: {e}')
 			else:
-				logger.debug(f'Task {task.task_id}: No Laminar run ID available, skipping datapoint creation')
+				logger.debug('Task %s: No Laminar run ID available, skipping datapoint creation', task.task_id)
 
 				# Initialize task result and basic setup
 			task_result = TaskResult(
 				task.task_id, run_id, task.confirmed_task, task, max_steps_per_task, laminar_task_link, github_workflow_url
 			)
 
-			task_folder = Path(f'saved_trajectories/{task.task_id}')
+			task_folder = Path('saved_trajectories') / task.task_id
 
-			logger.info(f'Task {task.task_id}: Starting execution pipeline.')
+			logger.info('Task %s: Starting execution pipeline.', task.task_id)
 
 			# Send initial progress update to show task is starting
 			send_progress_update(convex_url, secret_key, run_id, task.task_id, 'starting', 'active', github_workflow_url)
@@ -1963,7 +2946,7 @@ async def run_task_with_semaphore(
 
 				# Stage 1: Setup browser
 				try:
-					logger.info(f'Task {task.task_id}: Browser setup starting.')
+					logger.info('Task %s: Browser setup starting.', task.task_id)
 					# Send progress update for starting browser setup
 					send_progress_update(
 						convex_url, secret_key, run_id, task.task_id, 'setup_browser', 'active', github_workflow_url
@@ -1971,30 +2954,38 @@ async def run_task_with_semaphore(
 
 					browser_session = await run_stage(
 						Stage.SETUP_BROWSER,
-						lambda: setup_browser_session(task, headless, highlight_elements, browser),
+						setup_browser_session(task, headless, highlight_elements, browser, task_folder=task_folder),
 						timeout=120,
 					)
 					task_result.stage_completed(Stage.SETUP_BROWSER)
-					logger.info(f'Task {task.task_id}: Browser session started successfully.')
+					logger.info('Task %s: Browser session started successfully.', task.task_id)
 
 					# Send progress update for completed browser setup
 					send_progress_update(
 						convex_url, secret_key, run_id, task.task_id, 'browser_ready', 'active', github_workflow_url
 					)
 				except Exception as e:
-					error = StageError(Stage.SETUP_BROWSER, 'exception', str(e))
-					task_result.stage_failed(Stage.SETUP_BROWSER, error)
-					logger.error(f'Task {task.task_id}: Browser setup failed: {str(e)}')
+					err_msg = str(e)
+					task_result.stage_failed(Stage.SETUP_BROWSER, StageError(Stage.SETUP_BROWSER, 'exception', err_msg))
+					logger.error('Task %s: Browser setup failed: %s', task.task_id, err_msg)
 					# Send error progress update
 					send_progress_update(
-						convex_url, secret_key, run_id, task.task_id, 'setup_browser', 'failed', github_workflow_url, None, str(e)
+						convex_url,
+						secret_key,
+						run_id,
+						task.task_id,
+						'setup_browser',
+						'failed',
+						github_workflow_url,
+						None,
+						err_msg,
 					)
 					# Continue to server save instead of early return
 
 				# Stage 2: Run agent
 				if browser_session:  # Only run agent if browser setup succeeded
 					try:
-						logger.info(f'Task {task.task_id}: Agent run starting.')
+						logger.info('Task %s: Agent run starting.', task.task_id)
 						# Send progress update for starting agent run
 						send_progress_update(
 							convex_url, secret_key, run_id, task.task_id, 'run_agent', 'active', github_workflow_url
@@ -2007,22 +2998,24 @@ async def run_task_with_semaphore(
 							if isinstance(task.auth_keys, list) and len(task.auth_keys) > 0:
 								if auth_distribution:
 									logger.info(
-										f'Task {task.task_id}: Using pre-fetched auth distribution for auth_keys: {task.auth_keys}'
+										'Task %s: Using pre-fetched auth distribution for auth_keys: %s',
+										task.task_id,
+										task.auth_keys,
 									)
-									auth_info_text = format_auth_info_for_agent(auth_distribution, task.auth_keys)
+									auth_key = tuple(task.auth_keys)
+									if auth_info_cache is None:
+										auth_info_text = format_auth_info_for_agent(auth_distribution, task.auth_keys)
+									else:
+										if auth_key not in auth_info_cache:
+											auth_info_cache[auth_key] = format_auth_info_for_agent(
+												auth_distribution, task.auth_keys
+											)
+										auth_info_text = auth_info_cache[auth_key]
 									if auth_info_text:
-										# Create a modified task with auth info appended
-										class TaskWithAuth(Task):
-											def __init__(self, original_task: Task, auth_text: str):
-												# Copy all attributes from original task
-												for attr_name in dir(original_task):
-													if not attr_name.startswith('__'):
-														setattr(self, attr_name, getattr(original_task, attr_name))
-												# Modify the confirmed_task to include auth info
-												self.confirmed_task = original_task.confirmed_task + auth_text
-
-										task_with_auth = TaskWithAuth(task, auth_info_text)
-										logger.info(f'Task {task.task_id}: Auth info added to task description')
+										# Shallow copy of the task with auth info appended to its description
+										task_with_auth = copy.copy(task)
+										task_with_auth.confirmed_task = task.confirmed_task + auth_info_text
+										logger.info('Task %s: Auth info added to task description', task.task_id)
 									else:
 										logger.warning(
 											f'Task {task.task_id}: No matching auth info found for keys: {task.auth_keys}'
@@ -2037,7 +3030,7 @@ async def run_task_with_semaphore(
 
 						agent_history, last_message = await run_stage(
 							Stage.RUN_AGENT,
-							lambda: run_agent_with_browser(
+							run_agent_with_browser(
 								browser_session,
 								task_with_auth,
 								llm,
@@ -2060,13 +3053,19 @@ async def run_task_with_semaphore(
 						agent_end_time = time.time()
 						agent_execution_time = agent_end_time - agent_start_time
 
+						# Nothing past the agent run needs the browser: close it while the remaining stages run.
+						# Login tasks wait for the finally block, since stopping the session rewrites storage_state.json
+						# while the login cookie evaluation reads it.
+						if not task.is_login_task:
+							cleanup_task = asyncio.create_task(cleanup_browser_safe(browser_session))
+
 						task_result.stage_completed(Stage.RUN_AGENT)
-						logger.info(f'Task {task.task_id}: Agent run completed in {agent_execution_time:.2f}s.')
+						logger.info('Task %s: Agent run completed in %.2fs.', task.task_id, agent_execution_time)
 
 						# Save login cookie tracking data if this was a login task
-						if hasattr(task, 'login_cookie') and task.login_cookie:
+						if task.is_login_task:
 							try:
-								await save_login_cookie_tracking(task_folder, task.task_id)
+								task_result.login_tracking = await save_login_cookie_tracking(task_folder, task.task_id)
 							except Exception as e:
 								logger.warning(
 									f'Failed to save login cookie tracking for task {task.task_id}: {type(e).__name__}: {e}'
@@ -2077,12 +3076,20 @@ async def run_task_with_semaphore(
 							convex_url, secret_key, run_id, task.task_id, 'agent_completed', 'active', github_workflow_url
 						)
 					except Exception as e:
-						error = StageError(Stage.RUN_AGENT, 'exception', str(e))
-						task_result.stage_failed(Stage.RUN_AGENT, error)
-						logger.error(f'Task {task.task_id}: Agent run failed: {str(e) + " " + str(e.__traceback__)}')
+						err_msg = str(e)
+						task_result.stage_failed(Stage.RUN_AGENT, StageError(Stage.RUN_AGENT, 'exception', err_msg))
+						logger.exception('Task %s: Agent run failed: %s', task.task_id, err_msg)
 						# Send error progress update
 						send_progress_update(
-							convex_url, secret_key, run_id, task.task_id, 'run_agent', 'failed', github_workflow_url, None, str(e)
+							convex_url,
+							secret_key,
+							run_id,
+							task.task_id,
+							'run_agent',
+							'failed',
+							github_workflow_url,
+							None,
+							err_msg,
 						)
 
 						# Continue to server save instead of early return
@@ -2090,10 +3097,10 @@ async def run_task_with_semaphore(
 				# Stage 3: Format history (MOVED OUTSIDE browser_session block)
 				if agent_history is not None:  # Only format if agent ran successfully
 					try:
-						logger.info(f'Task {task.task_id}: History formatting starting.')
+						logger.info('Task %s: History formatting starting.', task.task_id)
 						formatted_data = await run_stage(
 							Stage.FORMAT_HISTORY,
-							lambda: reformat_agent_history(
+							reformat_agent_history(
 								agent_history,
 								task.task_id,
 								run_id,
@@ -2104,64 +3111,61 @@ async def run_task_with_semaphore(
 							),
 						)
 						task_result.stage_completed(Stage.FORMAT_HISTORY, formatted_data)
-						logger.info(f'Task {task.task_id}: Agent history formatted.')
+						logger.info('Task %s: Agent history formatted.', task.task_id)
 					except Exception as e:
-						error = StageError(Stage.FORMAT_HISTORY, 'exception', str(e))
-						task_result.stage_failed(Stage.FORMAT_HISTORY, error)
-						logger.error(f'Task {task.task_id}: History formatting failed: {str(e)}')
+						err_msg = str(e)
+						task_result.stage_failed(Stage.FORMAT_HISTORY, StageError(Stage.FORMAT_HISTORY, 'exception', err_msg))
+						logger.error('Task %s: History formatting failed: %s', task.task_id, err_msg)
 						# Continue to server save instead of early return
 
 				# Stage 4: Evaluate (MOVED OUTSIDE browser_session block)
-				if task_result.has_execution_data() and Stage.EVALUATE not in task_result.completed_stages:
+				if task_result.has_execution_data() and not task_result.has_stage(Stage.EVALUATE):
 					try:
-						logger.info(f'Task {task.task_id}: Evaluation starting.')
+						logger.info('Task %s: Evaluation starting.', task.task_id)
 						evaluation = await run_stage(
 							Stage.EVALUATE,
-							lambda: evaluate_task_result(eval_model, task_folder, task, use_mind2web_judge),
+							evaluate_task_result(
+								eval_model, task_folder, task, use_mind2web_judge, login_tracking=task_result.login_tracking
+							),
 							timeout=300,
 						)
 						task_result.stage_completed(Stage.EVALUATE, evaluation)
-						logger.info(f'Task {task.task_id}: Evaluation completed.')
+						logger.info('Task %s: Evaluation completed.', task.task_id)
 
-						if lmnr_run_id and datapoint_id:
+						if lmnr_run_uuid and datapoint_id:
 							await laminar_client.evals.update_datapoint(
-								eval_id=UUID(lmnr_run_id),
+								eval_id=lmnr_run_uuid,
 								datapoint_id=datapoint_id,
 								scores={
 									'accuracy': evaluation['score'],
 								},
 							)
 					except Exception as e:
-						error = StageError(Stage.EVALUATE, 'exception', str(e))
-						task_result.stage_failed(Stage.EVALUATE, error)
-						logger.error(f'Task {task.task_id}: Evaluation failed: {str(e)}')
+						err_msg = str(e)
+						task_result.stage_failed(Stage.EVALUATE, StageError(Stage.EVALUATE, 'exception', err_msg))
+						logger.error('Task %s: Evaluation failed: %s', task.task_id, err_msg)
 
 				# Stage 5: Save to server (MOVED OUTSIDE browser_session block - ALWAYS attempt)
 				try:
-					logger.info(f'Task {task.task_id}: Saving result to server.')
+					logger.info('Task %s: Saving result to server.', task.task_id)
 					# Only save to server if URLs are provided (skip for single task mode)
 					if convex_url and secret_key:
 						await run_stage(
 							Stage.SAVE_SERVER,
-							lambda: asyncio.to_thread(
-								save_result_to_server,
-								convex_url,
-								secret_key,
-								task_result.server_payload if task_result else {},
-							),
+							_RESULT_UPLOADER.submit(convex_url, secret_key, task_result.server_payload if task_result else {}),
 							timeout=60,
 						)
 						task_result.stage_completed(Stage.SAVE_SERVER)
-						logger.info(f'Task {task.task_id}: Successfully saved result to server.')
+						logger.info('Task %s: Successfully saved result to server.', task.task_id)
 					else:
 						# Single task mode - skip server save but mark as completed
-						logger.info(f'Task {task.task_id}: Skipping server save (single task mode)')
+						logger.info('Task %s: Skipping server save (single task mode)', task.task_id)
 						task_result.stage_completed(Stage.SAVE_SERVER)
 				except Exception as e:
-					error = StageError(Stage.SAVE_SERVER, 'exception', str(e))
-					task_result.stage_failed(Stage.SAVE_SERVER, error)
-					task_result.mark_server_save_failed(str(e))
-					logger.error(f'Task {task.task_id}: Server save failed: {str(e)}')
+					err_msg = str(e)
+					task_result.stage_failed(Stage.SAVE_SERVER, StageError(Stage.SAVE_SERVER, 'exception', err_msg))
+					task_result.mark_server_save_failed(err_msg)
+					logger.error('Task %s: Server save failed: %s', task.task_id, err_msg)
 
 			except TimeoutError:
 				current_stage = determine_current_stage(task_result.completed_stages)
@@ -2169,58 +3173,20 @@ async def run_task_with_semaphore(
 				task_result.stage_failed(current_stage, error)
 				logger.error(f'Task {task.task_id}: {current_stage.value} timed out')
 
-				# Attempt to save result even if timeout occurred
-				try:
-					logger.info(f'Task {task.task_id}: Attempting server save after timeout.')
-					await run_stage(
-						Stage.SAVE_SERVER,
-						lambda: asyncio.to_thread(
-							save_result_to_server, convex_url, secret_key, task_result.server_payload if task_result else {}
-						),
-						timeout=30,  # Shorter timeout for emergency save
-					)
-					task_result.stage_completed(Stage.SAVE_SERVER)
-				except Exception as save_e:
-					task_result.mark_server_save_failed(str(save_e))
-					logger.error(f'Task {task.task_id}: Emergency server save after timeout failed: {str(save_e)}')
+				await _emergency_save(task_result, 'timeout')
 
 			except asyncio.CancelledError:
 				task_result.mark_cancelled()
 				logger.warning(f'Task {task.task_id}: Task was cancelled')
 
-				# Attempt to save result even if cancelled
-				try:
-					logger.info(f'Task {task.task_id}: Attempting server save after cancellation.')
-					await run_stage(
-						Stage.SAVE_SERVER,
-						lambda: asyncio.to_thread(
-							save_result_to_server, convex_url, secret_key, task_result.server_payload if task_result else {}
-						),
-						timeout=30,  # Shorter timeout for emergency save
-					)
-					task_result.stage_completed(Stage.SAVE_SERVER)
-				except Exception as save_e:
-					task_result.mark_server_save_failed(str(save_e))
-					logger.error(f'Task {task.task_id}: Emergency server save after cancellation failed: {str(save_e)}')
+				await _emergency_save(task_result, 'cancellation')
 
 			except Exception as e:
-				task_result.mark_critical_error(str(e))
-				logger.critical(f'Task {task.task_id}: Critical error: {str(e)}', exc_info=True)
+				err_msg = str(e)
+				task_result.mark_critical_error(err_msg)
+				logger.critical('Task %s: Critical error: %s', task.task_id, err_msg, exc_info=True)
 
-				# Attempt to save result even if critical error occurred
-				try:
-					logger.info(f'Task {task.task_id}: Attempting server save after critical error.')
-					await run_stage(
-						Stage.SAVE_SERVER,
-						lambda: asyncio.to_thread(
-							save_result_to_server, convex_url, secret_key, task_result.server_payload if task_result else {}
-						),
-						timeout=30,  # Shorter timeout for emergency save
-					)
-					task_result.stage_completed(Stage.SAVE_SERVER)
-				except Exception as save_e:
-					task_result.mark_server_save_failed(str(save_e))
-					logger.error(f'Task {task.task_id}: Emergency server save after critical error failed: {str(save_e)}')
+				await _emergency_save(task_result, 'critical error')
 
 		except Exception as init_error:
 			# Handle catastrophic initialization errors
@@ -2249,21 +3215,22 @@ async def run_task_with_semaphore(
 
 			# Try emergency server save
 			try:
-				logger.info(f'Task {task.task_id}: Attempting emergency server save after initialization error.')
-				await asyncio.to_thread(
-					save_result_to_server, convex_url, secret_key, task_result.server_payload if task_result else {}
-				)
+				logger.info('Task %s: Attempting emergency server save after initialization error.', task.task_id)
+				await _RESULT_UPLOADER.submit(convex_url, secret_key, task_result.server_payload if task_result else {})
 			except Exception as save_e:
 				logger.error(f'Task {task.task_id}: Emergency server save after initialization error failed: {str(save_e)}')
 
 		finally:
 			# Always cleanup browser if it was created
 			if browser_session:
-				logger.info(f'Task {task.task_id}: Starting browser cleanup')
-				await cleanup_browser_safe(browser_session)
-				logger.info(f'Task {task.task_id}: Browser cleanup completed')
+				if cleanup_task is None:
+					logger.info('Task %s: Starting browser cleanup', task.task_id)
+					cleanup_task = asyncio.create_task(cleanup_browser_safe(browser_session))
+				# Shielded so cancelling the pipeline doesn't abandon the browser mid-cleanup
+				await asyncio.shield(cleanup_task)
+				logger.info('Task %s: Browser cleanup completed', task.task_id)
 			else:
-				logger.info(f'Task {task.task_id}: No browser to cleanup')
+				logger.info('Task %s: No browser to cleanup', task.task_id)
 
 		task_end_time = time.time()
 		total_task_time = task_end_time - task_start_time
@@ -2272,14 +3239,23 @@ async def run_task_with_semaphore(
 		# Log both pipeline time and agent execution time
 		if agent_execution_time is not None:
 			logger.info(
-				f'🏁 Task {task.task_id}: Agent executed in {agent_execution_time:.2f}s (total pipeline: {total_task_time:.2f}s, semaphore held: {semaphore_hold_time:.2f}s)'
+				'🏁 Task %s: Agent executed in %.2fs (total pipeline: %.2fs, semaphore held: %.2fs)',
+				task.task_id,
+				agent_execution_time,
+				total_task_time,
+				semaphore_hold_time,
 			)
 		else:
 			logger.info(
-				f'🏁 Task {task.task_id}: Pipeline completed in {total_task_time:.2f}s (agent did not run, semaphore held: {semaphore_hold_time:.2f}s)'
+				'🏁 Task %s: Pipeline completed in %.2fs (agent did not run, semaphore held: %.2fs)',
+				task.task_id,
+				total_task_time,
+				semaphore_hold_time,
 			)
 
-		logger.info(f'📊 Task {task.task_id}: About to release semaphore (remaining slots will be: ~{semaphore_runs._value + 1})')
+		logger.info(
+			'📊 Task %s: About to release semaphore (remaining slots will be: %s)', task.task_id, semaphore_runs.available + 1
+		)
 		log_system_resources(f'TASK_END_{task.task_id}')
 
 		final_result = (
@@ -2289,7 +3265,10 @@ async def run_task_with_semaphore(
 		)
 
 		logger.info(
-			f'🎯 Task {task.task_id}: Final status - Success: {final_result.get("success", False)}, Error: {final_result.get("error", "None")}'
+			'🎯 Task %s: Final status - Success: %s, Error: %s',
+			task.task_id,
+			final_result.get('success', False),
+			final_result.get('error', 'None'),
 		)
 		return final_result
 
@@ -2332,13 +3311,25 @@ async def run_multiple_tasks(
 	logger.info(f'🚀 BATCH START: Creating semaphore with max_parallel_runs={max_parallel_runs}')
 	log_system_resources('BATCH_START')
 
-	semaphore_runs = asyncio.Semaphore(max_parallel_runs)
+	semaphore_runs = TrackedSemaphore(max_parallel_runs)
 	tasks_to_run = tasks[start_index:end_index] if end_index else tasks[start_index:]
 
+	# Size the thread pools behind asyncio.to_thread / anyio.to_thread for the blocking I/O of every parallel task,
+	# the defaults (min(32, cpu_count + 4) threads, 40 anyio tokens) serialize it at higher parallelism.
+	# The loop keeps the executor until asyncio.run() shuts it down, since later stages still offload to it.
+	io_pool_size = max(32, max_parallel_runs * 4)
+	asyncio.get_running_loop().set_default_executor(
+		concurrent.futures.ThreadPoolExecutor(max_workers=io_pool_size, thread_name_prefix='eval_io')
+	)
+	thread_limiter = anyio.to_thread.current_default_thread_limiter()
+	thread_limiter.total_tokens = max(thread_limiter.total_tokens, io_pool_size)
+
 	logger.info(f'📊 Starting {len(tasks_to_run)} tasks with parallel limit of {max_parallel_runs}')
 	logger.info(f'📋 Task range: {start_index} to {end_index or len(tasks)} (total tasks available: {len(tasks)})')
 
-	# Start resource monitoring
+	# Tune the GC for the batch and start resource monitoring
+	previous_gc_threshold = gc.get_threshold()
+	gc.set_threshold(*_GC_THRESHOLD)
 	await start_resource_monitoring(interval=30)
 
 	# Setup signal handlers for graceful shutdown
@@ -2353,7 +3344,8 @@ async def run_multiple_tasks(
 		heartbeat_count = 0
 		while not heartbeat_stop_event.is_set():
 			try:
-				await asyncio.wait_for(heartbeat_stop_event.wait(), timeout=60.0)  # 1-minute heartbeat
+				async with asyncio.timeout(60.0):  # 1-minute heartbeat
+					await heartbeat_stop_event.wait()
 				break  # Event was set, exit
 			except TimeoutError:
 				heartbeat_count += 1
@@ -2376,42 +3368,72 @@ async def run_multiple_tasks(
 		# Run all tasks in parallel with additional parameters
 		logger.info(f'🚀 Launching {len(tasks_to_run)} parallel task executions...')
 
-		task_results = await asyncio.gather(
-			*(
-				run_task_with_semaphore(
-					task=task,
-					run_id=run_id,
-					lmnr_run_id=lmnr_run_id,
-					laminar_eval_link=laminar_eval_link,
-					convex_url=convex_url,
-					secret_key=secret_key,
-					eval_model=eval_model,
-					llm=llm,  # Pass the agent LLM
-					max_steps_per_task=max_steps_per_task,
-					headless=headless,
-					use_vision=use_vision,
-					semaphore_runs=semaphore_runs,  # Pass the semaphore
-					auth_distribution=auth_distribution,  # Pass the pre-fetched auth distribution
-					github_workflow_url=github_workflow_url,
-					use_serp=use_serp,
-					browser=browser,
-					enable_memory=enable_memory,
-					memory_interval=memory_interval,
-					max_actions_per_step=max_actions_per_step,
-					validate_output=validate_output,
-					planner_llm=planner_llm,
-					planner_interval=planner_interval,
-					include_result=include_result,
-					highlight_elements=highlight_elements,
-					use_mind2web_judge=use_mind2web_judge,
-					use_thinking=use_thinking,
-					gmail_tokens_dict=gmail_tokens_dict,
-				)
-				for task in tasks_to_run
-			),
-			return_exceptions=True,  # Prevent task cancellation cascade
+		# Only keep a bounded window of task coroutines alive: run_task_with_semaphore already limits execution to
+		# max_parallel_runs, so creating every coroutine up front only costs memory on large batches
+		in_flight_limit = 2 * max_parallel_runs
+		task_results: list = [None] * len(tasks_to_run)
+		pending: dict[asyncio.Task, int] = {}
+		queued_tasks = enumerate(tasks_to_run)
+
+		# Auth info is formatted once per distinct auth_keys and reused by every task of this run
+		auth_info_cache: dict[tuple[str, ...], str] = {}
+
+		# Arguments shared by every task, bound once for the whole batch
+		run_task = functools.partial(
+			run_task_with_semaphore,
+			run_id=run_id,
+			lmnr_run_id=lmnr_run_id,
+			laminar_eval_link=laminar_eval_link,
+			convex_url=convex_url,
+			secret_key=secret_key,
+			eval_model=eval_model,
+			llm=llm,  # Pass the agent LLM
+			max_steps_per_task=max_steps_per_task,
+			headless=headless,
+			use_vision=use_vision,
+			semaphore_runs=semaphore_runs,  # Pass the semaphore
+			auth_distribution=auth_distribution,  # Pass the pre-fetched auth distribution
+			auth_info_cache=auth_info_cache,
+			github_workflow_url=github_workflow_url,
+			use_serp=use_serp,
+			browser=browser,
+			enable_memory=enable_memory,
+			memory_interval=memory_interval,
+			max_actions_per_step=max_actions_per_step,
+			validate_output=validate_output,
+			planner_llm=planner_llm,
+			planner_interval=planner_interval,
+			include_result=include_result,
+			highlight_elements=highlight_elements,
+			use_mind2web_judge=use_mind2web_judge,
+			use_thinking=use_thinking,
+			gmail_tokens_dict=gmail_tokens_dict,
 		)
 
+		def submit_next_tasks() -> None:
+			for index, task in itertools.islice(queued_tasks, in_flight_limit - len(pending)):
+				coroutine = run_task(task=task)
+				pending[asyncio.create_task(coroutine)] = index
+
+		try:
+			submit_next_tasks()
+			while pending:
+				done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+				for finished in done:
+					index = pending.pop(finished)
+					# Keep gather(return_exceptions=True) semantics: a failed task yields its exception as its result
+					if finished.cancelled():
+						task_results[index] = asyncio.CancelledError()
+					else:
+						exc = finished.exception()
+						task_results[index] = exc if exc is not None else finished.result()
+				submit_next_tasks()
+		finally:
+			for unfinished in pending:
+				unfinished.cancel()
+			# Let cancelled tasks run their cleanup (browser, emergency saves) before the pipeline closes shared clients
+			await asyncio.gather(*pending, return_exceptions=True)
+
 		logger.info(f'✅ All {len(tasks_to_run)} parallel task executions completed')
 
 	except Exception as e:
@@ -2431,12 +3453,14 @@ async def run_multiple_tasks(
 		if heartbeat_task and not heartbeat_task.done():
 			heartbeat_stop_event.set()
 			try:
-				await asyncio.wait_for(heartbeat_task, timeout=5.0)
+				async with asyncio.timeout(5.0):
+					await heartbeat_task
 			except TimeoutError:
 				logger.warning('Heartbeat task did not stop gracefully')
 				heartbeat_task.cancel()
 
 		await stop_resource_monitoring()
+		gc.set_threshold(*previous_gc_threshold)
 		log_system_resources('BATCH_CLEANUP')
 
 	# Process task results and handle any exceptions returned by gather
@@ -2487,13 +3511,15 @@ def fetch_tasks_from_server(convex_url: str, secret_key: str, test_case_name: st
 	logger.info(f"Fetching test case '{test_case_name}' from {endpoint_url}...")
 
 	try:
-		response = requests.post(endpoint_url, headers=headers, json=payload)
+		response = _SESSION.post(
+			endpoint_url, headers=headers, data=orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS), timeout=_SESSION_TIMEOUT
+		)
 
 		logger.info(f'Fetch Status Code: {response.status_code}')
 
 		if response.status_code == 200:
 			try:
-				data = response.json()
+				data = orjson.loads(response.content)
 				logger.info(f"Successfully fetched test case data for '{test_case_name}'.")
 				# Assuming the data is the list of tasks
 				if isinstance(data, list):
@@ -2538,13 +3564,13 @@ def fetch_auth_distribution_from_server(convex_url: str, secret_key: str):
 	logger.info(f'Fetching auth distribution from {endpoint_url}...')
 
 	try:
-		response = requests.post(endpoint_url, headers=headers, json={})
+		response = _SESSION.post(endpoint_url, headers=headers, data=b'{}', timeout=_SESSION_TIMEOUT)
 
 		logger.info(f'Fetch Auth Distribution Status Code: {response.status_code}')
 
 		if response.status_code == 200:
 			try:
-				data = response.json()
+				data = orjson.loads(response.content)
 				logger.info('Successfully fetched auth distribution data.')
 				# Verify the response has the expected structure
 				if isinstance(data, dict) and 'id' in data and 'loginInfo' in data:
@@ -2596,23 +3622,20 @@ def format_auth_info_for_agent(auth_distribution: dict, auth_keys: list[str]) ->
 	# Extract relevant auth information based on auth_keys
 	relevant_auths = []
 	for auth_key in auth_keys:
-		if auth_key in login_info:
+		try:
 			auth_data = login_info[auth_key]
-			if isinstance(auth_data, dict):
-				# Format the auth data for this key
-				auth_details = []
-				for key, value in auth_data.items():
-					auth_details.append(f'{key}: {value}')
-
-				if auth_details:
-					relevant_auths.append(f'{auth_key} with {", ".join(auth_details)}')
-			else:
-				logger.warning(f"Auth data for key '{auth_key}' is not a dictionary: {type(auth_data)}")
-		else:
+		except KeyError:
 			logger.warning(f"Auth key '{auth_key}' not found in available login info. Available keys: {list(login_info.keys())}")
+			continue
+		if not isinstance(auth_data, dict):
+			logger.warning(f"Auth data for key '{auth_key}' is not a dictionary: {type(auth_data)}")
+			continue
+		if auth_data:
+			# Format the auth data for this key
+			relevant_auths.append(f'{auth_key} with ' + ', '.join(f'{key}: {value}' for key, value in auth_data.items()))
 
 	if relevant_auths:
-		auth_text = f'\n\nThe following login credentials can be used to complete this task: {"; ".join(relevant_auths)}.'
+		auth_text = '\n\nThe following login credentials can be used to complete this task: ' + '; '.join(relevant_auths) + '.'
 		logger.info(f'Formatted auth info: {auth_text}')
 		return auth_text
 	else:
@@ -2621,18 +3644,21 @@ def format_auth_info_for_agent(auth_distribution: dict, auth_keys: list[str]) ->
 
 
 # Helper function to get git information
+@functools.lru_cache(maxsize=1)
 def get_git_info():
-	"""Retrieves git branch, commit hash, commit timestamp, and repository URL using subprocess."""
+	"""Retrieves git branch, commit hash, commit timestamp, and repository URL using subprocess.
+	Cached, since the checkout doesn't change while the process runs."""
 	try:
-		branch = subprocess.run(
-			['git', 'rev-parse', '--abbrev-ref', 'HEAD'], capture_output=True, text=True, check=True
-		).stdout.strip()
-		commit_hash = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
-		# Get commit timestamp as Unix epoch integer
-		commit_timestamp_str = subprocess.run(
-			['git', 'log', '-1', '--format=%ct'], capture_output=True, text=True, check=True
-		).stdout.strip()
+		# Hash, commit timestamp (Unix epoch) and ref names ('HEAD -> branch, origin/branch') in one call
+		commit_hash, commit_timestamp_str, *refs = subprocess.run(
+			['git', 'log', '-1', '--format=%H%n%ct%n%D', 'HEAD'], capture_output=True, text=True, check=True
+		).stdout.splitlines()
 		commit_timestamp = int(commit_timestamp_str)
+		# Same as `git rev-parse --abbrev-ref HEAD`: the checked out branch, or 'HEAD' when detached
+		branch = next(
+			(ref.removeprefix('HEAD -> ') for ref in ''.join(refs).split(', ') if ref.startswith('HEAD -> ')),
+			'HEAD',
+		)
 		# Get repository URL
 		repo_url = subprocess.run(
 			['git', 'config', '--get', 'remote.origin.url'], capture_output=True, text=True, check=True
@@ -2667,17 +3693,20 @@ def start_new_run(convex_url: str, secret_key: str, run_details: dict, existing_
 		payload['runId'] = existing_run_id
 
 	logger.info(f'Sending request to start run at {endpoint_url}...')
-	# Avoid logging secret key in run_details if it were ever passed
-	loggable_details = {k: v for k, v in payload.items() if k != 'secret_key'}
-	logger.info(f'Run details: {json.dumps(loggable_details, indent=2)}')
+	if logger.isEnabledFor(logging.INFO):
+		# Avoid logging secret key in run_details if it were ever passed
+		loggable_details = {k: v for k, v in payload.items() if k != 'secret_key'}
+		logger.info('Run details: %s', json.dumps(loggable_details, indent=2))
 
 	try:
-		response = requests.post(endpoint_url, headers=headers, json=payload)
+		response = _SESSION.post(
+			endpoint_url, headers=headers, data=orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS), timeout=_SESSION_TIMEOUT
+		)
 		logger.info(f'Start Run Status Code: {response.status_code}')
 
 		if response.status_code == 200:
 			try:
-				data = response.json()
+				data = orjson.loads(response.content)
 				run_id = data.get('runId')
 				if run_id:
 					logger.info(f'Successfully started run. Run ID: {run_id}')
@@ -2701,21 +3730,20 @@ def start_new_run(convex_url: str, secret_key: str, run_details: dict, existing_
 
 
 # Helper function to save a task result to the server
-def save_task_result_to_server(convex_url: str, secret_key: str, result_details: dict):
-	"""Sends a request to save a single task result to the Convex backend."""
-
+def _task_result_request(convex_url: str, secret_key: str, result_details: dict) -> tuple[str, dict[str, str]] | None:
+	"""Validate a saveTaskResult call and build its endpoint URL and headers, None (after logging why) if invalid"""
 	if not convex_url:
 		logger.error('Error: EVALUATION_TOOL_URL environment variable not set for saving task result.')
-		return False
+		return None
 
 	if not secret_key:
 		logger.error('Error: EVALUATION_TOOL_SECRET_KEY environment variable not set for saving task result.')
-		return False
+		return None
 
 	# Ensure runId is present in the details being sent
 	if 'runId' not in result_details or not result_details['runId']:
 		logger.error("Error: 'runId' is missing or empty in result_details for saveTaskResult.")
-		return False
+		return None
 
 	endpoint_url = f'{convex_url}/api/saveTaskResult'
 	headers = {
@@ -2724,66 +3752,279 @@ def save_task_result_to_server(convex_url: str, secret_key: str, result_details:
 	}
 
 	logger.info(f'Sending request to save task result at {endpoint_url}...')
-	logger.debug(f'Result details payload: {json.dumps(result_details, indent=2)}')  # Log details at debug level
+	if logger.isEnabledFor(logging.DEBUG):
+		# Log details at debug level, compact since the payload carries the whole agent history
+		logger.debug('Result details payload: %s', _encode_task_result(result_details).decode())
+	return endpoint_url, headers
 
-	try:
-		response = requests.post(endpoint_url, headers=headers, json=result_details)
 
-		logger.info(f'Save Task Result Status Code: {response.status_code}')
+def _encode_task_result(result_details: dict) -> bytes:
+	# Serialized in one orjson pass; _json_default handles enums/models/paths the server payload may still contain
+	return orjson.dumps(result_details, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
 
-		if response.status_code == 200:
-			try:
-				data = response.json()
-				logger.info(f'Successfully saved task result: {data.get("message")}')
-				logger.info(f'Result ID: {data.get("resultId")}')
-				return True
-			except json.JSONDecodeError:
-				logger.error('Error: Failed to decode saveTaskResult JSON response.')
-				logger.error(f'Raw response text: {response.text}')
-				return False
-		else:
-			logger.error('Error: Failed to save task result.')
-			logger.error(f'Response: {response.text}')
+
+def _task_result_saved(response: requests.Response | httpx.Response) -> bool:
+	"""Log the outcome of a saveTaskResult response (requests or httpx) and return whether it succeeded"""
+	logger.info(f'Save Task Result Status Code: {response.status_code}')
+
+	if response.status_code == 200:
+		try:
+			data = response.json()
+			logger.info(f'Successfully saved task result: {data.get("message")}')
+			logger.info(f'Result ID: {data.get("resultId")}')
+			return True
+		except json.JSONDecodeError:
+			logger.error('Error: Failed to decode saveTaskResult JSON response.')
+			logger.error(f'Raw response text: {response.text}')
 			return False
+	else:
+		logger.error('Error: Failed to save task result.')
+		logger.error(f'Response: {response.text}')
+		return False
 
-	except requests.exceptions.RequestException as e:
+
+def save_task_result_to_server(convex_url: str, secret_key: str, result_details: dict):
+	"""Sends a request to save a single task result to the Convex backend."""
+	request = _task_result_request(convex_url, secret_key, result_details)
+	if request is None:
+		return False
+	endpoint_url, headers = request
+
+	try:
+		response = _SESSION.post(
+			endpoint_url, headers=headers, data=_encode_task_result(result_details), timeout=_SESSION_TIMEOUT
+		)
+		return _task_result_saved(response)
+	except (requests.exceptions.RequestException, orjson.JSONEncodeError) as e:
 		logger.error(f'Error during saveTaskResult request: {type(e).__name__}: {e}')
 		return False
 
 
-# Helper function to save runner progress to the server
-def save_runner_progress_to_server(convex_url: str, secret_key: str, progress_details: dict):
-	"""Sends a request to save runner progress to the Convex backend."""
+# Shared async client for every Convex call made from the event loop (task results, runner progress), so concurrent
+# requests reuse pooled (HTTP/2 when available) connections. The startup fetches run before the loop and use _SESSION.
+_CONVEX_CLIENT = httpx.AsyncClient(
+	http2=_HTTP2_AVAILABLE,
+	limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+	timeout=httpx.Timeout(60.0, connect=5.0),
+)
+
+
+async def save_task_result_to_server_async(convex_url: str, secret_key: str, result_details: dict) -> bool:
+	"""Async variant of save_task_result_to_server over the shared httpx client"""
+	request = _task_result_request(convex_url, secret_key, result_details)
+	if request is None:
+		return False
+	endpoint_url, headers = request
+
+	try:
+		response = await _CONVEX_CLIENT.post(endpoint_url, headers=headers, content=_encode_task_result(result_details))
+		return _task_result_saved(response)
+	except (httpx.HTTPError, orjson.JSONEncodeError) as e:
+		logger.error(f'Error during saveTaskResult request: {type(e).__name__}: {e}')
+		return False
+
+
+async def save_task_results_batch_to_server_async(convex_url: str, secret_key: str, results: list[dict]) -> bool | None:
+	"""Save several task results with one saveTaskResults request; None if the server has no batch endpoint,
+	False on any other failure"""
+	endpoint_url = f'{convex_url}/api/saveTaskResults'
+	headers = {
+		'Authorization': f'Bearer {secret_key}',
+		'Content-Type': 'application/json',
+	}
+
+	logger.info(f'Sending request to save {len(results)} task results at {endpoint_url}...')
+	try:
+		response = await _CONVEX_CLIENT.post(endpoint_url, headers=headers, content=_encode_task_result({'results': results}))
+	except (httpx.HTTPError, orjson.JSONEncodeError) as e:
+		logger.error(f'Error during saveTaskResults request: {type(e).__name__}: {e}')
+		return False
+
+	if response.status_code in (404, 501):
+		logger.info('saveTaskResults is not available on the server, saving task results one by one')
+		return None
+
+	logger.info(f'Save Task Results Status Code: {response.status_code}')
+	if response.status_code == 200:
+		logger.info(f'Successfully saved {len(results)} task results')
+		return True
+	logger.error('Error: Failed to save task results.')
+	logger.error(f'Response: {response.text}')
+	return False
+
+
+class ResultUploader(MicroBatcher):
+	"""
+	Uploads task results from all running tasks through one worker over the shared connection pool.
+
+	With batch_saves, payloads arriving within flush_interval (up to max_batch) are saved with one
+	saveTaskResults request per backend. A batch that isn't cleanly accepted is re-sent one result at a time
+	through saveTaskResult, and a server without the batch endpoint (404/501) gets per-result posts from then on.
+	"""
+
+	def __init__(self, max_batch: int = 32, flush_interval: float = 0.1, batch_saves: bool = False):
+		super().__init__(max_batch=max_batch, max_wait=flush_interval)
+		self._batch_endpoint_available = batch_saves
 
+	async def submit(self, convex_url: str, secret_key: str, payload: dict) -> bool:
+		"""Queue a task result and wait until it has been posted; returns whether the server accepted it"""
+		return await self._submit(convex_url, secret_key, payload)
+
+	async def _dispatch(self, convex_url: str, secret_key: str, payload: dict) -> bool:
+		return await save_task_result_to_server_async(convex_url, secret_key, payload)
+
+	def _dispatch_batch(self, batch: list[tuple[tuple, asyncio.Future]]) -> None:
+		if not self._batch_endpoint_available:
+			return super()._dispatch_batch(batch)
+
+		# Only complete results (backend configured, runId set) are batched; the rest go through the per-result
+		# path, which logs why they can't be saved
+		groups: dict[tuple[str, str], list[tuple[tuple, asyncio.Future]]] = {}
+		single = []
+		for item in batch:
+			(convex_url, secret_key, payload), future = item
+			if future.done():
+				continue
+			if convex_url and secret_key and payload.get('runId'):
+				groups.setdefault((convex_url, secret_key), []).append(item)
+			else:
+				single.append(item)
+		for items in groups.values():
+			if len(items) == 1:
+				single.extend(items)
+			else:
+				self._spawn(self._run_batch(items))
+		super()._dispatch_batch(single)
+
+	async def _run_batch(self, items: list[tuple[tuple, asyncio.Future]]) -> None:
+		convex_url, secret_key, _ = items[0][0]
+		try:
+			saved = await save_task_results_batch_to_server_async(convex_url, secret_key, [args[2] for args, _ in items])
+		except Exception as e:
+			logger.warning(f'saveTaskResults request failed, saving task results one by one: {type(e).__name__}: {e}')
+			saved = False
+
+		if saved:
+			for _, future in items:
+				if not future.done():
+					future.set_result(True)
+			return
+		if saved is None:
+			self._batch_endpoint_available = False
+		# Anything short of a clean 200 is re-sent per result, so a failed batch never drops results
+		super()._dispatch_batch(items)
+
+
+# saveTaskResults is opt-in (EVAL_BATCH_RESULT_SAVES=1) until the backend provides it
+_RESULT_UPLOADER = ResultUploader(batch_saves=os.getenv('EVAL_BATCH_RESULT_SAVES', '0') == '1')
+
+
+# Helper function to save runner progress to the server
+def _runner_progress_request(convex_url: str, secret_key: str) -> tuple[str, dict[str, str]] | None:
+	"""Endpoint URL and headers for saveRunnerProgress, None (after logging why) if not configured"""
 	if not convex_url:
 		logger.debug('No EVALUATION_TOOL_URL environment variable set for saving runner progress.')
-		return False
+		return None
 
 	if not secret_key:
 		logger.debug('No EVALUATION_TOOL_SECRET_KEY environment variable set for saving runner progress.')
-		return False
+		return None
 
 	endpoint_url = f'{convex_url}/api/saveRunnerProgress'
 	headers = {
 		'Authorization': f'Bearer {secret_key}',
 		'Content-Type': 'application/json',
 	}
+	return endpoint_url, headers
 
-	try:
-		response = requests.post(endpoint_url, headers=headers, json=progress_details, timeout=10)
 
-		if response.status_code == 200:
-			logger.debug(f'Successfully saved runner progress for {progress_details.get("runnerId")}')
-			return True
-		else:
-			logger.warning(f'Failed to save runner progress. Status: {response.status_code}')
-			return False
+def _runner_progress_saved(response: requests.Response | httpx.Response, progress_details: dict) -> bool:
+	if response.status_code == 200:
+		logger.debug(f'Successfully saved runner progress for {progress_details.get("runnerId")}')
+		return True
+	else:
+		logger.warning(f'Failed to save runner progress. Status: {response.status_code}')
+		return False
+
+
+def save_runner_progress_to_server(convex_url: str, secret_key: str, progress_details: dict):
+	"""Sends a request to save runner progress to the Convex backend."""
+	request = _runner_progress_request(convex_url, secret_key)
+	if request is None:
+		return False
+	endpoint_url, headers = request
 
+	try:
+		response = _SESSION.post(endpoint_url, headers=headers, json=progress_details, timeout=10)
+		return _runner_progress_saved(response, progress_details)
 	except requests.exceptions.RequestException as e:
 		logger.warning(f'Error during saveRunnerProgress request: {type(e).__name__}: {e}')
 		return False
 
 
+async def save_runner_progress_to_server_async(convex_url: str, secret_key: str, progress_details: dict) -> bool:
+	"""Async variant of save_runner_progress_to_server over the shared httpx client"""
+	request = _runner_progress_request(convex_url, secret_key)
+	if request is None:
+		return False
+	endpoint_url, headers = request
+
+	try:
+		response = await _CONVEX_CLIENT.post(endpoint_url, headers=headers, content=orjson.dumps(progress_details), timeout=10)
+		return _runner_progress_saved(response, progress_details)
+	except httpx.HTTPError as e:
+		logger.warning(f'Error during saveRunnerProgress request: {type(e).__name__}: {e}')
+		return False
+
+
+class ProgressReporter:
+	"""
+	Coalesces runner progress updates in the background.
+
+	Updates submitted within flush_interval are held per task, so only the latest stage of each task in the
+	window is posted; the pipeline never waits on a progress request.
+	"""
+
+	def __init__(self, flush_interval: float = 0.1):
+		self.flush_interval = flush_interval
+		self._pending: dict[str, tuple[str, str, dict]] = {}  # task_id -> (convex_url, secret_key, details)
+		self._flusher: asyncio.Task | None = None
+
+	def submit(self, convex_url: str, secret_key: str, progress_details: dict) -> None:
+		self._pending[progress_details['taskId']] = (convex_url, secret_key, progress_details)
+		if self._flusher is None or self._flusher.done():
+			self._flusher = asyncio.create_task(self._flush_later(), name='progress_reporter')
+
+	async def _flush_later(self) -> None:
+		# Keep flushing until a flush leaves nothing behind, so updates submitted while posting aren't stranded
+		while self._pending:
+			await asyncio.sleep(self.flush_interval)
+			await self.flush()
+
+	async def flush(self) -> None:
+		"""Post the pending updates now"""
+		pending, self._pending = self._pending, {}
+		results = await asyncio.gather(
+			*[save_runner_progress_to_server_async(*update) for update in pending.values()], return_exceptions=True
+		)
+		# Logged rather than raised, as in the sync path: an exception here would end the flusher and strand later updates
+		for result in results:
+			if isinstance(result, Exception):
+				logger.warning(f'Failed to send progress update: {type(result).__name__}: {result}')
+
+	async def close(self) -> None:
+		"""Wait for the scheduled flush, then send whatever is still pending"""
+		if self._flusher is not None:
+			await asyncio.gather(self._flusher, return_exceptions=True)
+			self._flusher = None
+		await self.flush()
+
+
+# EVAL_PROGRESS_FLUSH_MS=0 keeps the previous synchronous progress requests
+_PROGRESS_FLUSH_INTERVAL = float(os.getenv('EVAL_PROGRESS_FLUSH_MS', '100')) / 1000
+_PROGRESS_REPORTER = ProgressReporter(flush_interval=_PROGRESS_FLUSH_INTERVAL)
+
+
 def generate_runner_id(task_id: str, github_run_id: str | None = None) -> str:
 	"""Generate a unique runner ID for progress tracking that matches GitHub Actions pattern"""
 	if github_run_id:
@@ -2797,6 +4038,20 @@ def generate_runner_id(task_id: str, github_run_id: str | None = None) -> str:
 		return f'local_run_{int(time.time())}'
 
 
+@functools.cache
+def _progress_runner_id() -> str:
+	"""Runner ID for this process' progress updates, computed on the first update (the environment doesn't change)"""
+	return generate_runner_id('', os.getenv('GITHUB_RUN_ID'))
+
+
+@functools.lru_cache(maxsize=8)
+def _github_workflow_run_id(github_workflow_url: str | None) -> str | None:
+	"""Workflow run ID from a GitHub Actions run URL (.../actions/runs/<id>/...), None if it has none"""
+	if github_workflow_url and 'actions/runs/' in github_workflow_url:
+		return github_workflow_url.split('actions/runs/')[1].split('/')[0]
+	return None
+
+
 def send_progress_update(
 	convex_url: str,
 	secret_key: str,
@@ -2808,32 +4063,33 @@ def send_progress_update(
 	assigned_task_range: str | None = None,
 	error_message: str | None = None,
 ) -> bool:
-	"""Send a progress update for the current runner and task"""
-	try:
-		# Generate runner ID
-		github_run_id = os.getenv('GITHUB_RUN_ID')
-		runner_id = generate_runner_id(task_id, github_run_id)
-
-		# Extract workflow run ID from URL if available
-		github_workflow_run_id = None
-		if github_workflow_url and 'actions/runs/' in github_workflow_url:
-			try:
-				github_workflow_run_id = github_workflow_url.split('actions/runs/')[1].split('/')[0]
-			except (IndexError, AttributeError):
-				pass
+	"""
+	Send a progress update for the current runner and task.
 
+	Inside the event loop (EVAL_PROGRESS_FLUSH_MS > 0) the update is only queued on the progress reporter, so True
+	means it was accepted for sending, not that the server stored it; delivery failures are logged by the reporter.
+	"""
+	try:
 		progress_details = {
 			'runId': run_id,
-			'runnerId': runner_id,
+			'runnerId': _progress_runner_id(),
 			'taskId': task_id,
 			'currentStage': current_stage,
 			'status': status,
 			'githubWorkflowUrl': github_workflow_url,
-			'githubWorkflowRunId': github_workflow_run_id,
+			'githubWorkflowRunId': _github_workflow_run_id(github_workflow_url),
 			'assignedTaskRange': assigned_task_range,
 			'errorMessage': error_message,
 		}
 
+		if _PROGRESS_FLUSH_INTERVAL > 0:
+			try:
+				asyncio.get_running_loop()
+			except RuntimeError:
+				pass  # no event loop (single synchronous caller): send directly
+			else:
+				_PROGRESS_REPORTER.submit(convex_url, secret_key, progress_details)
+				return True
 		return save_runner_progress_to_server(convex_url, secret_key, progress_details)
 	except Exception as e:
 		logger.warning(f'Failed to send progress update: {type(e).__name__}: {e}')
@@ -2896,37 +4152,46 @@ async def run_evaluation_pipeline(
 	# TODO: Update the run data on the server with the Laminar link if needed
 
 	# Run the tasks
-	return await run_multiple_tasks(
-		tasks=tasks,
-		llm=llm,
-		run_id=run_id,
-		lmnr_run_id=lmnr_run_id,
-		laminar_eval_link=laminar_eval_link,
-		convex_url=convex_url,
-		secret_key=secret_key,
-		eval_model=eval_model,
-		auth_distribution=auth_distribution,
-		github_workflow_url=github_workflow_url,
-		max_parallel_runs=max_parallel_runs,
-		max_steps_per_task=max_steps_per_task,
-		start_index=start_index,
-		end_index=end_index,
-		headless=headless,
-		use_vision=use_vision,
-		use_serp=use_serp,
-		browser=browser,
-		enable_memory=enable_memory,
-		memory_interval=memory_interval,
-		max_actions_per_step=max_actions_per_step,
-		validate_output=validate_output,
-		planner_llm=planner_llm,
-		planner_interval=planner_interval,
-		include_result=include_result,
-		highlight_elements=highlight_elements,
-		use_mind2web_judge=use_mind2web_judge,
-		use_thinking=use_thinking,
-		gmail_tokens_dict=gmail_tokens_dict,
-	)
+	try:
+		return await run_multiple_tasks(
+			tasks=tasks,
+			llm=llm,
+			run_id=run_id,
+			lmnr_run_id=lmnr_run_id,
+			laminar_eval_link=laminar_eval_link,
+			convex_url=convex_url,
+			secret_key=secret_key,
+			eval_model=eval_model,
+			auth_distribution=auth_distribution,
+			github_workflow_url=github_workflow_url,
+			max_parallel_runs=max_parallel_runs,
+			max_steps_per_task=max_steps_per_task,
+			start_index=start_index,
+			end_index=end_index,
+			headless=headless,
+			use_vision=use_vision,
+			use_serp=use_serp,
+			browser=browser,
+			enable_memory=enable_memory,
+			memory_interval=memory_interval,
+			max_actions_per_step=max_actions_per_step,
+			validate_output=validate_output,
+			planner_llm=planner_llm,
+			planner_interval=planner_interval,
+			include_result=include_result,
+			highlight_elements=highlight_elements,
+			use_mind2web_judge=use_mind2web_judge,
+			use_thinking=use_thinking,
+			gmail_tokens_dict=gmail_tokens_dict,
+		)
+	finally:
+		await asyncio.gather(
+			_RESULT_UPLOADER.close(),
+			_BROWSER_POOL.close(),
+			_PROGRESS_REPORTER.close(),
+		)
+		await close_http_clients()
+		_disarm_force_exit()
 
 
 async def check_login_cookie_at_step(browser_session, task_id: str, login_cookie: str, step: int) -> bool:
@@ -2942,7 +4207,11 @@ async def check_login_cookie_at_step(browser_session, task_id: str, login_cookie
 	Returns:
 	    bool: True if login cookie was found, False otherwise
 	"""
-	global _login_cookie_tracker
+	# Once found, the tracking for this task is settled (save_login_cookie_tracking drops it when the task ends),
+	# so later steps skip fetching cookies from the browser
+	prior_tracking = _login_cookie_tracker.get(task_id)
+	if prior_tracking and prior_tracking.get('found'):
+		return True
 
 	try:
 		# Get current cookies from browser
@@ -2962,32 +4231,25 @@ async def check_login_cookie_at_step(browser_session, task_id: str, login_cookie
 			search_target = login_cookie
 
 		# Check if login_cookie is present
-		for cookie in current_cookies:
-			cookie_name = cookie.get('name', '')
-			cookie_value = cookie.get('value', '')
-
-			if is_exact_match:
-				if cookie_name == search_target:
-					logger.info(f'✅ Task {task_id} Step {step}: Login cookie "{search_target}" found (exact match)')
-					# Track that we found the cookie
-					_login_cookie_tracker[task_id] = {
-						'found': True,
-						'step': step,
-						'cookie_name': cookie_name,
-						'match_type': 'exact',
-					}
-					return True
-			else:
-				if search_target in cookie_name or search_target in cookie_value:
-					logger.info(f'✅ Task {task_id} Step {step}: Login cookie "{search_target}" found (substring match)')
-					# Track that we found the cookie
-					_login_cookie_tracker[task_id] = {
-						'found': True,
-						'step': step,
-						'cookie_name': cookie_name,
-						'match_type': 'substring',
-					}
-					return True
+		if is_exact_match:
+			cookie = next((cookie for cookie in current_cookies if cookie.get('name') == search_target), None)
+		else:
+			cookie = _find_cookie_containing(current_cookies, search_target)
+
+		if cookie is not None:
+			match_type = 'exact' if is_exact_match else 'substring'
+			logger.info(f'✅ Task {task_id} Step {step}: Login cookie "{search_target}" found ({match_type} match)')
+			# Track that we found the cookie
+			_track(
+				task_id,
+				{
+					'found': True,
+					'step': step,
+					'cookie_name': cookie.get('name', ''),
+					'match_type': match_type,
+				},
+			)
+			return True
 
 		logger.debug(f'Task {task_id} Step {step}: Login cookie "{search_target}" not found in {len(current_cookies)} cookies')
 		return False
@@ -2997,16 +4259,17 @@ async def check_login_cookie_at_step(browser_session, task_id: str, login_cookie
 		return False
 
 
-async def save_login_cookie_tracking(task_folder: Path, task_id: str) -> None:
+async def save_login_cookie_tracking(task_folder: Path, task_id: str) -> dict | None:
 	"""
 	Save the login cookie tracking information to a file.
 
 	Args:
 		task_folder: Directory to save the tracking file
 		task_id: The task ID
-	"""
-	global _login_cookie_tracker
 
+	Returns:
+		The tracking data that was written, or None if saving failed
+	"""
 	try:
 		tracking_file = task_folder / 'login_cookie_tracking.json'
 		tracking_data = _login_cookie_tracker.get(task_id, {'found': False})
@@ -3014,20 +4277,30 @@ async def save_login_cookie_tracking(task_folder: Path, task_id: str) -> None:
 		# Add timestamp
 		tracking_data['timestamp'] = time.time()
 
-		# Save to file
-		async with await anyio.open_file(tracking_file, 'w') as f:
-			await f.write(json.dumps(tracking_data, indent=2))
+		# Save to file, compact: it is only read back by the login evaluation
+		await anyio.Path(tracking_file).write_bytes(orjson.dumps(tracking_data))
 
 		logger.info(f'📝 Saved login cookie tracking for task {task_id}: {tracking_data}')
 
 		# Clean up tracking data to avoid memory leaks
 		_login_cookie_tracker.pop(task_id, None)
+		return tracking_data
 
 	except Exception as e:
 		logger.warning(f'❌ Failed to save login cookie tracking for task {task_id}: {type(e).__name__}: {e}')
+		return None
+
+
+# `key: value` pairs from GitHub Actions' unquoted toJSON output, one per line or comma-separated
+_TOKEN_RE = re.compile(r'([^\s:{},]+)\s*:[ \t]*([^,\n}]+)')
+# Values GitHub Actions substitutes when no Gmail 2FA tokens secret is configured
+_TOKEN_PLACEHOLDERS = frozenset({'[object Object]', 'null', '{}'})
 
 
 if __name__ == '__main__':
+	# Only the CLI entrypoint moves the root handlers behind the queue; importing the module leaves logging alone
+	_setup_queue_logging()
+
 	parser = argparse.ArgumentParser(description='Run and evaluate browser automation tasks')
 	parser.add_argument('--parallel-runs', type=int, default=3, help='Number of parallel tasks to run')
 	parser.add_argument('--max-steps', type=int, default=25, help='Maximum steps per task')
@@ -3035,12 +4308,8 @@ if __name__ == '__main__':
 	parser.add_argument('--end', type=int, default=None, help='End index (exclusive)')
 	parser.add_argument('--headless', action='store_true', help='Run in headless mode')
 
-	parser.add_argument(
-		'--model', type=str, default='gpt-4o', choices=list(SUPPORTED_MODELS.keys()), help='Model to use for the agent'
-	)
-	parser.add_argument(
-		'--eval-model', type=str, default='gpt-4o', choices=list(SUPPORTED_MODELS.keys()), help='Model to use for evaluation'
-	)
+	parser.add_argument('--model', type=str, default='gpt-4o', choices=_MODEL_CHOICES, help='Model to use for the agent')
+	parser.add_argument('--eval-model', type=str, default='gpt-4o', choices=_MODEL_CHOICES, help='Model to use for evaluation')
 	parser.add_argument('--no-vision', action='store_true', help='Disable vision capabilities in the agent')
 
 	parser.add_argument('--user-message', type=str, default='', help='User message to include in the run')
@@ -3061,7 +4330,7 @@ if __name__ == '__main__':
 		'--planner-model',
 		type=str,
 		default=None,
-		choices=list(SUPPORTED_MODELS.keys()),
+		choices=_MODEL_CHOICES,
 		help='Model to use for planning (separate from main agent model)',
 	)
 	parser.add_argument('--planner-interval', type=int, default=1, help='Run planner every N steps (default: 1)')
@@ -3120,73 +4389,64 @@ if __name__ == '__main__':
 
 	# Parse Gmail 2FA tokens - handle GitHub Actions raw object format
 	gmail_tokens_dict = None
-	if args.gmail_2fa_tokens:
-		raw_tokens = args.gmail_2fa_tokens
-		logger.info(f'🔧 Raw Gmail 2FA tokens received: "{raw_tokens}"')
-
-		# Check if GitHub Actions passed us something like "[object Object]" or similar
-		if raw_tokens in ['[object Object]', 'null', '', '{}']:
-			logger.info('🔧 GitHub Actions passed placeholder value, no Gmail tokens available')
-			gmail_tokens_dict = None
-		else:
+	raw_tokens = args.gmail_2fa_tokens
+	# Cheapest checks first: no value, or a placeholder such as GitHub Actions' "[object Object]"
+	if not raw_tokens:
+		logger.info('🔧 Gmail 2FA tokens: None or empty')
+	elif raw_tokens in _TOKEN_PLACEHOLDERS:
+		logger.info('🔧 GitHub Actions passed placeholder value, no Gmail tokens available')
+	else:
+		logger.info('🔧 Raw Gmail 2FA tokens received: "%s"', raw_tokens)
+		try:
+			# First try parsing as valid JSON (in case it's already proper JSON)
+			gmail_tokens_dict = orjson.loads(raw_tokens)
+			if logger.isEnabledFor(logging.INFO):
+				logger.info('🔧 Successfully parsed as JSON - Gmail 2FA tokens count: %d', len(gmail_tokens_dict))
+				logger.info('🔧 Gmail 2FA users: %s', list(gmail_tokens_dict))
+		except json.JSONDecodeError:
+			# If JSON parsing fails, try to parse GitHub Actions malformed toJSON format
 			try:
-				# First try parsing as valid JSON (in case it's already proper JSON)
-				gmail_tokens_dict = json.loads(raw_tokens)
-				logger.info(f'🔧 Successfully parsed as JSON - Gmail 2FA tokens count: {len(gmail_tokens_dict)}')
-				logger.info(f'🔧 Gmail 2FA users: {list(gmail_tokens_dict.keys())}')
-			except json.JSONDecodeError:
-				# If JSON parsing fails, try to parse GitHub Actions malformed toJSON format
-				try:
-					logger.info('🔧 JSON parsing failed, attempting to parse GitHub Actions malformed format...')
-
-					# Handle GitHub Actions toJSON format: { key: value, key2: value2 }
-					if raw_tokens.strip() and raw_tokens.strip() not in ['null', '{}']:
-						# Remove outer braces and parse line by line
-						content = raw_tokens.strip().strip('{}').strip()
-
-						if content:
-							tokens = {}
-							lines = [line.strip() for line in content.split('\n') if line.strip()]
-
-							for line in lines:
-								# Remove trailing comma if present
-								line = line.rstrip(',')
+				logger.info('🔧 JSON parsing failed, attempting to parse GitHub Actions malformed format...')
 
-								if ':' in line:
-									# Split on first colon only
-									key, value = line.split(':', 1)
-									key = key.strip()
-									value = value.strip()
+				# Handle GitHub Actions toJSON format: { key: value, key2: value2 }
+				stripped = raw_tokens.strip()
+				if stripped and stripped not in _TOKEN_PLACEHOLDERS:
+					# Remove outer braces and parse line by line
+					content = stripped.strip('{}').strip()
 
-									# Store the key-value pair
-									tokens[key] = value
+					if content:
+						# One regex sweep over the blob; keys split on their first colon
+						tokens = {key: value.strip() for key, value in _TOKEN_RE.findall(content)}
 
-							if tokens:
-								gmail_tokens_dict = tokens
+						if tokens:
+							gmail_tokens_dict = tokens
+							if logger.isEnabledFor(logging.INFO):
 								logger.info('🔧 Successfully parsed malformed GitHub Actions format')
-								logger.info(f'🔧 Gmail 2FA tokens count: {len(gmail_tokens_dict)}')
-								logger.info(f'🔧 Gmail 2FA users: {list(gmail_tokens_dict.keys())}')
-							else:
-								logger.warning('🔧 No tokens found in malformed format')
-								gmail_tokens_dict = None
+								logger.info('🔧 Gmail 2FA tokens count: %d', len(gmail_tokens_dict))
+								logger.info('🔧 Gmail 2FA users: %s', list(gmail_tokens_dict))
 						else:
-							logger.warning('🔧 Empty content in malformed format')
+							logger.warning('🔧 No tokens found in malformed format')
 							gmail_tokens_dict = None
 					else:
-						logger.info('🔧 Raw tokens empty or null')
+						logger.warning('🔧 Empty content in malformed format')
 						gmail_tokens_dict = None
-				except Exception as e:
-					logger.error(f'🔧 Failed to parse malformed GitHub Actions format: {type(e).__name__}: {e}')
+				else:
+					logger.info('🔧 Raw tokens empty or null')
 					gmail_tokens_dict = None
-	else:
-		logger.info('🔧 Gmail 2FA tokens: None or empty')
+			except Exception as e:
+				logger.error('🔧 Failed to parse malformed GitHub Actions format: %s: %s', type(e).__name__, e)
+				gmail_tokens_dict = None
 	# Run tasks and evaluate
-	load_dotenv()
 
-	# --- Load Environment Variables (Always) ---
+	# --- Load Environment Variables (Always; .env was already loaded at import) ---
 	CONVEX_URL = os.getenv('EVALUATION_TOOL_URL') or ''
 	SECRET_KEY = os.getenv('EVALUATION_TOOL_SECRET_KEY') or ''
 
+	# The git subprocesses are independent of the task and auth fetches, so overlap them
+	startup_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='eval_startup')
+	git_info_future = startup_executor.submit(get_git_info)
+	startup_executor.shutdown(wait=False)
+
 	# --- Load Tasks (Either Single Task or from Server) ---
 	tasks = []
 	task_id = None  # Initialize for proper scoping
@@ -3195,7 +4455,7 @@ if __name__ == '__main__':
 	# Check if this is single task mode
 	if args.task_text:
 		# Generate task ID if not provided
-		task_id = args.task_id or f'single_task_{int(time.time())}_{hash(args.task_text) % 10000}'
+		task_id = args.task_id or f'single_task_{int(time.time())}_{zlib.crc32(args.task_text.encode()) & 0xFFFF:04x}'
 		logger.info(f'Single task mode: Running task {task_id}')
 
 		# Create a single task
@@ -3205,6 +4465,7 @@ if __name__ == '__main__':
 			website=args.task_website,  # Optional website
 		)
 		tasks = [single_task]
+		auth_task_count = int(single_task.needs_auth)
 		logger.info(f'Single task mode: Created task {task_id}')
 
 	else:
@@ -3221,7 +4482,13 @@ if __name__ == '__main__':
 			exit(1)  # Exit if fetch fails
 
 		try:
-			tasks = [Task(**task_data) for task_data in fetched_task_data]
+			# Count auth tasks while constructing, instead of a second pass over the task list
+			tasks = []
+			auth_task_count = 0
+			for task_data in fetched_task_data:
+				task = Task.from_raw(task_data)
+				auth_task_count += task.needs_auth
+				tasks.append(task)
 			logger.info(f'Successfully loaded {len(tasks)} tasks from the server.')
 		except (TypeError, ValueError) as e:
 			logger.error(
@@ -3231,13 +4498,8 @@ if __name__ == '__main__':
 			exit(1)
 
 	# --- Fetch Auth Distribution Once (if any tasks need auth) ---
-	tasks_with_auth = [
-		task
-		for task in tasks
-		if hasattr(task, 'auth_keys') and task.auth_keys and isinstance(task.auth_keys, list) and len(task.auth_keys) > 0
-	]
-	if tasks_with_auth and CONVEX_URL and SECRET_KEY:
-		logger.info(f'Found {len(tasks_with_auth)} tasks requiring auth. Fetching auth distribution...')
+	if auth_task_count and CONVEX_URL and SECRET_KEY:
+		logger.info(f'Found {auth_task_count} tasks requiring auth. Fetching auth distribution...')
 		auth_distribution = fetch_auth_distribution_from_server(CONVEX_URL, SECRET_KEY)
 		if auth_distribution:
 			logger.info(
@@ -3245,8 +4507,8 @@ if __name__ == '__main__':
 			)
 		else:
 			logger.warning('Failed to fetch auth distribution. Tasks requiring auth may fail.')
-	elif tasks_with_auth:
-		logger.warning(f'Found {len(tasks_with_auth)} tasks requiring auth but no server config available')
+	elif auth_task_count:
+		logger.warning(f'Found {auth_task_count} tasks requiring auth but no server config available')
 	# -----------------------------
 
 	# --- Start Run on Server (with optional existing Run ID) ---
@@ -3256,7 +4518,7 @@ if __name__ == '__main__':
 		logger.info('Attempting to start a new run on the server...')
 
 	# Get git info
-	git_info = get_git_info()
+	git_info = git_info_future.result()
 
 	# Collect additional data from args to store with the run
 	additional_run_data = {
@@ -3314,49 +4576,50 @@ if __name__ == '__main__':
 
 	logger.info(f'Successfully obtained run ID: {run_id}. Proceeding with tasks...')
 
-	# Log search mode being used
+	# Collect the run configuration into one log record; misconfigurations are still logged as separate warnings
+	config_lines = []
+
+	# Search mode being used
 	if args.use_serp:
 		if SERPER_API_KEY:
-			logger.info('🔍 Using SERP search (Serper API) instead of Google search')
+			config_lines.append('🔍 Using SERP search (Serper API) instead of Google search')
 		else:
 			logger.warning('⚠️ --use-serp flag provided but SERPER_API_KEY not set. Search will fail!')
 	else:
-		logger.info('🔍 Using default Google search')
+		config_lines.append('🔍 Using default Google search')
 
-	# Log browser mode being used
+	# Browser mode being used
 	if args.browser == 'anchor-browser':
 		if ANCHOR_BROWSER_API_KEY:
-			logger.info('🌐 Using Anchor Browser (remote browser service)')
+			config_lines.append('🌐 Using Anchor Browser (remote browser service)')
 		else:
 			logger.warning('⚠️ --browser anchor-browser provided but ANCHOR_BROWSER_API_KEY not set. Will use local browser!')
 	elif args.browser == 'brightdata':
 		if BRIGHTDATA_CDP_URL:
-			logger.info('🌐 Using Brightdata browser (remote browser service)')
+			config_lines.append('🌐 Using Brightdata browser (remote browser service)')
 		else:
 			logger.warning('⚠️ --browser brightdata provided but BRIGHTDATA_CDP_URL not set. Will use local browser!')
 	elif args.browser == 'browser-use':
 		logger.warning('🌐 Browser-use not implemented yet. Will use local browser!')
 	else:
-		logger.info('🌐 Using local browser')
+		config_lines.append('🌐 Using local browser')
 
-	# Log memory configuration
+	# Memory configuration
 	if args.enable_memory:
-		logger.info(f'🧠 Memory enabled: mem0 system with interval={args.memory_interval} steps')
+		config_lines.append(f'🧠 Memory enabled: mem0 system with interval={args.memory_interval} steps')
 	else:
-		logger.info('🧠 Memory disabled')
+		config_lines.append('🧠 Memory disabled')
 
-	# Log other agent configuration
-	logger.info(f'🎯 Max actions per step: {args.max_actions_per_step}')
-
-	if args.validate_output:
-		logger.info('✅ Output validation enabled')
-	else:
-		logger.info('✅ Output validation disabled')
+	# Other agent configuration
+	config_lines.append(f'🎯 Max actions per step: {args.max_actions_per_step}')
+	config_lines.append('✅ Output validation enabled' if args.validate_output else '✅ Output validation disabled')
 
 	if args.planner_model:
-		logger.info(f'🗺️ Planner enabled: {args.planner_model} (interval={args.planner_interval} steps)')
+		config_lines.append(f'🗺️ Planner enabled: {args.planner_model} (interval={args.planner_interval} steps)')
 	else:
-		logger.info('🗺️ Planner disabled')
+		config_lines.append('🗺️ Planner disabled')
+
+	logger.info('Run configuration:\n%s', '\n'.join(config_lines))
 	# -------------------------
 
 	# --- Get LLMs ---
@@ -3417,41 +4680,51 @@ if __name__ == '__main__':
 		convex_url = CONVEX_URL
 		secret_key = SECRET_KEY
 
+	# uvloop is optional: run the pipeline on its libuv event loop when it is installed
+	try:
+		import uvloop
+	except ImportError:
+		loop_factory = None
+	else:
+		loop_factory = uvloop.new_event_loop
+		logger.info('⚡ Using uvloop event loop')
+
 	try:
-		results = asyncio.run(
-			run_evaluation_pipeline(
-				tasks=tasks,
-				llm=llm,
-				run_id=run_id,
-				test_case=args.test_case,
-				user_message=args.user_message,
-				convex_url=convex_url,
-				secret_key=secret_key,
-				eval_model=eval_model,
-				auth_distribution=auth_distribution,
-				github_workflow_url=args.github_workflow_url,
-				max_parallel_runs=parallel_runs,
-				max_steps_per_task=args.max_steps,
-				start_index=start_index,
-				end_index=end_index,
-				headless=args.headless,
-				use_vision=not args.no_vision,
-				use_serp=args.use_serp,
-				browser=args.browser,
-				enable_memory=args.enable_memory,
-				memory_interval=args.memory_interval,
-				max_actions_per_step=args.max_actions_per_step,
-				validate_output=args.validate_output,
-				planner_llm=planner_llm,
-				planner_interval=args.planner_interval,
-				include_result=args.include_result,
-				laminar_eval_id=args.laminar_eval_id,
-				highlight_elements=args.highlight_elements,
-				use_mind2web_judge=args.use_mind2web_judge,
-				use_thinking=not args.no_thinking,
-				gmail_tokens_dict=gmail_tokens_dict,
+		with asyncio.Runner(loop_factory=loop_factory) as runner:
+			results = runner.run(
+				run_evaluation_pipeline(
+					tasks=tasks,
+					llm=llm,
+					run_id=run_id,
+					test_case=args.test_case,
+					user_message=args.user_message,
+					convex_url=convex_url,
+					secret_key=secret_key,
+					eval_model=eval_model,
+					auth_distribution=auth_distribution,
+					github_workflow_url=args.github_workflow_url,
+					max_parallel_runs=parallel_runs,
+					max_steps_per_task=args.max_steps,
+					start_index=start_index,
+					end_index=end_index,
+					headless=args.headless,
+					use_vision=not args.no_vision,
+					use_serp=args.use_serp,
+					browser=args.browser,
+					enable_memory=args.enable_memory,
+					memory_interval=args.memory_interval,
+					max_actions_per_step=args.max_actions_per_step,
+					validate_output=args.validate_output,
+					planner_llm=planner_llm,
+					planner_interval=args.planner_interval,
+					include_result=args.include_result,
+					laminar_eval_id=args.laminar_eval_id,
+					highlight_elements=args.highlight_elements,
+					use_mind2web_judge=args.use_mind2web_judge,
+					use_thinking=not args.no_thinking,
+					gmail_tokens_dict=gmail_tokens_dict,
+				)
 			)
-		)
 
 		logger.info('✅ EVALUATION COMPLETED SUCCESSFULLY')
 		log_system_resources('SUCCESS_COMPLETION')
@@ -0,0 +1,447 @@
+"""Tests for the concurrency helpers of the evaluation service (eval/service.py)."""
+
+import asyncio
+import json
+import os
+import time
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+# eval.service initializes Laminar at import time
+os.environ.setdefault('LMNR_PROJECT_API_KEY', 'test')
+
+from browser_use import BrowserProfile  # noqa: E402
+from eval.service import (  # noqa: E402
+	BrowserPool,
+	MicroBatcher,
+	ProgressReporter,
+	RateLimiter,
+	ResultUploader,
+	Stage,
+	Task,
+	TaskResult,
+	TrackedSemaphore,
+	determine_current_stage,
+)
+
+SECRET_KEY = 'test-secret'
+
+
+def _posted(httpserver: HTTPServer, path: str) -> list[dict]:
+	"""JSON bodies the Convex stub received on path, in arrival order"""
+	return [json.loads(request.get_data()) for request, _ in httpserver.log if request.path == path]
+
+
+class TestRateLimiter:
+	"""Test the AIMD concurrency window and the RPM window of the judge rate limiter."""
+
+	async def test_concurrency_limit_blocks_until_release(self):
+		limiter = RateLimiter(max_concurrency=1)
+		await limiter.acquire()
+
+		waiter = asyncio.create_task(limiter.acquire())
+		await asyncio.sleep(0.01)
+		assert not waiter.done()
+
+		limiter.release(latency=0.1)
+		await asyncio.wait_for(waiter, timeout=1)
+		limiter.release(latency=0.1)
+		await asyncio.wait_for(limiter.acquire(), timeout=1)
+
+	async def test_rate_limit_halves_and_latency_grows_window(self):
+		limiter = RateLimiter(max_concurrency=8, target_latency=1.0, alpha=1.0, beta=0.5)
+		await limiter.acquire()
+		limiter.release(rate_limited=True)
+		assert limiter.concurrency_limit == 4
+
+		await limiter.acquire()
+		limiter.release(latency=0.1)
+		assert limiter.concurrency_limit == 5
+
+		# Slow calls don't grow the window
+		for _ in range(20):
+			await limiter.acquire()
+			limiter.release(latency=10.0)
+		assert limiter.concurrency_limit == 5
+
+	async def test_cancelled_waiter_does_not_leak_a_slot(self):
+		limiter = RateLimiter(max_concurrency=1)
+		await limiter.acquire()
+
+		waiter = asyncio.create_task(limiter.acquire())
+		await asyncio.sleep(0.01)
+		waiter.cancel()
+		with pytest.raises(asyncio.CancelledError):
+			await waiter
+
+		limiter.release(latency=0.1)
+		await asyncio.wait_for(limiter.acquire(), timeout=1)
+
+	async def test_woken_then_cancelled_waiter_passes_the_slot_on(self):
+		limiter = RateLimiter(max_concurrency=1)
+		await limiter.acquire()
+
+		woken = asyncio.create_task(limiter.acquire())
+		queued = asyncio.create_task(limiter.acquire())
+		await asyncio.sleep(0.01)
+
+		# The release wakes the first waiter, which is cancelled before it gets to run
+		limiter.release(latency=0.1)
+		woken.cancel()
+		with pytest.raises(asyncio.CancelledError):
+			await woken
+
+		await asyncio.wait_for(queued, timeout=1)
+		limiter.release(latency=0.1)
+
+	async def test_rpm_window_delays_extra_requests(self):
+		limiter = RateLimiter(rpm=1, window=0.2)
+		loop = asyncio.get_running_loop()
+		await limiter.acquire()
+		limiter.release(latency=0.0)
+
+		start = loop.time()
+		await limiter.acquire()
+		limiter.release(latency=0.0)
+		assert loop.time() - start >= 0.15
+
+
+class _EchoBatcher(MicroBatcher):
+	"""Minimal MicroBatcher whose dispatch doubles its input after delay seconds"""
+
+	def __init__(self, delay: float = 0.0, **kwargs):
+		super().__init__(**kwargs)
+		self.delay = delay
+		self.started = 0
+		self.cancelled = 0
+
+	async def submit(self, value):
+		return await self._submit(value)
+
+	async def _dispatch(self, value):
+		self.started += 1
+		try:
+			await asyncio.sleep(self.delay)
+		except asyncio.CancelledError:
+			self.cancelled += 1
+			raise
+		return value * 2
+
+
+class TestMicroBatcher:
+	"""Test submission, cancellation and shutdown of the micro-batching worker."""
+
+	def test_dispatch_is_abstract(self):
+		with pytest.raises(TypeError):
+			MicroBatcher()  # type: ignore[abstract]
+
+	async def test_results_are_routed_to_their_callers(self):
+		batcher = _EchoBatcher(max_wait=0.01)
+		try:
+			assert await asyncio.gather(*[batcher.submit(i) for i in range(10)]) == [i * 2 for i in range(10)]
+		finally:
+			await batcher.close()
+
+	async def test_abandoned_call_cancels_its_dispatch(self):
+		batcher = _EchoBatcher(delay=10, max_wait=0.01)
+		try:
+			with pytest.raises(TimeoutError):
+				await asyncio.wait_for(batcher.submit(1), timeout=0.1)
+			await asyncio.sleep(0.01)
+			assert batcher.started == 1
+			assert batcher.cancelled == 1
+		finally:
+			await batcher.close()
+
+	async def test_close_cancels_in_flight_dispatches(self):
+		batcher = _EchoBatcher(delay=10, max_wait=0.01)
+		call = asyncio.create_task(batcher.submit(1))
+		await asyncio.sleep(0.05)
+		await batcher.close()
+		assert batcher.cancelled == 1
+		call.cancel()
+		with pytest.raises(asyncio.CancelledError):
+			await call
+
+
+class TestResultUploader:
+	"""Test the batched saveTaskResults path and its per-result fallbacks against a Convex stub."""
+
+	@pytest.fixture
+	def convex_url(self, httpserver: HTTPServer) -> str:
+		httpserver.expect_request('/api/saveTaskResult', method='POST').respond_with_json(
+			{'message': 'saved', 'resultId': 'result-1'}
+		)
+		return httpserver.url_for('').rstrip('/')
+
+	async def _submit_all(self, uploader: ResultUploader, convex_url: str, task_ids: list[str]) -> list[bool]:
+		return await asyncio.gather(
+			*[uploader.submit(convex_url, SECRET_KEY, {'taskId': task_id, 'runId': 'run-1'}) for task_id in task_ids]
+		)
+
+	async def test_batching_is_opt_in(self, httpserver: HTTPServer, convex_url: str):
+		httpserver.expect_request('/api/saveTaskResults', method='POST').respond_with_json({'saved': 3})
+		uploader = ResultUploader(flush_interval=0.05)
+		try:
+			assert await self._submit_all(uploader, convex_url, ['t0', 't1', 't2']) == [True, True, True]
+		finally:
+			await uploader.close()
+		assert _posted(httpserver, '/api/saveTaskResults') == []
+		assert sorted(body['taskId'] for body in _posted(httpserver, '/api/saveTaskResult')) == ['t0', 't1', 't2']
+
+	async def test_batch_saved_in_one_request(self, httpserver: HTTPServer, convex_url: str):
+		httpserver.expect_request('/api/saveTaskResults', method='POST').respond_with_json({'saved': 3})
+		uploader = ResultUploader(flush_interval=0.05, batch_saves=True)
+		try:
+			assert await self._submit_all(uploader, convex_url, ['t0', 't1', 't2']) == [True, True, True]
+		finally:
+			await uploader.close()
+		batches = _posted(httpserver, '/api/saveTaskResults')
+		assert [[result['taskId'] for result in batch['results']] for batch in batches] == [['t0', 't1', 't2']]
+		assert _posted(httpserver, '/api/saveTaskResult') == []
+
+	@pytest.mark.parametrize('status', [404, 501])
+	async def test_missing_endpoint_disables_batching(self, httpserver: HTTPServer, convex_url: str, status: int):
+		httpserver.expect_request('/api/saveTaskResults', method='POST').respond_with_data('Not Found', status=status)
+		uploader = ResultUploader(flush_interval=0.05, batch_saves=True)
+		try:
+			assert await self._submit_all(uploader, convex_url, ['t0', 't1']) == [True, True]
+			assert await self._submit_all(uploader, convex_url, ['t2', 't3']) == [True, True]
+		finally:
+			await uploader.close()
+		# Only the first round tried the batch endpoint, every result was saved one by one
+		assert len(_posted(httpserver, '/api/saveTaskResults')) == 1
+		assert sorted(body['taskId'] for body in _posted(httpserver, '/api/saveTaskResult')) == ['t0', 't1', 't2', 't3']
+
+	@pytest.mark.parametrize('status', [400, 500, 503])
+	async def test_failed_batch_falls_back_to_per_result_saves(self, httpserver: HTTPServer, convex_url: str, status: int):
+		httpserver.expect_request('/api/saveTaskResults', method='POST').respond_with_data('Server Error', status=status)
+		uploader = ResultUploader(flush_interval=0.05, batch_saves=True)
+		try:
+			assert await self._submit_all(uploader, convex_url, ['t0', 't1']) == [True, True]
+			assert await self._submit_all(uploader, convex_url, ['t2', 't3']) == [True, True]
+		finally:
+			await uploader.close()
+		# Other failures keep batching on for later results
+		assert len(_posted(httpserver, '/api/saveTaskResults')) == 2
+		assert sorted(body['taskId'] for body in _posted(httpserver, '/api/saveTaskResult')) == ['t0', 't1', 't2', 't3']
+
+	async def test_incomplete_results_skip_the_batch(self, httpserver: HTTPServer, convex_url: str):
+		httpserver.expect_request('/api/saveTaskResults', method='POST').respond_with_json({'saved': 2})
+		uploader = ResultUploader(flush_interval=0.05, batch_saves=True)
+		try:
+			results = await asyncio.gather(
+				uploader.submit(convex_url, SECRET_KEY, {'taskId': 't0', 'runId': 'run-1'}),
+				uploader.submit(convex_url, SECRET_KEY, {'taskId': 't1', 'runId': 'run-1'}),
+				uploader.submit(convex_url, SECRET_KEY, {'taskId': 't2', 'runId': None}),
+			)
+		finally:
+			await uploader.close()
+		# The result without a runId is rejected by the per-result validation without a request
+		assert results == [True, True, False]
+		batches = _posted(httpserver, '/api/saveTaskResults')
+		assert [[result['taskId'] for result in batch['results']] for batch in batches] == [['t0', 't1']]
+		assert _posted(httpserver, '/api/saveTaskResult') == []
+
+
+class TestProgressReporter:
+	"""Test coalescing and flushing of runner progress updates against a Convex stub."""
+
+	@pytest.fixture
+	def convex_url(self, httpserver: HTTPServer) -> str:
+		def slow_ok(request: Request) -> Response:
+			time.sleep(0.05)  # keeps a flush in flight long enough to submit during it
+			return Response('{}', status=200, content_type='application/json')
+
+		httpserver.expect_request('/api/saveRunnerProgress', method='POST').respond_with_handler(slow_ok)
+		return httpserver.url_for('').rstrip('/')
+
+	@staticmethod
+	def _sent(httpserver: HTTPServer) -> list[str]:
+		return [f'{body["taskId"]}:{body["status"]}' for body in _posted(httpserver, '/api/saveRunnerProgress')]
+
+	async def test_updates_within_interval_are_coalesced(self, httpserver: HTTPServer, convex_url: str):
+		reporter = ProgressReporter(flush_interval=0.05)
+		reporter.submit(convex_url, SECRET_KEY, {'taskId': 'a', 'status': 'active'})
+		reporter.submit(convex_url, SECRET_KEY, {'taskId': 'a', 'status': 'completed'})
+		reporter.submit(convex_url, SECRET_KEY, {'taskId': 'b', 'status': 'active'})
+		await reporter.close()
+		assert sorted(self._sent(httpserver)) == ['a:completed', 'b:active']
+
+	async def test_update_submitted_during_flush_is_sent(self, httpserver: HTTPServer, convex_url: str):
+		reporter = ProgressReporter(flush_interval=0.01)
+		reporter.submit(convex_url, SECRET_KEY, {'taskId': 'a', 'status': 'running'})
+		await asyncio.sleep(0.03)  # the first flush is now posting
+		reporter.submit(convex_url, SECRET_KEY, {'taskId': 'a', 'status': 'completed'})
+		# Sent by the flusher on its own, without close() picking it up
+		for _ in range(50):
+			if len(self._sent(httpserver)) == 2:
+				break
+			await asyncio.sleep(0.02)
+		assert self._sent(httpserver) == ['a:running', 'a:completed']
+		await reporter.close()
+
+	async def test_unencodable_update_does_not_stop_the_flusher(self, httpserver: HTTPServer, convex_url: str):
+		reporter = ProgressReporter(flush_interval=0.01)
+		reporter.submit(convex_url, SECRET_KEY, {'taskId': 'bad', 'status': object()})
+		reporter.submit(convex_url, SECRET_KEY, {'taskId': 'a', 'status': 'active'})
+		await asyncio.sleep(0.1)
+		reporter.submit(convex_url, SECRET_KEY, {'taskId': 'b', 'status': 'active'})
+		await reporter.close()
+		assert self._sent(httpserver) == ['a:active', 'b:active']
+
+
+class TestTrackedSemaphore:
+	"""Test the holder count of the task semaphore."""
+
+	async def test_counts_holders(self):
+		semaphore = TrackedSemaphore(2)
+		assert semaphore.available == 2
+		async with semaphore:
+			assert semaphore.in_flight == 1
+			async with semaphore:
+				assert semaphore.available == 0
+		assert semaphore.in_flight == 0
+
+	async def test_released_on_error(self):
+		semaphore = TrackedSemaphore(1)
+		with pytest.raises(RuntimeError):
+			async with semaphore:
+				raise RuntimeError('boom')
+		assert semaphore.available == 1
+		await asyncio.wait_for(semaphore.__aenter__(), timeout=1)
+		await semaphore.__aexit__(None, None, None)
+
+
+class TestStageBitmask:
+	"""Test the completed-stage bitmask of TaskResult."""
+
+	def _result(self) -> TaskResult:
+		return TaskResult('task-1', 'run-1', 'Do something', None, 10)
+
+	def test_completed_stages(self):
+		result = self._result()
+		result.stage_completed(Stage.EVALUATE)
+		result.stage_completed(Stage.SETUP_BROWSER)
+		assert result.has_stage(Stage.EVALUATE)
+		assert not result.has_stage(Stage.RUN_AGENT)
+		assert result.completed_stages == {Stage.SETUP_BROWSER, Stage.EVALUATE}
+		# Names are reported in pipeline order, not completion order
+		assert result.completed_stage_names() == ['setup_browser', 'evaluate']
+		assert determine_current_stage(result.completed_stages) == Stage.EVALUATE
+
+	def test_execution_data(self):
+		result = self._result()
+		result.stage_completed(Stage.SETUP_BROWSER)
+		assert not result.has_execution_data()
+		result.stage_completed(Stage.FORMAT_HISTORY, {'steps': 3})
+		assert result.has_execution_data()
+		assert result.stage_data[Stage.FORMAT_HISTORY] == {'steps': 3}
+
+	def test_default_stage(self):
+		assert determine_current_stage(set()) == Stage.SETUP_BROWSER
+
+	def test_minimal_payload(self):
+		payload = self._result().server_payload
+		assert payload['taskId'] == 'task-1'
+		assert payload['completed_stages'] == []
+		assert payload['has_errors'] is False
+
+
+class TestTaskFromRaw:
+	"""Test that Task.from_raw builds the same task as unpacking the dict into Task()."""
+
+	@pytest.mark.parametrize(
+		'data',
+		[
+			{'task_id': 't1', 'confirmed_task': 'Find the weather'},
+			{
+				'task_id': 't2',
+				'confirmed_task': 'Log in',
+				'website': 'http://localhost',
+				'login_cookie': 'session',
+				'auth_keys': ['google'],
+				'custom_field': 42,
+			},
+		],
+	)
+	def test_parity(self, data):
+		from_kwargs = Task(**data)
+		from_raw = Task.from_raw(data)
+		assert str(from_raw) == str(from_kwargs)
+		assert from_raw.additional_fields == from_kwargs.additional_fields
+		assert from_raw.needs_auth == from_kwargs.needs_auth
+		assert from_raw.is_login_task == from_kwargs.is_login_task
+
+	def test_additional_fields_as_attributes(self):
+		task = Task.from_raw({'task_id': 't1', 'confirmed_task': 'Do it', 'custom_field': 'value'})
+		assert task.custom_field == 'value'
+		with pytest.raises(AttributeError):
+			task.missing_field  # noqa: B018
+
+	@pytest.mark.parametrize('data', [{'task_id': '', 'confirmed_task': 'Do it'}, {'task_id': 't1'}])
+	def test_required_fields(self, data):
+		with pytest.raises(ValueError):
+			Task.from_raw(data)
+
+
+class TestBrowserPool:
+	"""Test the warm browser pool against a real headless browser."""
+
+	@pytest.fixture
+	async def pool(self):
+		pool = BrowserPool(max_idle=2)
+		yield pool
+		await pool.close()
+
+	@staticmethod
+	def _profile() -> BrowserProfile:
+		return BrowserProfile(headless=True, user_data_dir=None, keep_alive=True)
+
+	async def test_released_browser_is_reused_with_a_fresh_context(self, pool: BrowserPool, httpserver: HTTPServer):
+		httpserver.expect_request('/').respond_with_data(
+			'<html><head><title>Pool</title></head></html>',
+			content_type='text/html',
+			headers={'Set-Cookie': 'pooled=1; Path=/'},
+		)
+		first = await pool.acquire(self._profile())
+		assert pool.owns(first)
+		page = await first.get_current_page()
+		await page.goto(httpserver.url_for('/'))
+		assert await page.title() == 'Pool'
+		first_browser = first.browser
+		await pool.release(first)
+		assert not pool.owns(first)
+
+		second = await pool.acquire(self._profile())
+		try:
+			assert second.browser is first_browser
+			# The new context starts without the previous task's cookies
+			assert second.browser_context is not None
+			assert await second.browser_context.cookies() == []
+		finally:
+			await pool.release(second)
+
+	async def test_concurrent_first_launches_share_one_driver(self, pool: BrowserPool):
+		sessions = await asyncio.gather(*[pool.acquire(self._profile()) for _ in range(3)])
+		try:
+			browsers = [session.browser for session in sessions]
+			assert all(browser is not None for browser in browsers)
+			assert len({id(browser.browser_type) for browser in browsers if browser is not None}) == 1
+		finally:
+			await asyncio.gather(*[pool.release(session) for session in sessions])
+
+	async def test_close_shuts_down_idle_browsers(self):
+		pool = BrowserPool(max_idle=1)
+		session = await pool.acquire(self._profile())
+		browser = session.browser
+		assert browser is not None
+		await pool.release(session)
+		assert browser.is_connected()
+		await pool.close()
+		assert not browser.is_connected()
+
+	def test_disabled_without_idle_slots(self):
+		assert not BrowserPool(max_idle=0).enabled
@@ -1,16 +1,13 @@
 from flask import Flask, render_template, request, jsonify, Response
-from phi.agent import Agent as PhiAgent
-from phi.model.groq import Groq
-from phi.tools.duckduckgo import DuckDuckGo
-
-from browser_use import Agent as BrowserAgent
-from browser_use.llm import ChatGroq
 
 from dotenv import load_dotenv
+import functools
 import os
-import json
+import orjson
 from datetime import datetime
 import asyncio
+import threading
+from collections import deque
 
 # Load environment variables
 load_dotenv()
@@ -20,39 +17,88 @@ os.environ["GROQ_API_KEY"] = os.getenv("GROQ_API_KEY")
 
 app = Flask(__name__)
 
+# The agent SDKs are imported and instantiated on first use, so routes that don't need them stay cheap
+
 # Global LLM object
-llm = ChatGroq(
-    model='meta-llama/llama-4-maverick-17b-128e-instruct'
-)
+@functools.lru_cache(maxsize=1)
+def get_llm():
+    from browser_use.llm import ChatGroq
+
+    return ChatGroq(
+        model='meta-llama/llama-4-maverick-17b-128e-instruct'
+    )
 
 # Initialize the Web Agent (for ArangoDB trainer)
-web_agent = PhiAgent(
-    name="ArangoDB Trainer",
-    model=Groq(id="meta-llama/llama-4-scout-17b-16e-instruct"),
-    tools=[DuckDuckGo()],
-    instructions=[
-        "You are an experienced ArangoDB Trainer with attention to detail. "
-        "Train customers on how to use ArangoDB or similar graph database products.",
-        "If the user wants to use `arangosh`, explain the appropriate shell commands.",
-        "If the user prefers manual instructions (GUI or UI walkthrough), provide detailed step-by-step guidance for that as well.",
-        "Be interactive, ask follow-up questions if the user's goal is unclear.",
-        "Use markdown formatting to structure explanations, code blocks, and steps."
-    ],
-    show_tool_calls=True,
-    markdown=True,
-)
-
-# Chat history (in-memory)
-chat_history = []
+@functools.lru_cache(maxsize=1)
+def get_web_agent():
+    from phi.agent import Agent as PhiAgent
+    from phi.model.groq import Groq
+    from phi.tools.duckduckgo import DuckDuckGo
+
+    return PhiAgent(
+        name="ArangoDB Trainer",
+        model=Groq(id="meta-llama/llama-4-scout-17b-16e-instruct"),
+        tools=[DuckDuckGo()],
+        instructions=[
+            "You are an experienced ArangoDB Trainer with attention to detail. "
+            "Train customers on how to use ArangoDB or similar graph database products.",
+            "If the user wants to use `arangosh`, explain the appropriate shell commands.",
+            "If the user prefers manual instructions (GUI or UI walkthrough), provide detailed step-by-step guidance for that as well.",
+            "Be interactive, ask follow-up questions if the user's goal is unclear.",
+            "Use markdown formatting to structure explanations, code blocks, and steps."
+        ],
+        show_tool_calls=True,
+        markdown=True,
+    )
+
+# Chat history (in-memory), bounded so long-running sessions don't grow without limit.
+# deque.append is atomic; the lock keeps snapshots and clears consistent across request threads.
+chat_history = deque(maxlen=10000)
+_HIST_LOCK = threading.Lock()
+
+# One long-lived event loop for browser tasks, so requests don't each build and tear down a loop
+_LOOP = asyncio.new_event_loop()
+threading.Thread(target=_LOOP.run_forever, name='browser-agent-loop', daemon=True).start()
 
 # Helper to run async tasks from sync Flask routes
 def run_async_task(coro):
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
+    return asyncio.run_coroutine_threadsafe(coro, _LOOP).result()
+
+# Warm browser sessions shared by /api/create-collection requests. Agents are cheap and built per task,
+# but each session's browser stays up (keep_alive) and goes back to the pool for the next request.
+# Only touched from _LOOP, so no lock is needed.
+_BROWSER_POOL_SIZE = int(os.getenv('BROWSER_POOL_SIZE', '2'))
+_browser_sessions = asyncio.Queue()
+_browser_sessions_created = 0
+
+def new_browser_session():
+    from browser_use import BrowserProfile, BrowserSession
+
+    return BrowserSession(browser_profile=BrowserProfile(keep_alive=True))
+
+async def acquire_browser_session():
+    global _browser_sessions_created
+    if _browser_sessions.empty() and _browser_sessions_created < _BROWSER_POOL_SIZE:
+        _browser_sessions_created += 1
+        return new_browser_session()
+    return await _browser_sessions.get()
+
+async def release_browser_session(browser_session):
+    # Leave a single blank tab, so the next request doesn't start on the previous user's page
     try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
+        for page in browser_session.tabs[1:]:
+            await page.close()
+        if browser_session.tabs:
+            page = await browser_session.get_current_page()
+            await page.goto('about:blank')
+    except Exception:
+        # The browser is unusable: replace it with a fresh session so the pool keeps its size
+        try:
+            await browser_session.kill()
+        except Exception:
+            pass
+        browser_session = new_browser_session()
+    _browser_sessions.put_nowait(browser_session)
 
 @app.route('/')
 def index():
@@ -75,17 +121,18 @@ def chat():
         })
 
         # Agent response
-        response = web_agent.run(user_message)
+        response = get_web_agent().run(user_message)
+        ts = datetime.now().isoformat()
 
         chat_history.append({
             'type': 'agent',
             'message': response.content,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': ts
         })
 
         return jsonify({
             'response': response.content,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': ts
         })
 
     except Exception as e:
@@ -108,22 +155,23 @@ def chat_stream():
 
         def generate():
             try:
-                response_content = ""
-                for chunk in web_agent.run(user_message, stream=True):
+                parts = []
+                for chunk in get_web_agent().run(user_message, stream=True):
                     if chunk:
-                        response_content += str(chunk)
-                        yield f"data: {json.dumps({'chunk': str(chunk)})}\n\n"
+                        text = str(chunk)
+                        parts.append(text)
+                        yield b"data: " + orjson.dumps({'chunk': text}) + b"\n\n"
 
                 chat_history.append({
                     'type': 'agent',
-                    'message': response_content,
+                    'message': ''.join(parts),
                     'timestamp': datetime.now().isoformat()
                 })
 
-                yield f"data: {json.dumps({'done': True})}\n\n"
+                yield b"data: " + orjson.dumps({'done': True}) + b"\n\n"
 
             except Exception as e:
-                yield f"data: {json.dumps({'error': str(e)})}\n\n"
+                yield b"data: " + orjson.dumps({'error': str(e)}) + b"\n\n"
 
         return Response(generate(), mimetype='text/plain')
 
@@ -132,12 +180,14 @@ def chat_stream():
 
 @app.route('/api/history', methods=['GET'])
 def get_history():
-    return jsonify(chat_history)
+    with _HIST_LOCK:
+        history = list(chat_history)
+    return jsonify(history)
 
 @app.route('/api/clear', methods=['POST'])
 def clear_history():
-    global chat_history
-    chat_history = []
+    with _HIST_LOCK:
+        chat_history.clear()
     return jsonify({'message': 'Chat history cleared'})
 
 @app.route('/api/create-collection', methods=['POST'])
@@ -151,23 +201,30 @@ def create_collection():
 
         async def run_browser_task():
             try:
-                agent = BrowserAgent(task=task, llm=llm)
-                await agent.run()
+                from browser_use import Agent as BrowserAgent
+
+                browser_session = await acquire_browser_session()
+                try:
+                    agent = BrowserAgent(task=task, llm=get_llm(), browser_session=browser_session)
+                    await agent.run()
+                finally:
+                    await release_browser_session(browser_session)
                 return f"Task executed successfully: {task}"
             except Exception as e:
                 return f"Error executing task: {str(e)}"
 
         result = run_async_task(run_browser_task())
+        ts = datetime.now().isoformat()
 
         chat_history.append({
             'type': 'agent',
             'message': result,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': ts
         })
 
         return jsonify({
             'response': result,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': ts
         })
 
     except Exception as e: